@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+""" Benchmarks for loading, parsing, converting, and formatting units.
+
+Run from the repository root:
+
+    $ python -m benchmarks.benchmark
+    $ python -m benchmarks.benchmark --save baseline.json
+    $ python -m benchmarks.benchmark --compare baseline.json --tolerance 0.25
+
+Each benchmark runs a workload several times. Every sample times one pass over
+the workload and is divided by the number of operations, giving per-operation
+latency percentiles and throughput. When comparing against a baseline the script
+exits with status 1 if any median latency is slower than the tolerance allows.
+Baselines are only meaningful on the machine (and python version) they were saved on.
+"""
+
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from collections.abc import Callable
+from fractions import Fraction
+
+from unitconverter.converter import UnitConverter
+from unitconverter.formatting import QuantityFormatter, format_quantity
+from unitconverter.parsers.fileparser import FileParser
+from unitconverter.registry import Registry
+
+
+# Workloads
+SIMPLE_NAMES = ["metre", "second", "gram", "foot", "inch", "litre", "joule", "hour",
+                "kelvin", "newton", "pascal", "watt", "mile", "pound", "byte"]
+
+PREFIXED_NAMES = ["kilometre", "millisecond", "microgram", "km", "ms", "mus", "GHz",
+                  "MiB", "kilojoule", "nanometre", "megawatt", "centilitre"]
+
+COMPOSITE_NAMES = ["kg*m^2/s^3/A", "J/(kg*K)", "m/s^2", "N*m", "kW*h", "mi/h",
+                   "kg/m³", "W/(m^2*K)", "mol/(L*s)", "m^(1/2)*s^(-1/2)"]
+
+CONVERSIONS = [("1", "foot", "inch"), ("2.5", "kilometre", "mile"), ("10", "kg", "pound"),
+               ("3", "hour", "second"), ("1", "kW*h", "J"), ("60", "mi/h", "m/s"),
+               ("1", "kg*m^2/s^3/A", "volt")]
+
+TEMPERATURES = [("98.6", "fahrenheit", "celsius"), ("0", "celsius", "kelvin"),
+                ("300", "kelvin", "fahrenheit"), ("500", "rankine", "celsius")]
+
+QUANTITIES = [Fraction(1, 3), Fraction("149597870700"), Fraction("1e-30"),
+              Fraction(22, 7), Fraction("-273.15"), Fraction(10) ** 25 / 7]
+
+
+class Benchmark:
+    """ A named workload. setup() is called once and returns a function that
+        runs the workload once and returns the number of operations.
+    """
+
+    def __init__(self, name: str, setup: Callable[[], Callable[[], int]], samples: int) -> None:
+        self.name = name
+        self.setup = setup
+        self.samples = samples
+
+    def run(self, scale: float = 1) -> dict[str, float]:
+        """ Run the benchmark and return its statistics (latencies in microseconds). """
+        workload = self.setup()
+        workload()  # warm up
+
+        latencies = []
+        total_ops = 0
+        total_time = 0
+        for _ in range(max(1, int(self.samples * scale))):
+            start = time.perf_counter_ns()
+            ops = workload()
+            elapsed = time.perf_counter_ns() - start
+
+            latencies.append(elapsed / ops / 1000)
+            total_ops += ops
+            total_time += elapsed
+
+        latencies.sort()
+        return {
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "mean": statistics.fmean(latencies),
+            "ops_per_sec": total_ops / (total_time / 1e9),
+            "samples": len(latencies),
+        }
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """ Get a percentile of a sorted list using linear interpolation. """
+    position = (len(values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def repeat(function: Callable[[], None], count: int) -> Callable[[], int]:
+    """ Create a workload that calls function count times. """
+    def workload() -> int:
+        for _ in range(count):
+            function()
+        return count
+
+    return workload
+
+
+def each(function: Callable, items: list, count: int = 1) -> Callable[[], int]:
+    """ Create a workload that calls function with every item, count times. """
+    def workload() -> int:
+        for _ in range(count):
+            for item in items:
+                function(*item) if isinstance(item, tuple) else function(item)
+        return len(items) * count
+
+    return workload
+
+
+def setup_load_json() -> Callable[[], int]:
+    parser = FileParser()
+    return repeat(lambda: parser.load_units(Registry()), 1)
+
+
+def setup_cold_start(**kwargs) -> Callable[[], Callable[[], int]]:
+    def setup() -> Callable[[], int]:
+        UnitConverter(**kwargs)  # make sure the snapshot or index is built
+        return repeat(lambda: UnitConverter(**kwargs), 1)
+
+    return setup
+
+
+def setup_parse(names: list[str]) -> Callable[[], Callable[[], int]]:
+    def setup() -> Callable[[], int]:
+        parser = UnitConverter().parser
+        return each(parser.parse_unit, names, 10)
+
+    return setup
+
+
+def setup_convert(conversions: list[tuple], cache_size: int = 256,
+                  exact: bool = True) -> Callable[[], Callable[[], int]]:
+    def setup() -> Callable[[], int]:
+        converter = UnitConverter(cache_size=cache_size, exact=exact)
+        items = [(Fraction(quantity), source, target) for quantity, source, target in conversions]
+        return each(converter.convert, items, 10 if cache_size else 1)
+
+    return setup
+
+
+def setup_convert_auto() -> Callable[[], int]:
+    converter = UnitConverter()
+    items = [(Fraction(quantity), source, target)
+             for quantity, source, target in (("1200000", "byte", "B"), ("0.00042", "m", "m"),
+                                              ("2.5", "mile", "metre"), ("7e12", "J", "J"))]
+    return each(converter.convert_auto, items, 10)
+
+
+def setup_format(**kwargs) -> Callable[[], Callable[[], int]]:
+    def setup() -> Callable[[], int]:
+        return each(lambda quantity: format_quantity(quantity, **kwargs), QUANTITIES, 20)
+
+    return setup
+
+
+def setup_format_bulk(floats: bool = False, **kwargs) -> Callable[[], Callable[[], int]]:
+    def setup() -> Callable[[], int]:
+        formatter = QuantityFormatter(**kwargs)
+        quantities = QUANTITIES * 20
+        if floats:
+            quantities = [float(quantity) for quantity in quantities]
+
+        return lambda: len(formatter.format_many(quantities))
+
+    return setup
+
+
+def get_benchmarks() -> list[Benchmark]:
+    """ Get the list of benchmarks. """
+    return [
+        Benchmark("load_units_json", setup_load_json, 20),
+        Benchmark("cold_start_files", setup_cold_start(snapshot=False), 20),
+        Benchmark("cold_start_snapshot", setup_cold_start(), 20),
+        Benchmark("cold_start_lazy", setup_cold_start(lazy=True), 50),
+        Benchmark("parse_simple", setup_parse(SIMPLE_NAMES), 200),
+        Benchmark("parse_prefixed", setup_parse(PREFIXED_NAMES), 200),
+        Benchmark("parse_composite", setup_parse(COMPOSITE_NAMES), 100),
+        Benchmark("convert_cached", setup_convert(CONVERSIONS), 200),
+        Benchmark("convert_uncached", setup_convert(CONVERSIONS, cache_size=0), 100),
+        Benchmark("convert_float", setup_convert(CONVERSIONS, exact=False), 200),
+        Benchmark("convert_temperature", setup_convert(TEMPERATURES), 200),
+        Benchmark("convert_auto", setup_convert_auto, 200),
+        Benchmark("format_default", setup_format(), 200),
+        Benchmark("format_precision_2", setup_format(precision=2), 200),
+        Benchmark("format_precision_20", setup_format(precision=20), 200),
+        Benchmark("format_exponent", setup_format(exponent=True, precision=6), 200),
+        Benchmark("format_separators", setup_format(separators=True, precision=4), 200),
+        Benchmark("format_bulk_default", setup_format_bulk(), 200),
+        Benchmark("format_bulk_precision_2", setup_format_bulk(precision=2), 200),
+        Benchmark("format_bulk_float", setup_format_bulk(floats=True, precision=2), 200),
+    ]
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict],
+            tolerance: float) -> list[str]:
+    """ Compare median latencies against a baseline. Returns a list of regressions. """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        limit = baseline[name]["p50"] * (1 + tolerance)
+        if result["p50"] > limit:
+            ratio = result["p50"] / baseline[name]["p50"]
+            regressions.append(f"{name}: {result['p50']:.2f} µs vs {baseline[name]['p50']:.2f} µs"
+                               f" ({ratio:.2f}x)")
+
+    return regressions
+
+
+def print_results(results: dict[str, dict], baseline: dict[str, dict] | None = None) -> None:
+    """ Print a table of results. """
+    header = f"{'benchmark':<22} {'p50 µs':>10} {'p90 µs':>10} {'p99 µs':>10} {'ops/s':>12}"
+    if baseline:
+        header += f" {'vs base':>8}"
+
+    print(header)
+    print("-" * len(header))
+
+    for name, result in results.items():
+        line = (f"{name:<22} {result['p50']:>10.2f} {result['p90']:>10.2f}"
+                f" {result['p99']:>10.2f} {result['ops_per_sec']:>12,.0f}")
+
+        if baseline and name in baseline:
+            line += f" {result['p50'] / baseline[name]['p50']:>7.2f}x"
+
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="run the unit converter benchmarks")
+
+    parser.add_argument(
+        "-k", "--filter",
+        help="only run benchmarks whose name contains this string",
+        default="")
+
+    parser.add_argument(
+        "--scale",
+        help="multiply the number of samples (default: %(default)s)",
+        default=1.0,
+        type=float)
+
+    parser.add_argument(
+        "--save",
+        help="save the results to a json file",
+        metavar="filename")
+
+    parser.add_argument(
+        "--compare",
+        help="compare the results with a baseline json file",
+        metavar="filename")
+
+    parser.add_argument(
+        "--tolerance",
+        help="allowed median slowdown before failing (default: %(default)s)",
+        default=0.25,
+        type=float)
+
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fp:
+            baseline = json.load(fp)["results"]
+
+    results = {}
+    for benchmark in get_benchmarks():
+        if args.filter in benchmark.name:
+            results[benchmark.name] = benchmark.run(args.scale)
+
+    print_results(results, baseline)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fp:
+            json.dump({"python": sys.version.split()[0], "results": results}, fp, indent=2)
+
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.tolerance:.0%} tolerance:",
+                  file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
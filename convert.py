@@ -10,7 +10,7 @@ import traceback
 
 from unitconverter.converter import UnitConverter
 from unitconverter.exceptions import ConverterError
-from unitconverter.formatting import format_quantity
+from unitconverter.formatting import QuantityFormatter
 
 
 def print_error(msg: str, status: int = 1) -> None:
@@ -25,22 +25,8 @@ def print_traceback(error: Exception) -> None:
     sys.exit(1)
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser()
-
-    parser.add_argument(
-        "quantity",
-        help="quantity or value (an integer, float, or fraction)")
-
-    parser.add_argument(
-        "source",
-        help="the source unit")
-
-    parser.add_argument(
-        "target",
-        help="one or more target units",
-        nargs="+")
-
+def add_format_arguments(parser: argparse.ArgumentParser) -> None:
+    """ Add the result formatting and debug arguments to a parser. """
     subgroup = parser.add_mutually_exclusive_group()
 
     subgroup.add_argument(
@@ -75,7 +61,12 @@ def main() -> None:
         help=argparse.SUPPRESS,
         action="store_true")
 
-    args = parser.parse_args()
+
+def parse_format_arguments(parser: argparse.ArgumentParser,
+                           argv: list[str]
+                           ) -> argparse.Namespace:
+    """ Parse arguments, check the precision, and configure the debug logger. """
+    args = parser.parse_args(argv)
 
     # Check precision
     if args.precision is not None and (args.precision < 0 or args.precision > 30):
@@ -85,6 +76,331 @@ def main() -> None:
     logging.getLogger().setLevel(logging.DEBUG if args.debug else logging.INFO)
     logging.basicConfig(format="debug: %(message)s")
 
+    return args
+
+
+def get_formatter(args: argparse.Namespace) -> QuantityFormatter:
+    """ Get a quantity formatter using the formatting arguments. """
+    return QuantityFormatter(precision=args.precision, normalize=args.normalize,
+                             fraction=args.fraction, exponent=args.exponent,
+                             separators=args.separators)
+
+
+def stream(argv: list[str]) -> None:
+    """ Convert columns of a csv, tsv, or jsonl file one row at a time. """
+    from unitconverter.streaming import FORMATS, guess_format, parse_column, stream_convert
+
+    parser = argparse.ArgumentParser(
+        prog="convert.py stream",
+        description="convert columns of a csv, tsv, or jsonl file")
+
+    parser.add_argument(
+        "input",
+        help="input file (default: stdin)",
+        nargs="?",
+        default="-")
+
+    parser.add_argument(
+        "-c", "--column",
+        help="column name, source unit, and target unit (i.e temp_f:degF:degC)",
+        metavar="name:source:target",
+        action="append",
+        required=True)
+
+    parser.add_argument(
+        "-o", "--output",
+        help="output file (default: stdout)",
+        default="-")
+
+    parser.add_argument(
+        "--format",
+        help="file format (default: guessed from the input file name, otherwise csv)",
+        choices=FORMATS)
+
+    add_format_arguments(parser)
+    args = parse_format_arguments(parser, argv)
+
+    fmt = args.format or guess_format(args.input)
+    input_fp = output_fp = None
+
+    try:
+        columns = [parse_column(column) for column in args.column]
+        input_fp = (sys.stdin if args.input == "-"
+                    else open(args.input, "r", encoding="utf-8", newline=""))
+        output_fp = (sys.stdout if args.output == "-"
+                     else open(args.output, "w", encoding="utf-8", newline=""))
+
+        stream_convert(input_fp, output_fp, UnitConverter(), columns, fmt, get_formatter(args))
+
+    except (ConverterError, OSError, TypeError, ValueError) as error:
+        print_traceback(error) if args.debug else print_error(f"Error: {error}")
+
+    finally:
+        for fp in (input_fp, output_fp):
+            if fp not in (None, sys.stdin, sys.stdout):
+                fp.close()
+
+
+def bulk(argv: list[str]) -> None:
+    """ Convert columns of a large file using multiple worker processes. """
+    from unitconverter.bulk import bulk_convert
+    from unitconverter.streaming import FORMATS, guess_format, parse_column
+
+    parser = argparse.ArgumentParser(
+        prog="convert.py bulk",
+        description="convert columns of a large csv, tsv, or jsonl file using multiple"
+                    " processes (rows must not contain quoted line breaks)")
+
+    parser.add_argument(
+        "input",
+        help="input file")
+
+    parser.add_argument(
+        "-c", "--column",
+        help="column name, source unit, and target unit (i.e temp_f:degF:degC)",
+        metavar="name:source:target",
+        action="append",
+        required=True)
+
+    parser.add_argument(
+        "-o", "--output",
+        help="output file (default: stdout)",
+        default="-")
+
+    parser.add_argument(
+        "--format",
+        help="file format (default: guessed from the input file name, otherwise csv)",
+        choices=FORMATS)
+
+    parser.add_argument(
+        "-w", "--workers",
+        help="number of worker processes (default: number of cpus)",
+        type=int)
+
+    parser.add_argument(
+        "--chunk-size",
+        help="approximate number of bytes per chunk (default: %(default)s)",
+        metavar="bytes",
+        default=1 << 20,
+        type=int)
+
+    add_format_arguments(parser)
+    args = parse_format_arguments(parser, argv)
+
+    output_fp = None
+
+    try:
+        columns = [parse_column(column) for column in args.column]
+        output_fp = (sys.stdout if args.output == "-"
+                     else open(args.output, "w", encoding="utf-8", newline=""))
+
+        bulk_convert(args.input, output_fp, columns, args.format or guess_format(args.input),
+                     get_formatter(args), args.workers, args.chunk_size)
+
+    except (ConverterError, OSError, TypeError, ValueError) as error:
+        print_traceback(error) if args.debug else print_error(f"Error: {error}")
+
+    finally:
+        if output_fp not in (None, sys.stdout):
+            output_fp.close()
+
+
+def serve(argv: list[str]) -> None:
+    """ Run the conversion server. """
+    from unitconverter.server import serve as serve_forever
+
+    parser = argparse.ArgumentParser(
+        prog="convert.py serve",
+        description="answer conversion requests over http/json (POST /convert and /batch)")
+
+    parser.add_argument(
+        "--host",
+        help="host address (default: %(default)s)",
+        default="127.0.0.1")
+
+    parser.add_argument(
+        "--port",
+        help="port number (default: %(default)s)",
+        default=8000,
+        type=int)
+
+    parser.add_argument(
+        "--debug",
+        help=argparse.SUPPRESS,
+        action="store_true")
+
+    args = parser.parse_args(argv)
+
+    logging.getLogger().setLevel(logging.DEBUG if args.debug else logging.INFO)
+    logging.basicConfig(format="debug: %(message)s")
+
+    try:
+        serve_forever(args.host, args.port)
+    except (ConverterError, OSError) as error:
+        print_traceback(error) if args.debug else print_error(f"Error: {error}")
+
+
+def matrix(argv: list[str]) -> None:
+    """ Export the conversion factors between every pair of units with the same dimension. """
+    from unitconverter.matrix import FORMATS, build_matrix
+
+    parser = argparse.ArgumentParser(
+        prog="convert.py matrix",
+        description="export all-pairs conversion factors (1 row unit = ? column units)")
+
+    parser.add_argument(
+        "dimension",
+        help="dimension name (i.e length or length/time) or a unit with that dimension",
+        nargs="?")
+
+    parser.add_argument(
+        "-u", "--unit",
+        help="only include these units (can be used more than once)",
+        action="append")
+
+    parser.add_argument(
+        "-o", "--output",
+        help="output file (default: stdout)",
+        default="-")
+
+    parser.add_argument(
+        "--format",
+        help="file format (default: guessed from the output file name, otherwise csv)",
+        choices=FORMATS)
+
+    parser.add_argument(
+        "--float",
+        help="use 64-bit floats instead of exact factors",
+        action="store_true")
+
+    add_format_arguments(parser)
+    args = parse_format_arguments(parser, argv)
+
+    if args.dimension is None and not args.unit:
+        parser.error("a dimension or at least one unit is required")
+
+    fmt = args.format or args.output.rpartition(".")[2].lower()
+    if fmt not in FORMATS:
+        fmt = "csv"
+
+    output_fp = None
+
+    try:
+        factors = build_matrix(UnitConverter().registry, args.dimension, args.unit)
+
+        if fmt == "npy":
+            output_fp = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+            factors.save_npy(output_fp)
+        else:
+            output_fp = (sys.stdout if args.output == "-"
+                         else open(args.output, "w", encoding="utf-8", newline=""))
+            writer = factors.write_json if fmt == "json" else factors.write_csv
+            writer(output_fp, not args.float, get_formatter(args))
+
+    except (ConverterError, OSError, TypeError, ValueError) as error:
+        print_traceback(error) if args.debug else print_error(f"Error: {error}")
+
+    finally:
+        if output_fp not in (None, sys.stdout, sys.stdout.buffer):
+            output_fp.close()
+
+
+def scan(argv: list[str]) -> None:
+    """ Find quantities with units in a text file and write them as json lines. """
+    import json
+
+    from unitconverter.scanner import QuantityScanner
+
+    parser = argparse.ArgumentParser(
+        prog="convert.py scan",
+        description="find quantities with units (i.e 3.5 kg) in a text file")
+
+    parser.add_argument(
+        "input",
+        help="input file (default: stdin)",
+        nargs="?",
+        default="-")
+
+    parser.add_argument(
+        "-t", "--target",
+        help="convert quantities with the same dimension to this unit (can be used more than once)",
+        action="append")
+
+    parser.add_argument(
+        "-x", "--exclude",
+        help="don't match this unit name (can be used more than once)",
+        action="append",
+        default=[])
+
+    parser.add_argument(
+        "-o", "--output",
+        help="output file (default: stdout)",
+        default="-")
+
+    add_format_arguments(parser)
+    args = parse_format_arguments(parser, argv)
+
+    input_fp = output_fp = None
+
+    try:
+        scanner = QuantityScanner(UnitConverter(), args.exclude)
+        formatter = get_formatter(args)
+
+        input_fp = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+        output_fp = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+        for match in scanner.scan_file(input_fp, args.target):
+            row = {"start": match.start, "end": match.end, "text": match.text,
+                   "quantity": formatter(match.quantity), "unit": match.unit.name}
+            if match.target is not None:
+                row["result"] = formatter(match.result)
+                row["target"] = match.target
+
+            output_fp.write(json.dumps(row, ensure_ascii=False))
+            output_fp.write("\n")
+
+    except (ConverterError, OSError, TypeError, ValueError) as error:
+        print_traceback(error) if args.debug else print_error(f"Error: {error}")
+
+    finally:
+        for fp in (input_fp, output_fp):
+            if fp not in (None, sys.stdin, sys.stdout):
+                fp.close()
+
+
+# Additional commands (i.e "convert.py stream --help")
+commands = {
+    "stream": stream,
+    "bulk": bulk,
+    "serve": serve,
+    "matrix": matrix,
+    "scan": scan,
+}
+
+
+def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] in commands:
+        return commands[sys.argv[1]](sys.argv[2:])
+
+    parser = argparse.ArgumentParser(
+        epilog=f"additional commands: {", ".join(commands)} (use COMMAND --help for usage)")
+
+    parser.add_argument(
+        "quantity",
+        help="quantity or value (an integer, float, or fraction)")
+
+    parser.add_argument(
+        "source",
+        help="the source unit")
+
+    parser.add_argument(
+        "target",
+        help="one or more target units",
+        nargs="+")
+
+    add_format_arguments(parser)
+    args = parse_format_arguments(parser, sys.argv[1:])
+
     results = []
 
     # Perform conversions
@@ -97,9 +413,9 @@ def main() -> None:
 
     # Display results
     padding = " " * len(f"{args.quantity} {args.source}")
+    formatter = get_formatter(args)
     for index, (result, target) in enumerate(results):
-        result = format_quantity(result, args.precision, args.normalize, args.fraction,
-                                 args.exponent, args.separators)
+        result = formatter(result)
         if index == 0:
             print(f"{args.quantity} {args.source} = {result} {target}")
         else:
@@ -0,0 +1,43 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import unittest
+
+from benchmarks.benchmark import Benchmark, compare, each, percentile
+
+
+class TestBenchmark(unittest.TestCase):
+    """ Tests for the benchmark helpers. """
+
+    def test_percentile(self) -> None:
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 3)
+        self.assertEqual(percentile(values, 100), 5)
+        self.assertEqual(percentile(values, 90), 4.6)
+        self.assertEqual(percentile([2.0], 99), 2)
+
+    def test_run(self) -> None:
+        calls = []
+        benchmark = Benchmark("test", lambda: each(calls.append, [1, 2, 3], 2), 5)
+        result = benchmark.run()
+
+        # One warm up pass and five samples
+        self.assertEqual(len(calls), 36)
+        self.assertEqual(result["samples"], 5)
+        self.assertLessEqual(result["p50"], result["p99"])
+        self.assertGreater(result["ops_per_sec"], 0)
+
+    def test_compare(self) -> None:
+        baseline = {"a": {"p50": 1.0}, "b": {"p50": 2.0}}
+        results = {"a": {"p50": 1.2}, "b": {"p50": 3.0}, "c": {"p50": 9.0}}
+
+        regressions = compare(results, baseline, 0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("b:"))
+        self.assertEqual(compare(results, baseline, 0.5), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import io
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from unitconverter.bulk import bulk_convert, split_file
+from unitconverter.converter import UnitConverter
+from unitconverter.exceptions import ConverterError
+from unitconverter.streaming import stream_convert
+
+
+class TestBulk(unittest.TestCase):
+    """ Tests for the bulk conversion functions. """
+
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.filename = Path(self.tempdir.name) / "input.csv"
+
+        lines = ["id,temp,length"]
+        lines += [f"{index},{index * 3 - 40},{index / 4}" for index in range(200)]
+        self.filename.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def test_split_file(self) -> None:
+        data = self.filename.read_bytes()
+        ranges = list(split_file(self.filename, 0, 64))
+
+        # Ranges should cover the entire file and end on line boundaries
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(data))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[end - 1:end], b"\n")
+
+    def test_bulk_convert(self) -> None:
+        columns = [("temp", "degF", "degC"), ("length", "ft", "m")]
+
+        expected = io.StringIO()
+        with open(self.filename, encoding="utf-8", newline="") as fp:
+            stream_convert(fp, expected, UnitConverter(), columns)
+
+        # Results should be written in the original order
+        output = io.StringIO()
+        count = bulk_convert(self.filename, output, columns, workers=2, chunk_size=256,
+                             max_pending=2)
+        self.assertEqual(count, 200)
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+        # Missing columns and invalid units should raise a ConverterError
+        with self.assertRaises(ConverterError):
+            bulk_convert(self.filename, io.StringIO(), [("missing", "m", "ft")], workers=1)
+
+        with self.assertRaises(ConverterError):
+            bulk_convert(self.filename, io.StringIO(), [("temp", "m", "s")], workers=1)
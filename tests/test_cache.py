@@ -0,0 +1,166 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import json
+import shutil
+import tempfile
+import unittest
+
+from fractions import Fraction
+from pathlib import Path
+
+from unitconverter.cache import LRUCache, ResultCache
+from unitconverter.converter import UnitConverter
+from unitconverter.models.unit import Unit
+from unitconverter.parsers.fileparser import FileParser
+from unitconverter.registry import Registry
+
+
+class TestLRUCache(unittest.TestCase):
+    """ Tests for the LRUCache class. """
+
+    def test__init__(self) -> None:
+        # Invalid sizes should raise a TypeError or ValueError
+        for invalid_type in (None, "1", 1.5, True):
+            with self.assertRaises(TypeError):
+                LRUCache(invalid_type)  # type: ignore
+
+        with self.assertRaises(ValueError):
+            LRUCache(-1)
+
+    def test_get(self) -> None:
+        cache = LRUCache(2)
+        cache.put("a", 1)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_put(self) -> None:
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        # The least recently used item should be evicted
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+        # Shrinking the cache should evict the oldest items
+        cache.maxsize = 1
+        self.assertEqual(len(cache), 1)
+        self.assertIn("c", cache)
+
+        # A cache size of zero disables caching
+        cache.maxsize = 0
+        cache.put("d", 4)
+        self.assertEqual(len(cache), 0)
+
+
+class TestResultCache(unittest.TestCase):
+    """ Tests for the ResultCache class. """
+
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.filename = Path(self.tempdir.name) / "results.sqlite"
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def test_get(self) -> None:
+        cache = ResultCache(self.filename, digest="a", commit_interval=2)
+        self.assertIsNone(cache.get("foot", "inch", Fraction(1)))
+
+        cache.put("foot", "inch", Fraction(1), Fraction(12))
+        cache.put("metre", "foot", Fraction(1, 3), Fraction(1250, 1143))
+        self.assertEqual(cache.get("foot", "inch", Fraction(1)), 12)
+        self.assertEqual(cache.get("metre", "foot", Fraction(1, 3)), Fraction(1250, 1143))
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (2, 1, 2))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+        cache.close()
+
+        # Results are kept until the unit files change
+        cache = ResultCache(self.filename, digest="a")
+        self.assertEqual(cache.get("foot", "inch", Fraction(1)), 12)
+        cache.close()
+
+        cache = ResultCache(self.filename, digest="b")
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get("foot", "inch", Fraction(1)))
+        cache.close()
+
+    def test_evict(self) -> None:
+        cache = ResultCache(self.filename, maxsize=2, digest="a")
+        for quantity in range(3):
+            cache.put("foot", "inch", Fraction(quantity), Fraction(quantity * 12))
+
+        # Use the oldest result so the second result is evicted
+        cache.get("foot", "inch", Fraction(0))
+        cache.commit()
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(cache.get("foot", "inch", Fraction(0)), 0)
+        self.assertIsNone(cache.get("foot", "inch", Fraction(1)))
+        self.assertEqual(cache.get("foot", "inch", Fraction(2)), 24)
+        cache.close()
+
+        with self.assertRaises(ValueError):
+            ResultCache(self.filename, maxsize=0, digest="a")
+
+    def test_converter(self) -> None:
+        cache = ResultCache(self.filename, digest="a")
+        converter = UnitConverter(result_cache=cache)
+
+        # Results are keyed by the unit names as given, so hits don't parse the units
+        self.assertEqual(converter.convert("1", "ft", "in"), 12)
+        self.assertEqual(converter.convert("1", "ft", "in"), 12)
+        self.assertEqual(converter.convert("1", "foot", "inch"), 12)
+        self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (1, 2))
+        self.assertEqual(len(converter.cache), 2)
+
+        # Float conversions aren't cached
+        self.assertEqual(converter.convert(1.0, "foot", "inch", exact=False), 12.0)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+        # Unit instances aren't cached, even if they use a cached name
+        foot = Unit("foot", "0.5", "length")
+        self.assertEqual(converter.convert(1, foot, "inch"), Fraction(2500, 127))
+        self.assertEqual(converter.convert(1, "foot", "inch"), 12)
+        cache.close()
+
+        with self.assertRaises(TypeError):
+            UnitConverter(result_cache="results.sqlite")  # type: ignore
+
+    def test_reload(self) -> None:
+        path = Path(self.tempdir.name) / "data"
+        shutil.copytree("data", path, ignore=shutil.ignore_patterns("*.snapshot", "*.sqlite"))
+
+        file_parser = FileParser(path)
+        registry = Registry()
+        file_parser.load_units(registry)
+
+        cache = ResultCache(self.filename, digest=file_parser.get_hash())
+        converter = UnitConverter(registry=registry, result_cache=cache)
+        converter.file_parser = file_parser
+        self.assertEqual(converter.convert(1, "foot", "metre"), Fraction("0.3048"))
+
+        # Reloading unchanged files keeps the results
+        self.assertEqual(converter.reload(), [])
+        self.assertEqual(len(cache), 1)
+
+        data = json.loads((path / "length.json").read_text(encoding="utf-8"))
+        data["foot"]["factor"] = 0.5
+        (path / "length.json").write_text(json.dumps(data), encoding="utf-8")
+
+        self.assertEqual(converter.reload(), ["length.json"])
+        self.assertEqual(converter.convert(1, "foot", "metre"), Fraction(1, 2))
+        self.assertEqual(cache.digest, file_parser.get_hash())
+        cache.close()
@@ -2,8 +2,11 @@
 # https://www.github.com/emetophobe/unitconverter
 
 
+import pickle
 import unittest
 
+from fractions import Fraction
+
 from unitconverter.models.dimension import Dimension
 
 
@@ -20,6 +23,30 @@ class TestDimension(unittest.TestCase):
         self.assertEqual(dimensionless, {})
         self.assertEqual(dimensionless.name, "")
 
+        # Equal dimensions should be the same object
+        self.assertIs(Dimension("time"), Dimension({"time": 1}))
+        self.assertIs(Dimension({"length": 1, "time": 0}), Dimension("length"))
+        self.assertIs(Dimension(Dimension("time")), Dimension("time"))
+        self.assertIs(Dimension({"length": Fraction(2, 2)}), Dimension("length"))
+
+    def test__hash__(self) -> None:
+        speed = Dimension({"length": 1, "time": -1})
+        self.assertEqual(hash(speed), hash(Dimension({"time": -1, "length": 1})))
+        self.assertEqual({speed: "speed"}[Dimension("length") / Dimension("time")], "speed")
+
+        # Dimensions are immutable
+        with self.assertRaises(TypeError):
+            speed["length"] = 2  # type: ignore
+
+        # Pickled dimensions should be interned
+        self.assertIs(pickle.loads(pickle.dumps(speed)), speed)
+
+    def test_name(self) -> None:
+        # Names use the base dimension order
+        force = Dimension({"time": -2, "mass": 1, "length": 1})
+        self.assertEqual(force.name, "length*mass/time^2")
+        self.assertEqual(list(force), ["length", "mass", "time"])
+
     def test__mul__(self) -> None:
         area = Dimension("length") * Dimension("length")
         self.assertEqual(area, {"length": 2})
@@ -46,3 +73,35 @@ class TestDimension(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             volume ** 0  # type: ignore
+
+        self.assertIs(volume ** Fraction(1, 3), Dimension("length"))
+        self.assertEqual((volume ** Fraction(1, 2)).name, "length^(3/2)")
+
+        with self.assertRaises(TypeError):
+            volume ** 2.0  # type: ignore
+
+    def test_mapping(self) -> None:
+        force = Dimension({"time": -2, "mass": 1, "length": 1})
+        self.assertEqual(len(force), 3)
+        self.assertEqual(force["time"], -2)
+        self.assertIn("mass", force)
+        self.assertNotIn("temperature", force)
+        self.assertEqual(list(force.items()), [("length", 1), ("mass", 1), ("time", -2)])
+        self.assertEqual(list(force.keys()), ["length", "mass", "time"])
+        self.assertEqual(list(force.values()), [1, 1, -2])
+        self.assertEqual(dict(force), {"length": 1, "mass": 1, "time": -2})
+
+        with self.assertRaises(KeyError):
+            force["temperature"]
+
+    def test_operator_cache(self) -> None:
+        # Results are cached on the interned operands, so repeated operations agree
+        length, time = Dimension("length"), Dimension("time")
+        for _ in range(2):
+            self.assertIs(length * time, Dimension({"length": 1, "time": 1}))
+            self.assertIs(length / time, Dimension({"length": 1, "time": -1}))
+            self.assertIs(length ** Fraction(2), Dimension({"length": 2}))
+            self.assertIs(length ** -1, Dimension({"length": -1}))
+
+        with self.assertRaises(TypeError):
+            length * {"time": 1}  # type: ignore
@@ -2,8 +2,17 @@
 # https://www.github.com/emetophobe/unitconverter
 
 
+import json
+import os
+import shutil
+import tempfile
 import unittest
 
+from fractions import Fraction
+from pathlib import Path
+
+from unitconverter.converter import UnitConverter
+from unitconverter.exceptions import ConverterError
 from unitconverter.parsers.fileparser import FileParser
 from unitconverter.registry import Registry
 
@@ -16,3 +25,110 @@ class TestFileParser(unittest.TestCase):
         self.assertEqual(len(registry.units), 0, "Registry should be empty")
         FileParser().load_units(registry)
         self.assertGreater(len(registry.units), 0, "Registry should have units")
+
+    def test_load_index(self):
+        parser = FileParser()
+        index = parser.build_index()
+        self.assertIn("metre", index["length.json"]["names"])
+        self.assertEqual(index["length.json"]["dimension"], {"length": 1})
+
+        # Prefixed names are resolved from the base unit names
+        self.assertNotIn("kilometre", index["length.json"]["names"])
+        self.assertIn("psi", index["aliases.json"]["names"])
+        self.assertEqual(index["aliases.json"]["dimensions"]["mph"], {"length": 1, "time": -1})
+
+        registry = Registry()
+        parser.load_index(registry, index)
+        self.assertEqual(len(registry.units), 0, "Units should be loaded on demand")
+
+        # Using a unit should only load the file that defines it
+        self.assertEqual(registry.get_unit("km").name, "kilometre")
+        self.assertIn("mile", registry.units)
+        self.assertNotIn("second", registry.units)
+        self.assertIn("second", registry.pending)
+
+        # Composite aliases should load the files they depend on
+        self.assertEqual(registry.get_unit("psi").name, "pound-force/inch^2")
+        self.assertIn("newton", registry.units)
+
+        # Listing the units of a dimension only loads the files with that dimension
+        self.assertIn("hour", {unit.name for unit in registry.get_units("time")})
+        self.assertIn("mile/hour", {unit.name for unit in registry.get_units("length/time")})
+        self.assertIn("kelvin", registry.pending)
+        self.assertNotIn("kelvin", registry.units)
+        self.assertIsNotNone(registry.find_dimension("temperature"))
+        self.assertIn("kelvin", registry.pending)
+
+        # Every unit with the dimension is the same as an eagerly loaded registry
+        eager = Registry()
+        parser.load_units(eager)
+        self.assertEqual({unit.name for unit in registry.get_units("length/time")},
+                         {unit.name for unit in eager.get_units("length/time")})
+
+    def test_reload(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = Path(tempdir) / "data"
+            shutil.copytree("data", path, ignore=shutil.ignore_patterns("*.snapshot"))
+
+            parser = FileParser(path)
+            registry = Registry()
+            parser.load_units(registry)
+            second = registry.get_unit("second")
+            metre = registry.get_unit("metre")
+            mph = registry.get_unit("mph")
+
+            # Nothing changed, touching a file doesn't reload it
+            self.assertEqual(parser.reload(registry), [])
+            os.utime(path / "time.json", ns=(0, 0))
+            self.assertEqual(parser.reload(registry), [])
+
+            # Rename a unit
+            data = json.loads((path / "time.json").read_text(encoding="utf-8"))
+            data["hour"]["symbols"] = ["h", "hr"]
+            data["fortnight"] = {"factor": 1209600}
+            (path / "time.json").write_text(json.dumps(data), encoding="utf-8")
+
+            self.assertEqual(parser.reload(registry), ["time.json"])
+            self.assertIsNone(registry.find_unit("hrs"))
+            self.assertEqual(registry.get_unit("fortnight").factor, 1209600)
+            self.assertEqual(registry.get_unit("kilosecond").factor, 1000)
+
+            # Units from other files and unchanged aliases are the same instances
+            self.assertIsNot(registry.get_unit("second"), second)
+            self.assertIs(registry.get_unit("metre"), metre)
+            self.assertIs(registry.get_unit("mph"), mph)
+
+            # Duplicate names leave the registry unchanged
+            data["parsec"] = {"factor": 1}
+            (path / "time.json").write_text(json.dumps(data), encoding="utf-8")
+
+            with self.assertRaises(ConverterError):
+                parser.reload(registry)
+
+            self.assertEqual(registry.get_unit("parsec").dimension.name, "length")
+            self.assertIsNotNone(registry.find_unit("fortnight"))
+
+            # Removed files remove their units
+            (path / "time.json").unlink()
+            (path / "aliases.json").write_text('{"kpm": "kilometre/mile"}', encoding="utf-8")
+            self.assertEqual(parser.reload(registry), ["aliases.json", "time.json"])
+            self.assertIsNone(registry.find_unit("fortnight"))
+            self.assertIsNone(registry.find_unit("mph"))
+
+    def test_reload_lazy(self):
+        converter = UnitConverter(lazy=True)
+        self.assertEqual(converter.convert(1, "mph", "km/h"), Fraction("1.609344"))
+
+        # Lazily loaded files (including the aliases) are tracked like eager ones
+        self.assertEqual(converter.reload(), [])
+        self.assertEqual(len(converter.cache), 1)
+
+    def test_reload_converter(self):
+        converter = UnitConverter()
+        self.assertEqual(converter.convert(1, "foot", "inch"), 12)
+
+        # The first reload of a snapshot loads every file
+        self.assertIn("length.json", converter.reload())
+        self.assertEqual(len(converter.cache), 0)
+        self.assertEqual(converter.reload(), [])
+        self.assertEqual(converter.convert(1, "foot", "inch"), 12)
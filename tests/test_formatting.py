@@ -2,12 +2,14 @@
 # https://www.github.com/emetophobe/unitconverter
 
 
+import io
 import unittest
 
 from fractions import Fraction
 
-from unitconverter.formatting import (format_name, format_display_name,
-                                      format_exponent, format_quantity)
+from unitconverter.formatting import (QuantityFormatter, format_name, format_display_name,
+                                      format_exponent, format_quantities, format_quantity,
+                                      write_quantities)
 
 
 class TestFormatting(unittest.TestCase):
@@ -23,6 +25,67 @@ class TestFormatting(unittest.TestCase):
         quantity = Fraction(1234567)
         self.assertEqual(format_quantity(quantity, separators=True), "1,234,567")
 
+    def test_quantity_formatter(self) -> None:
+        quantities = [Fraction(1, 3), Fraction(-1, 1000), Fraction(5, 2), Fraction(-5, 2),
+                      Fraction(1234567, 8), Fraction("1e-30"), Fraction(10) ** 25 / 7, 42]
+
+        # The output should be identical to format_quantity
+        for precision in (None, 0, 2, 6, 10, 30):
+            for option in ("normalize", "fraction", "exponent", "separators", None):
+                options = {option: True} if option else {}
+                expected = [format_quantity(quantity, precision, **options)
+                            for quantity in quantities]
+
+                formatter = QuantityFormatter(precision, **options)
+                self.assertEqual(formatter.format_many(quantities), expected)
+                self.assertEqual(format_quantities(quantities, precision=precision, **options),
+                                 expected)
+
+        with self.assertRaises(ValueError):
+            QuantityFormatter(-1)
+
+    def test_format_floats(self) -> None:
+        # Floats are rounded the same as fractions (2.675 is slightly less than 2.675)
+        formatter = QuantityFormatter(2)
+        self.assertEqual(formatter.format_many([2.675, 0.125, -0.001, 1e-30, 2.6749]),
+                         ["2.68", "0.13", "-0.00", "0.00", "2.67"])
+
+        # Including large values (which aren't formatted from their binary expansion),
+        # whole numbers, and negative zero
+        quantities = [2.675, -2.675, 0.5, 2.5, 1.005, 0.015, 123456.785, 1e15, 1.25e-7, 0.1,
+                      2178896510171335.2, 5.27401990262979e+29, 800435.0, -0.0, 0.0, -1e-30]
+        for precision in (None, 0, 1, 2, 3, 8):
+            for option in ("normalize", "exponent", "separators", None):
+                options = {option: True} if option else {}
+                expected = [format_quantity(Fraction(repr(quantity)), precision, **options)
+                            for quantity in quantities]
+                formatter = QuantityFormatter(precision, **options)
+                self.assertEqual(formatter.format_many(quantities), expected)
+
+        self.assertEqual(QuantityFormatter().format_many([0.1, 1500.0]), ["0.1", "1500"])
+        self.assertEqual(QuantityFormatter(2)(2178896510171335.2), "2178896510171335.20")
+        self.assertEqual(QuantityFormatter(2, normalize=True)(-0.0), "0")
+        self.assertEqual(QuantityFormatter(2).format_many([float("inf"), float("nan")]),
+                         ["inf", "nan"])
+        self.assertEqual(QuantityFormatter(2, separators=True)(1234567.891), "1,234,567.89")
+        self.assertEqual(QuantityFormatter(2, normalize=True)(1.5), "1.5")
+        self.assertEqual(QuantityFormatter(2, exponent=True)(1234.5678), "1.23457e+3")
+
+    def test_write_quantities(self) -> None:
+        quantities = [Fraction(index, 3) for index in range(10)]
+
+        output = io.StringIO()
+        self.assertEqual(write_quantities(quantities, output, chunk_size=3, precision=1), 10)
+        self.assertEqual(output.getvalue(),
+                         "".join(f"{format_quantity(quantity, 1)}\n" for quantity in quantities))
+
+        output = io.StringIO()
+        self.assertEqual(write_quantities([], output), 0)
+        self.assertEqual(output.getvalue(), "")
+
+        with self.assertRaises(ValueError):
+            write_quantities(quantities, output, chunk_size=0)
+
     def test_format_name(self) -> None:
         units = [("metre", 1), ("second", -1)]
         self.assertEqual(format_name(units), "metre*second^-1")
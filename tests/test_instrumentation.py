@@ -0,0 +1,71 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import unittest
+
+from fractions import Fraction
+
+from unitconverter import instrumentation
+from unitconverter.converter import UnitConverter
+from unitconverter.formatting import format_quantity
+
+
+class TestInstrumentation(unittest.TestCase):
+    """ Tests for the instrumentation module. """
+
+    def setUp(self) -> None:
+        self.converter = UnitConverter(cache_size=0)
+        instrumentation.reset()
+
+    def tearDown(self) -> None:
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled(self) -> None:
+        self.converter.convert(1, "kg*m/s^2", "newton")
+        format_quantity(Fraction(1, 3))
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    def test_snapshot(self) -> None:
+        instrumentation.enable()
+        self.converter.convert(1, "kg*m/s^2", "newton")
+        format_quantity(Fraction(1, 3), precision=2)
+
+        stats = instrumentation.snapshot()
+        for stage in ("convert.plan", "convert.apply", "format", "parse.tokenize",
+                      "parse.syntax", "parse.fold"):
+            self.assertEqual(stats[stage]["count"], 1, stage)
+            self.assertLessEqual(stats[stage]["max_ns"], stats[stage]["total_ns"])
+
+        # Both units are looked up, but only the composite unit is tokenized
+        self.assertEqual(stats["parse.lookup"]["count"], 2)
+
+        # Disabling keeps the statistics
+        instrumentation.disable()
+        format_quantity(Fraction(1, 3))
+        self.assertEqual(instrumentation.snapshot()["format"]["count"], 1)
+
+    def test_hooks(self) -> None:
+        stages = []
+
+        def hook(stage: str, elapsed: int) -> None:
+            stages.append(stage)
+            self.assertGreaterEqual(elapsed, 0)
+
+        with self.assertRaises(TypeError):
+            instrumentation.add_hook(None)  # type: ignore
+
+        instrumentation.add_hook(hook)
+        instrumentation.enable()
+        try:
+            format_quantity(Fraction(1))
+        finally:
+            instrumentation.remove_hook(hook)
+
+        format_quantity(Fraction(1))
+        self.assertEqual(stages, ["format"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import io
+import json
+import unittest
+
+from fractions import Fraction
+
+from unitconverter.converter import UnitConverter
+from unitconverter.exceptions import ConverterError
+from unitconverter.matrix import build_matrices, build_matrix
+from unitconverter.models.dimension import Dimension
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestMatrix(unittest.TestCase):
+    """ Tests for the factor matrix functions. """
+
+    def setUp(self) -> None:
+        self.converter = UnitConverter()
+        self.registry = self.converter.registry
+
+    def test_build_matrices(self) -> None:
+        matrices = build_matrices(self.registry)
+        length = matrices[Dimension("length")]
+        self.assertIn("metre", length.names)
+        self.assertIn("foot", length.names)
+
+        # Each unit is only listed once
+        self.assertNotIn("m", length.names)
+        self.assertEqual(len(set(length.names)), len(length))
+
+        # Temperature units with an offset aren't linear
+        temperature = matrices[Dimension("temperature")]
+        self.assertEqual(temperature.names, ["kelvin", "rankine"])
+
+    def test_build_matrix(self) -> None:
+        matrix = build_matrix(self.registry, units=["foot", "inch", "yard"])
+        self.assertEqual(matrix.to_list(), [[1, 12, Fraction(1, 3)],
+                                            [Fraction(1, 12), 1, Fraction(1, 36)],
+                                            [3, 36, 1]])
+
+        # Every factor should match a regular conversion
+        matrix = build_matrix(self.registry, "time")
+        rows = matrix.to_list()
+        for i, source in enumerate(matrix.names):
+            for j, target in enumerate(matrix.names):
+                self.assertEqual(rows[i][j], self.converter.convert(1, source, target))
+
+        # Dimensions can also be found using a unit name
+        self.assertEqual(build_matrix(self.registry, "hour").names, matrix.names)
+
+        with self.assertRaises(ConverterError):
+            build_matrix(self.registry, units=["foot", "second"])
+        with self.assertRaises(ConverterError):
+            build_matrix(self.registry, units=["celsius", "kelvin"])
+        with self.assertRaises(ConverterError):
+            build_matrix(self.registry, "length", units=["second"])
+
+    def test_export(self) -> None:
+        matrix = build_matrix(self.registry, units=["foot", "inch"])
+
+        output = io.StringIO()
+        matrix.write_csv(output)
+        self.assertEqual(output.getvalue(), ",foot,inch\nfoot,1,12\n"
+                                            "inch,0.08333333333333333333333333333,1\n")
+
+        output = io.StringIO()
+        matrix.write_json(output, exact=False)
+        data = json.loads(output.getvalue())
+        self.assertEqual(data["units"], ["foot", "inch"])
+        self.assertAlmostEqual(data["factors"][0][1], 12)
+
+    @unittest.skipUnless(numpy, "requires numpy")
+    def test_to_array(self) -> None:
+        matrix = build_matrix(self.registry, units=["foot", "inch", "yard"])
+        self.assertTrue(numpy.allclose(matrix.to_array(), [[1, 12, 1 / 3], [1 / 12, 1, 1 / 36],
+                                                           [3, 36, 1]], rtol=1e-15))
+        self.assertEqual(matrix.to_array(exact=True).tolist(), matrix.to_list())
+
+        output = io.BytesIO()
+        matrix.save_npy(output)
+        output.seek(0)
+        self.assertEqual(numpy.load(output).tolist(), matrix.to_array().tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
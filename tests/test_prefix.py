@@ -4,7 +4,10 @@
 
 import unittest
 
-from unitconverter.models.prefix import metric_prefixes, binary_prefixes, get_prefixes
+from fractions import Fraction
+
+from unitconverter.models.prefix import (PrefixTrie, binary_prefixes, get_prefixes, get_scale,
+                                         metric_prefixes)
 
 
 class TestPrefix(unittest.TestCase):
@@ -18,3 +21,47 @@ class TestPrefix(unittest.TestCase):
         self.assertEqual(get_prefixes("metric"), metric_prefixes)
         self.assertEqual(get_prefixes("binary"), binary_prefixes)
         self.assertEqual(get_prefixes(None), [])
+
+    def test_prefix_scale(self) -> None:
+        # Invalid prefix options should raise a TypeError
+        with self.assertRaises(TypeError):
+            get_scale("invalid option")
+
+        metric = get_scale("metric")
+        self.assertIs(get_scale("metric"), metric)
+        self.assertNotIn("centi", [str(prefix) for prefix in metric.prefixes])
+        self.assertEqual(metric.factors, sorted(metric.factors))
+
+        self.assertEqual(metric.select(Fraction(1200000)).name, "mega")
+        self.assertEqual(metric.select(Fraction(-1000)).name, "kilo")
+        self.assertIsNone(metric.select(Fraction(999)))
+        self.assertIsNone(metric.select(0))
+        self.assertEqual(metric.select(0.00042).name, "micro")
+
+        # Magnitudes outside the scale use the first or last prefix
+        self.assertEqual(metric.select(Fraction(1, 10 ** 40)).name, "quecto")
+        self.assertEqual(metric.select(1e40).name, "quetta")
+
+        binary = get_scale("binary")
+        self.assertEqual(binary.select(1023), None)
+        self.assertEqual(binary.select(2 ** 30).name, "gibi")
+
+        # Only prefixes supported by the unit are used
+        self.assertEqual([str(prefix) for prefix in get_scale("metric", "binary").prefixes],
+                         ["None", "kilo", "mega", "giga", "tera", "peta", "exa", "zetta",
+                          "yotta"])
+        self.assertEqual(len(get_scale("binary", "metric")), 1)
+
+    def test_prefix_trie(self) -> None:
+        trie = PrefixTrie()
+        trie.add("m", "milli")
+        trie.add("mu", "micro")
+        trie.add("da", "deca")
+        trie.add("d", "deci")
+
+        # Matches should be sorted from longest to shortest
+        self.assertEqual(trie.matches("mum"), [(2, ["micro"]), (1, ["milli"])])
+        self.assertEqual(trie.matches("dam"), [(2, ["deca"]), (1, ["deci"])])
+        self.assertEqual(trie.matches("m"), [(1, ["milli"])])
+        self.assertEqual(trie.matches("km"), [])
+        self.assertEqual(trie.matches(""), [])
@@ -4,7 +4,9 @@
 
 import unittest
 
-from unitconverter.exceptions import DuplicateUnitError, InvalidUnitError
+from unitconverter.exceptions import ConverterError, DuplicateUnitError, InvalidUnitError
+from unitconverter.models.dimension import Dimension
+from unitconverter.models.unit import Unit
 from unitconverter.registry import Registry
 
 from tests import metre, second
@@ -59,3 +61,156 @@ class TestRegistry(unittest.TestCase):
         unit1 = self.registry.get_unit("centimetres")
         unit2 = self.registry.get_unit("cm")
         self.assertEqual(unit1, unit2)
+
+    def test_add_loader(self) -> None:
+        calls = []
+
+        def loader() -> None:
+            calls.append(True)
+            self.registry.add_unit(second)
+
+        self.registry.add_loader(["second", "s", "seconds"], loader)
+        self.assertNotIn("second", self.registry.units)
+
+        # Invalid loaders should raise a TypeError
+        with self.assertRaises(TypeError):
+            self.registry.add_loader(["minute"], None)  # type: ignore
+
+        # Duplicate names should raise a DuplicateUnitError
+        with self.assertRaises(DuplicateUnitError):
+            self.registry.add_loader(["s"], loader)
+        with self.assertRaises(DuplicateUnitError):
+            self.registry.add_loader(["metre"], loader)
+
+        # The loader should only be called once
+        self.assertEqual(self.registry.get_unit("s"), second)
+        self.assertEqual(self.registry.get_unit("seconds"), second)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.registry.pending, {})
+
+    def test_failed_loader(self) -> None:
+        calls = []
+
+        def loader() -> None:
+            calls.append(True)
+            self.registry.add_unit(second)
+            raise ConverterError("Invalid json syntax in time.json")
+
+        self.registry.add_loader(["second", "s", "seconds", "minute"], loader)
+
+        # The names stay pending and every lookup raises the loader's error
+        for _ in range(2):
+            with self.assertRaises(ConverterError) as context:
+                self.registry.get_unit("minute")
+            self.assertNotIsInstance(context.exception, InvalidUnitError)
+
+        self.assertEqual(len(calls), 2)
+        self.assertIn("second", self.registry.pending)
+        self.assertNotIn("second", self.registry.units)
+        self.assertNotIn("s", self.registry.prefixable)
+
+    def test_find_unit(self) -> None:
+        self.assertIsNone(self.registry.find_unit("invalid unit"))
+        self.assertEqual(self.registry.find_unit("m"), metre)
+
+    def test_suggest(self) -> None:
+        self.registry.add_unit(second)
+
+        self.assertEqual(self.registry.suggest("metr")[0], "metre")
+        self.assertEqual(self.registry.suggest("secnds")[0], "seconds")
+
+        # Misspelled prefixes and misspelled names with a prefix
+        self.assertEqual(self.registry.suggest("milimetre")[0], "millimetre")
+        self.assertEqual(self.registry.suggest("kilosecnd")[0], "kilosecond")
+        self.assertEqual(self.registry.suggest("kilomter")[0], "kilometre")
+        self.assertEqual(self.registry.suggest("xyzzy"), [])
+        self.assertEqual(self.registry.suggest(None), [])  # type: ignore
+
+        # Suggestions are attached to the error
+        with self.assertRaises(InvalidUnitError) as context:
+            self.registry.get_unit("metr")
+
+        self.assertEqual(context.exception.suggestions[0], "metre")
+        self.assertIn("did you mean 'metre'", str(context.exception))
+
+        # The index is rebuilt when units are added
+        self.registry.add_alias(metre, "meter")
+        self.assertEqual(self.registry.suggest("meterr")[0], "meter")
+
+    def test_get_units(self) -> None:
+        self.registry.add_unit(second)
+        self.registry.add_alias(metre, "new alias")
+
+        # Each unit is only listed once
+        self.assertEqual(self.registry.get_units(Dimension("length")), [metre])
+        self.assertEqual(self.registry.get_units("time"), [second])
+        self.assertEqual(self.registry.get_units("mass"), [])
+        self.assertIs(self.registry.find_dimension("length"), Dimension("length"))
+        self.assertIsNone(self.registry.find_dimension("length/time"))
+
+        with self.assertRaises(TypeError):
+            self.registry.get_units(None)  # type: ignore
+
+        # Pending units are loaded first
+        self.registry.add_loader(["minute"], lambda: self.registry.add_alias(second, "minute"))
+        self.assertEqual(self.registry.get_units("time"), [second])
+        self.assertEqual(self.registry.pending, {})
+
+        # The index follows copies and clear
+        self.assertEqual(self.registry.copy(["second", "s", "seconds", "minute"]).get_units("time"),
+                         [])
+        self.registry.clear()
+        self.assertEqual(self.registry.dimensions, {})
+
+    def test_prefixed_units(self) -> None:
+        # Prefixed units are only created when they're first used
+        self.assertNotIn("kilometre", self.registry.units)
+        self.assertEqual(self.registry.prefixed, {})
+
+        unit = self.registry.get_unit("kilometres")
+        self.assertEqual(unit.name, "kilometre")
+        self.assertEqual(unit.factor, 1000)
+        self.assertEqual(unit.symbols, ["km"])
+
+        # All names of the prefixed unit share one instance
+        self.assertIs(self.registry.get_unit("km"), unit)
+        self.assertIs(self.registry.get_unit("kilometre"), unit)
+        self.assertIs(self.registry.get_unit("mum"), self.registry.get_unit("micrometre"))
+
+        # Prefix names only apply to unit names, and prefix symbols only apply to symbols
+        self.assertIsNone(self.registry.find_unit("kmetre"))
+        self.assertIsNone(self.registry.find_unit("kilom"))
+
+        # Binary prefixes only apply to binary units
+        self.assertIsNone(self.registry.find_unit("kibimetre"))
+
+        # Registered names take precedence over prefixed names
+        self.registry.add_alias(metre, "dam")
+        self.assertIs(self.registry.get_unit("dam"), metre)
+
+    def test_swap(self) -> None:
+        widget = Unit("widget", 1, "length", prefixes="metric")
+        replacement = Unit("widget", 2, "length", prefixes="metric")
+
+        staging = Registry([replacement])
+        self.registry.add_unit(second)
+
+        # Swap in the other registry while a lookup is loading a pending unit
+        def loader() -> None:
+            self.registry.add_unit(widget)
+            self.registry.swap(staging)
+
+        self.registry.add_loader(["widget"], loader, Dimension("length"))
+
+        # The lookup only uses the tables it started with
+        self.assertEqual(self.registry.get_unit("kilowidget").factor, 1000)
+
+        # Every table was replaced at once
+        self.assertEqual(self.registry.get_unit("kilowidget").factor, 2000)
+        self.assertIs(self.registry.get_unit("widget"), replacement)
+        self.assertIsNone(self.registry.find_unit("second"))
+        self.assertEqual(self.registry.get_units("length"), [replacement])
+
+        # Clearing the registry doesn't clear the tables of the swapped registry
+        self.registry.clear()
+        self.assertIs(staging.get_unit("widget"), replacement)
@@ -0,0 +1,79 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import io
+import unittest
+
+from fractions import Fraction
+
+from unitconverter.converter import UnitConverter
+from unitconverter.scanner import QuantityScanner
+
+
+TEXT = ("The box weighs 3.5 kg and ships at 70 °F. Each panel is 12 ft² "
+        "and the truck drives 60 mi/h, about 5 kilometers or 1,200 m away. "
+        "Gravity is 9.8 m/s^2, version 2.5 isn't a quantity, and neither is x2kg.")
+
+
+class TestScanner(unittest.TestCase):
+    """ Tests for the quantity scanner. """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.converter = UnitConverter()
+        cls.scanner = QuantityScanner(cls.converter)
+
+    def test_scan(self) -> None:
+        matches = list(self.scanner.scan(TEXT))
+        self.assertEqual([match.text for match in matches],
+                         ["3.5 kg", "70 °F", "12 ft²", "60 mi/h", "5 kilometers",
+                          "1,200 m", "9.8 m/s^2"])
+
+        for match in matches:
+            self.assertEqual(TEXT[match.start:match.end], match.text)
+
+        kilograms = matches[0]
+        self.assertEqual(kilograms.quantity, Fraction("3.5"))
+        self.assertEqual(kilograms.unit.name, "kilogram")
+        self.assertIsNone(kilograms.target)
+        self.assertIsNone(kilograms.result)
+
+        self.assertEqual(matches[5].quantity, 1200)
+        self.assertEqual(matches[4].unit.name, "kilometre")
+
+    def test_targets(self) -> None:
+        matches = list(self.scanner.scan("Weighs 3.5 kg, rated for 212 °F and 5 s",
+                                         ["lb", "degC"]))
+        self.assertEqual(len(matches), 3)
+
+        pounds, celsius, seconds = matches
+        self.assertEqual(pounds.target, "lb")
+        self.assertEqual(pounds.result, self.converter.convert(Fraction("3.5"), "kg", "lb"))
+        self.assertEqual(celsius.target, "degC")
+        self.assertEqual(celsius.result, 100)
+
+        # Dimensions without a target aren't converted
+        self.assertIsNone(seconds.target)
+        self.assertIsNone(seconds.result)
+
+    def test_exclude(self) -> None:
+        scanner = QuantityScanner(self.converter, exclude=["in"])
+        texts = [match.text for match in scanner.scan("Fits in 3 in of space, 4 m wide")]
+        self.assertEqual(texts, ["4 m"])
+
+    def test_scan_file(self) -> None:
+        text = TEXT * 50
+        expected = [(match.span, match.text) for match in self.scanner.scan(text)]
+
+        for chunk_size in (1, 7, 64, 1 << 16):
+            with self.subTest(chunk_size=chunk_size):
+                matches = self.scanner.scan_file(io.StringIO(text), chunk_size=chunk_size)
+                self.assertEqual([(match.span, match.text) for match in matches], expected)
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(TypeError):
+            QuantityScanner(None)
+
+        with self.assertRaises(ValueError):
+            list(self.scanner.scan_file(io.StringIO(TEXT), chunk_size=0))
@@ -0,0 +1,162 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import asyncio
+import io
+import json
+import unittest
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+
+from unitconverter.converter import UnitConverter
+from unitconverter.server import ConversionServer
+
+
+class TestConversionServer(unittest.IsolatedAsyncioTestCase):
+    """ Tests for the ConversionServer class. """
+
+    async def asyncSetUp(self) -> None:
+        self.server = ConversionServer(UnitConverter(), port=0, batch_threshold=2)
+        await self.server.start()
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+
+    async def asyncTearDown(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.server.close()
+
+    def send(self, method: str, path: str, data: object = None) -> None:
+        body = b"" if data is None else json.dumps(data).encode("utf-8")
+        self.writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+                          f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+
+    async def receive(self) -> tuple[int, object]:
+        status = int((await self.reader.readline()).split()[1])
+        headers = {}
+        while (line := await self.reader.readline()) != b"\r\n":
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.lower()] = value.strip()
+
+        body = await self.reader.readexactly(int(headers["content-length"]))
+        return status, json.loads(body)
+
+    async def test_convert(self) -> None:
+        self.send("POST", "/convert", {"quantity": "1", "source": "foot", "target": "inch"})
+        self.assertEqual(await self.receive(), (200, {"quantity": "1", "source": "foot",
+                                                      "target": "inch", "result": "12"}))
+
+        # Float results are returned as numbers
+        self.send("POST", "/convert", {"quantity": 1, "source": "km", "target": "m",
+                                       "exact": False})
+        status, data = await self.receive()
+        self.assertEqual(data["result"], 1000.0)
+
+        # Invalid units should return an error
+        self.send("POST", "/convert", {"quantity": 1, "source": "metre", "target": "second"})
+        status, data = await self.receive()
+        self.assertEqual(status, 400)
+        self.assertIn("error", data)
+
+        # Exact must be a boolean
+        self.send("POST", "/convert", {"quantity": "1", "source": "km", "target": "m",
+                                       "exact": "false"})
+        self.assertEqual((await self.receive())[0], 400)
+
+        # Results that aren't finite aren't valid json numbers
+        self.send("POST", "/convert", {"quantity": "inf", "source": "km", "target": "m",
+                                       "exact": False})
+        self.assertEqual((await self.receive())[0], 400)
+
+        # Invalid exponents are bad requests
+        self.send("POST", "/convert", {"quantity": "1", "source": "ft^(1/2)", "target": "m"})
+        self.assertEqual((await self.receive())[0], 400)
+
+    async def test_pipelining(self) -> None:
+        # Pipelined requests on a kept-alive connection are answered in order
+        for target in ("inch", "yard", "bogus", "mile"):
+            self.send("POST", "/convert", {"quantity": "5280", "source": "ft", "target": target})
+
+        results = [await self.receive() for _ in range(4)]
+        self.assertEqual([status for status, _ in results], [200, 200, 400, 200])
+        self.assertEqual(results[0][1]["result"], "63360")
+        self.assertEqual(results[1][1]["result"], "1760")
+        self.assertEqual(results[3][1]["result"], "1")
+
+    async def test_batch(self) -> None:
+        conversions = [{"quantity": "0", "source": "degC", "target": "degF"},
+                       {"quantity": "1", "source": "metre", "target": "second"},
+                       {"quantity": "2", "source": "hour", "target": "minute"}]
+
+        # Run inline and in the executor
+        for batch in (conversions[:2], conversions):
+            self.send("POST", "/batch", {"conversions": batch})
+            status, data = await self.receive()
+            self.assertEqual(status, 200)
+            self.assertEqual(data["results"][0]["result"], "32")
+            self.assertIn("error", data["results"][1])
+
+        self.assertEqual(data["results"][2]["result"], "120")
+
+    async def test_errors(self) -> None:
+        self.send("GET", "/health")
+        self.assertEqual(await self.receive(), (200, {"status": "ok"}))
+
+        self.send("GET", "/convert")
+        self.assertEqual((await self.receive())[0], 405)
+
+        self.send("POST", "/undefined", {})
+        self.assertEqual((await self.receive())[0], 404)
+
+        self.writer.write(b"POST /convert HTTP/1.1\r\nContent-Length: 3\r\n\r\n{{{")
+        self.assertEqual((await self.receive())[0], 400)
+
+    async def test_recursion(self) -> None:
+        # Deeply nested json is a bad request
+        body = b"[" * 100_000
+        self.writer.write(b"POST /convert HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body)
+                          + body)
+        self.assertEqual((await self.receive())[0], 400)
+
+        # So are deeply nested units
+        unit = "(" * 5000 + "m" + ")" * 5000
+        self.send("POST", "/convert", {"quantity": "1", "source": unit, "target": "km"})
+        self.assertEqual((await self.receive())[0], 400)
+
+        self.send("POST", "/batch", {"conversions": [
+            {"quantity": "1", "source": unit, "target": "km"},
+            {"quantity": "1", "source": "km", "target": "m"}]})
+        status, data = await self.receive()
+        self.assertEqual(status, 200)
+        self.assertIn("error", data["results"][0])
+        self.assertEqual(data["results"][1]["result"], "1000")
+
+    async def test_invalid_json(self) -> None:
+        # Results that aren't finite are errors in a batch
+        self.send("POST", "/batch", {"conversions": [
+            {"quantity": "nan", "source": "km", "target": "m", "exact": False},
+            {"quantity": "1", "source": "km", "target": "m", "exact": False}]})
+        status, data = await self.receive()
+        self.assertEqual(status, 200)
+        self.assertIn("error", data["results"][0])
+        self.assertEqual(data["results"][1]["result"], 1000)
+
+        # Responses that can't be encoded as standard json are bad requests
+        buffer = io.BytesIO()
+        self.server._write_response(buffer, HTTPStatus.OK, {"result": float("nan")}, True)
+        head, _, body = buffer.getvalue().partition(b"\r\n\r\n")
+        self.assertTrue(head.startswith(b"HTTP/1.1 400"))
+        self.assertIn("error", json.loads(body))
+
+    def test_executor(self) -> None:
+        with ProcessPoolExecutor(1) as executor:
+            with self.assertRaises(TypeError):
+                ConversionServer(UnitConverter(), executor=executor)
+
+        with ThreadPoolExecutor(1) as executor:
+            ConversionServer(UnitConverter(), executor=executor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import os
+import pickle
+import tempfile
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+
+from unitconverter.converter import UnitConverter
+from unitconverter.exceptions import ConverterError, InvalidUnitError
+from unitconverter.models.dimension import Dimension
+from unitconverter.models.unit import Unit
+from unitconverter.parsers.fileparser import FileParser
+from unitconverter.registry import Registry
+from unitconverter.sharedregistry import SharedRegistry, _record_entry
+from unitconverter.utils import atomic_open
+
+
+class TestSharedRegistry(unittest.TestCase):
+    """ Tests for the SharedRegistry class. """
+
+    def setUp(self) -> None:
+        self.registry = Registry()
+        FileParser().load_units(self.registry)
+
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tempdir.name, "registry.shared")
+        SharedRegistry.build(self.registry, self.filename, "0" * 64)
+        self.shared = SharedRegistry(self.filename)
+
+    def tearDown(self) -> None:
+        self.shared.close()
+        self.tempdir.cleanup()
+
+    def test_find_unit(self) -> None:
+        self.assertEqual(self.shared.digest, "0" * 64)
+        self.assertEqual(sorted(self.shared.names()), sorted(self.registry.units))
+
+        # Every name should resolve to an equivalent unit
+        for name, expected in self.registry.units.items():
+            unit = self.shared.get_unit(name)
+            self.assertEqual(unit.name, expected.name)
+            self.assertEqual(unit.factor, expected.factor)
+            self.assertIs(unit.dimension, expected.dimension)
+
+        # Names of the same unit share one instance
+        self.assertIs(self.shared.get_unit("metre"), self.shared.get_unit("m"))
+
+        self.assertIsNone(self.shared.find_unit("undefined unit"))
+        with self.assertRaises(InvalidUnitError):
+            self.shared.get_unit("undefined unit")
+
+    def test_get_units(self) -> None:
+        # Units are listed in name table order
+        expected = {unit.name for unit in self.registry.get_units("length")}
+        self.assertIn("metre", expected)
+        self.assertEqual({unit.name for unit in self.shared.get_units("length")}, expected)
+
+    def test_suggest(self) -> None:
+        # Names are suggested from the shared name table
+        self.assertEqual(self.shared.suggest("mililitre")[0], "millilitre")
+
+        # Misspelled names after a prefix are scored against every prefixable name
+        self.assertEqual(self.shared.suggest("kilomter")[0], "kilometre")
+        self.assertEqual(self.shared.suggest("megawat")[0], "megawatt")
+
+    def test_read_only(self) -> None:
+        with self.assertRaises(ConverterError):
+            self.shared.add_unit(Unit("test", 1, "length"))
+        with self.assertRaises(ConverterError):
+            self.shared.add_alias(self.shared.get_unit("metre"), "test")
+        with self.assertRaises(ConverterError):
+            self.shared.add_loader(["test"], lambda: None, Dimension("length"))
+
+        # Only units loaded by the process are cleared
+        self.shared.get_unit("metre")
+        self.shared.clear()
+        self.assertEqual(self.shared.units, {})
+        self.assertIsNotNone(self.shared.find_unit("metre"))
+
+    def test_invalid_file(self) -> None:
+        with open(self.filename, "wb") as fp:
+            fp.write(b"not a shared registry")
+
+        with self.assertRaises(ConverterError):
+            SharedRegistry(self.filename)
+
+        # load() should rebuild invalid or out of date files
+        shared = SharedRegistry.load(self.filename, "1" * 64)
+        self.assertEqual(shared.digest, "1" * 64)
+        shared.close()
+
+    def test_records(self) -> None:
+        # Records are json, fractional exponents survive the round trip
+        registry = Registry()
+        registry.add_unit(Unit("root", Fraction(1, 3), {"length": Fraction(1, 2)}))
+        SharedRegistry.build(registry, self.filename, "0" * 64)
+
+        shared = SharedRegistry(self.filename)
+        self.assertEqual(shared.get_unit("root").dimension, {"length": Fraction(1, 2)})
+        self.assertEqual(shared.get_unit("root").factor, Fraction(1, 3))
+
+        # Records that aren't json (i.e a pickle) are invalid, not unpickled
+        offset, length = _record_entry.unpack_from(shared._map, shared._records_offset)
+        shared.close()
+
+        with open(self.filename, "r+b") as fp:
+            fp.seek(offset)
+            fp.write(pickle.dumps(None)[:length].ljust(length, b"."))
+
+        shared = SharedRegistry(self.filename)
+        with self.assertRaises(ConverterError):
+            shared.get_unit("root")
+        shared.close()
+
+    def test_concurrent_build(self) -> None:
+        # Every writer uses its own temporary file, so readers only see complete files
+        with ThreadPoolExecutor(4) as executor:
+            for future in [executor.submit(SharedRegistry.build, self.registry,
+                                           self.filename, "2" * 64) for _ in range(8)]:
+                future.result()
+
+        shared = SharedRegistry(self.filename)
+        self.assertEqual(shared.digest, "2" * 64)
+        self.assertEqual(shared.get_unit("metre").name, "metre")
+        shared.close()
+        self.assertEqual(os.listdir(self.tempdir.name), ["registry.shared"])
+
+        # Failed writes keep the old file and don't leave temporary files behind
+        with self.assertRaises(RuntimeError):
+            with atomic_open(self.filename) as fp:
+                fp.write(b"partial")
+                raise RuntimeError("write failed")
+
+        self.assertEqual(os.listdir(self.tempdir.name), ["registry.shared"])
+        SharedRegistry(self.filename).close()
+
+    def test_converter(self) -> None:
+        converter = UnitConverter(registry=self.shared)
+        self.assertEqual(converter.convert(1, "kilometre", "metre"), 1000)
+        self.assertEqual(converter.convert(1, "kW*h", "J"), 3600000)
+        self.assertEqual(converter.convert(0, "celsius", "fahrenheit"), Fraction(32))
+
+        with self.assertRaises(TypeError):
+            UnitConverter(registry={})  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
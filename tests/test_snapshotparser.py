@@ -0,0 +1,102 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from pathlib import Path
+
+from unitconverter.parsers.fileparser import FileParser
+from unitconverter.parsers.snapshotparser import SNAPSHOT_VERSION, SnapshotParser
+from unitconverter.registry import Registry
+
+
+class TestSnapshotParser(unittest.TestCase):
+    """ Tests for the SnapshotParser class. """
+
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.filename = Path(self.tempdir.name) / "registry.snapshot"
+
+        self.registry = Registry()
+        FileParser().load_units(self.registry)
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def test_load_units(self) -> None:
+        # Invalid registry should raise a TypeError
+        with self.assertRaises(TypeError):
+            SnapshotParser(self.filename).load_units(None)  # type: ignore
+
+        # Missing snapshot shouldn't be loaded
+        registry = Registry()
+        self.assertFalse(SnapshotParser(self.filename).load_units(registry))
+        self.assertEqual(len(registry.units), 0)
+
+        SnapshotParser(self.filename).save_units(self.registry)
+        self.assertTrue(SnapshotParser(self.filename).load_units(registry))
+
+        # Snapshot should contain every unit and alias
+        self.assertEqual(registry.units.keys(), self.registry.units.keys())
+        for name, unit in self.registry.units.items():
+            self.assertEqual(registry.units[name], unit, name)
+
+        # Shared unit references should be preserved
+        self.assertIs(registry.get_unit("km"), registry.get_unit("kilometre"))
+
+        # Composite aliases should keep their unit names
+        self.assertEqual(registry.get_unit("psi").name, "pound-force/inch^2")
+
+    def test_load_outdated(self) -> None:
+        SnapshotParser(self.filename, "old hash").save_units(self.registry)
+
+        # Snapshots built from different unit files shouldn't be loaded
+        registry = Registry()
+        self.assertFalse(SnapshotParser(self.filename).load_units(registry))
+        self.assertEqual(len(registry.units), 0)
+
+    def test_load_index(self) -> None:
+        parser = SnapshotParser(self.filename)
+        self.assertIsNone(parser.load_index())
+
+        index = FileParser().build_index()
+        parser.save_index(index)
+        self.assertEqual(parser.load_index(), index)
+
+        # Unit snapshots aren't indexes
+        parser.save_units(self.registry)
+        self.assertIsNone(parser.load_index())
+
+    def test_snapshot_format(self) -> None:
+        # Snapshots are plain json, and fractional exponents survive the round trip
+        parser = SnapshotParser(self.filename)
+        index = {"root.json": {"names": ["root"], "dimension": {"length": Fraction(3, 2)}}}
+        parser.save_index(index)
+        self.assertEqual(json.loads(self.filename.read_text("utf-8"))["kind"], "index")
+        self.assertEqual(parser.load_index(), index)
+
+        # Pickled snapshots (from older versions) are never unpickled
+        self.filename.write_bytes(pickle.dumps({"version": SNAPSHOT_VERSION}))
+        self.assertIsNone(parser.load_index())
+        self.assertFalse(parser.load_units(Registry()))
+
+    def test_concurrent_save(self) -> None:
+        # Every writer uses its own temporary file, so readers only see complete snapshots
+        with ThreadPoolExecutor(4) as executor:
+            for future in [executor.submit(SnapshotParser(self.filename).save_units,
+                                           self.registry) for _ in range(8)]:
+                future.result()
+
+        self.assertTrue(SnapshotParser(self.filename).load_units(Registry()))
+        self.assertEqual(os.listdir(self.tempdir.name), ["registry.snapshot"])
+
+    def test_load_invalid(self) -> None:
+        self.filename.write_bytes(b"invalid snapshot")
+        self.assertFalse(SnapshotParser(self.filename).load_units(Registry()))
@@ -0,0 +1,76 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import io
+import unittest
+
+from fractions import Fraction
+
+from unitconverter.converter import UnitConverter
+from unitconverter.exceptions import ConverterError
+from unitconverter.streaming import (convert_rows, guess_format, parse_column,
+                                     parse_quantity, stream_convert)
+
+
+class TestStreaming(unittest.TestCase):
+    """ Tests for the streaming conversion functions. """
+
+    def setUp(self) -> None:
+        self.converter = UnitConverter()
+
+    def test_parse_column(self) -> None:
+        self.assertEqual(parse_column("temp_f:degF:degC"), ("temp_f", "degF", "degC"))
+        self.assertEqual(parse_column("a:b:m:ft"), ("a:b", "m", "ft"))
+
+        # Invalid columns should raise a ConverterError
+        for invalid_column in ("temp_f", "temp_f:degF", "temp_f::degC"):
+            with self.assertRaises(ConverterError):
+                parse_column(invalid_column)
+
+    def test_guess_format(self) -> None:
+        self.assertEqual(guess_format("data.tsv"), "tsv")
+        self.assertEqual(guess_format("data.JSONL"), "jsonl")
+        self.assertEqual(guess_format("data.ndjson"), "jsonl")
+        self.assertEqual(guess_format("-"), "csv")
+
+    def test_parse_quantity(self) -> None:
+        self.assertEqual(parse_quantity(" 98.6 "), Fraction("98.6"))
+        self.assertEqual(parse_quantity(98.6), Fraction("98.6"))
+        self.assertEqual(parse_quantity(3), 3)
+
+        with self.assertRaises(TypeError):
+            parse_quantity("invalid")
+
+    def test_convert_rows(self) -> None:
+        rows = iter([{"length": "1"}, {"length": ""}, {"other": "2"}])
+        rows = convert_rows(rows, self.converter, [("length", "foot", "inch")])
+
+        self.assertEqual(next(rows), {"length": "12"})
+        self.assertEqual(next(rows), {"length": ""})
+        self.assertEqual(next(rows), {"other": "2"})
+
+        # Invalid values should raise a ConverterError
+        rows = convert_rows([{"length": "x"}], self.converter, [("length", "foot", "inch")])
+        with self.assertRaises(ConverterError):
+            next(rows)
+
+    def test_stream_convert(self) -> None:
+        columns = [("temp", "degF", "degC")]
+
+        output = io.StringIO()
+        stream_convert(io.StringIO("id,temp\n1,212\n2,32\n"), output, self.converter, columns)
+        self.assertEqual(output.getvalue(), "id,temp\n1,100\n2,0\n")
+
+        output = io.StringIO()
+        stream_convert(io.StringIO("id\ttemp\n1\t212\n"), output, self.converter, columns, "tsv")
+        self.assertEqual(output.getvalue(), "id\ttemp\n1\t100\n")
+
+        output = io.StringIO()
+        stream_convert(io.StringIO('{"id": 1, "temp": 212}\n'), output, self.converter,
+                       columns, "jsonl")
+        self.assertEqual(output.getvalue(), '{"id": 1, "temp": "100"}\n')
+
+        # Missing csv columns should raise a ConverterError
+        with self.assertRaises(ConverterError):
+            stream_convert(io.StringIO("id\n1\n"), io.StringIO(), self.converter, columns)
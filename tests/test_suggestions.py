@@ -0,0 +1,39 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import unittest
+
+from unitconverter.suggestions import SuggestionIndex, get_trigrams, score
+
+
+class TestSuggestionIndex(unittest.TestCase):
+    """ Tests for the SuggestionIndex class. """
+
+    def setUp(self) -> None:
+        self.index = SuggestionIndex(["metre", "metres", "m", "litre", "psi", "pascal",
+                                      "fahrenheit", "fortnight", "metre"])
+
+    def test_search(self) -> None:
+        # Duplicate names are only indexed once
+        self.assertEqual(len(self.index), 8)
+
+        self.assertEqual(self.index.search("meter", 2)[0][1], "metre")
+        self.assertEqual([name for _, name in self.index.search("psia")], ["psi"])
+        self.assertEqual(self.index.search("fahrenheight", 1)[0][1], "fahrenheit")
+
+        # Names that aren't similar enough aren't suggested
+        self.assertEqual(self.index.search("xyzzy"), [])
+        self.assertEqual(self.index.search("fahrenheight", cutoff=1), [])
+
+    def test_candidates(self) -> None:
+        self.assertEqual(self.index.candidates("metres", 1), ["metres"])
+        self.assertEqual(self.index.candidates("xyzzy", 3), [])
+
+    def test_score(self) -> None:
+        results = score("mili", ["milli", "micro", "mega"])
+        self.assertEqual([name for _, name in results], ["milli"])
+        self.assertEqual(results[0][0], 8 / 9)
+
+    def test_get_trigrams(self) -> None:
+        self.assertEqual(get_trigrams("Pa"), {"  p", " pa", "pa "})
@@ -2,12 +2,21 @@
 # https://www.github.com/emetophobe/unitconverter
 
 
+import array
+import pickle
 import unittest
 
 from fractions import Fraction
 
-from unitconverter.converter import UnitConverter
-from unitconverter.exceptions import IncompatibleUnitError, InvalidUnitError
+from unitconverter.converter import UnitConverter, get_base_name
+from unitconverter.exceptions import ConverterError, IncompatibleUnitError, InvalidUnitError
+from unitconverter.models.dimension import Dimension
+from unitconverter.models.unit import Unit
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestUnitConverter(unittest.TestCase):
@@ -67,6 +76,200 @@ class TestUnitConverter(unittest.TestCase):
                                  f"Invalid conversion between {source} and {target}"
                                  f" ({result} vs {expected})")
 
+        # Non-temperature units should raise a ConverterError
+        with self.assertRaises(ConverterError):
+            self.converter.convert_temperature(test_value, "metre", "kelvin")
+
+        # Units with an offset can't be composited
+        with self.assertRaises(ConverterError):
+            self.converter.convert(test_value, "celsius/second", "kelvin/second")
+
+        # New absolute scales only need a factor and offset
+        reaumur = Unit("reaumur", "5/4", "temperature", ["°Ré"], offset="273.15")
+        self.converter.registry.add_unit(reaumur)
+        self.assertEqual(self.converter.convert(80, "°Ré", "celsius"), 100)
+        self.assertEqual(self.converter.convert(0, "reaumur", "fahrenheit"), 32)
+
+    def test_get_conversion(self) -> None:
+        conversion = self.converter.get_conversion("foot", "inch")
+        self.assertEqual(conversion.scale, 12)
+        self.assertEqual(conversion.offset, 0)
+
+        # Repeated unit pairs should be cached
+        hits = self.converter.cache.hits
+        self.assertIs(self.converter.get_conversion("foot", "inch"), conversion)
+        self.assertEqual(self.converter.cache.hits, hits + 1)
+
+        conversion = self.converter.get_conversion("celsius", "fahrenheit")
+        self.assertEqual(conversion.scale, Fraction(9, 5))
+        self.assertEqual(conversion.offset, 32)
+
+        # Incompatible units shouldn't be cached
+        with self.assertRaises(IncompatibleUnitError):
+            self.converter.get_conversion("metre", "second")
+        self.assertNotIn(("metre", "second"), self.converter.cache)
+
+    def test_compatible_units(self) -> None:
+        # Composite units are found if they have an alias (kph and kmph are listed once)
+        names = [unit.name for unit in self.converter.compatible_units("m/s")]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn("kilometre/hour", names)
+        self.assertIn("nautical mile/hour", names)
+
+        names = [unit.name for unit in self.converter.compatible_units("fahrenheit")]
+        self.assertIn("kelvin", names)
+        self.assertNotIn("metre", names)
+
+        with self.assertRaises(InvalidUnitError):
+            self.converter.compatible_units("invalid unit")
+
+    def test_convert_float(self) -> None:
+        # Floats are only accepted in float mode
+        with self.assertRaises(TypeError):
+            self.converter.convert(98.6, "fahrenheit", "celsius")
+
+        result = self.converter.convert(98.6, "fahrenheit", "celsius", exact=False)
+        self.assertIsInstance(result, float)
+        self.assertAlmostEqual(result, 37)
+
+        # Float mode can also be set per converter
+        converter = UnitConverter(exact=False)
+        self.assertIsInstance(converter.convert(1, "foot", "inch"), float)
+        self.assertIsInstance(converter.convert(1, "foot", "inch", exact=True), Fraction)
+
+        for (source, targets, expected) in si_unit_tests + length_tests + temperature_tests:
+            if isinstance(targets, str):
+                targets = [targets]
+
+            for target in targets:
+                result = converter.convert("1", source, target)
+                self.assertAlmostEqual(result, float(Fraction(expected)),
+                                       delta=abs(float(Fraction(expected))) * 1e-12,
+                                       msg=f"Invalid conversion between {source} and {target}")
+
+    def test_compile(self) -> None:
+        conversion = self.converter.compile("psi", "kPa")
+        self.assertEqual(conversion(1), self.converter.convert(1, "psi", "kPa"))
+        self.assertEqual(conversion("1/2"), self.converter.convert("1/2", "psi", "kPa"))
+
+        # Floats are only accepted by float conversions
+        with self.assertRaises(TypeError):
+            conversion(1.5)
+
+        conversion = self.converter.compile("celsius", "fahrenheit", exact=False)
+        self.assertEqual(conversion(100.0), 212)
+        self.assertIsInstance(conversion(100), float)
+
+        # Mapped conversions are lazy
+        values = iter(["0", "-40", "37"])
+        results = conversion.map(values)
+        self.assertEqual(next(results), 32)
+        self.assertEqual(list(values), ["-40", "37"])
+
+        # Conversions can be sent to other processes
+        for exact in (True, False):
+            conversion = self.converter.compile("kelvin", "celsius", exact=exact)
+            copy = pickle.loads(pickle.dumps(conversion))
+            self.assertEqual(copy(300), conversion(300))
+            self.assertIs(copy.dimension, conversion.dimension)
+
+    @unittest.skipUnless(numpy, "requires numpy")
+    def test_convert_array(self) -> None:
+        # Incompatible units should raise an IncompatibleUnitError
+        with self.assertRaises(IncompatibleUnitError):
+            self.converter.convert_array([1, 2], "metre", "second")
+
+        result = self.converter.convert_array([1, 2, 3], "foot", "inch")
+        self.assertEqual(result.tolist(), [12, 24, 36])
+
+        result = self.converter.convert_array(numpy.array([0, 100]), "celsius", "fahrenheit")
+        self.assertEqual(result.tolist(), [32, 212])
+
+        # Results can be written to an existing buffer
+        values = array.array("d", [1, 2])
+        result = self.converter.convert_array(values, "kilometre", "metre", out=values)
+        self.assertEqual(values.tolist(), [1000, 2000])
+        self.assertEqual(result.tolist(), [1000, 2000])
+
+        conversion = self.converter.compile("celsius", "kelvin")
+        self.assertEqual(conversion.array([0, 100]).tolist(), [273.15, 373.15])
+
+    def test_convert_auto(self) -> None:
+        self.assertEqual(self.converter.convert_auto(Fraction(1200000), "byte", "B"),
+                         (Fraction("1.2"), "MB"))
+        self.assertEqual(self.converter.convert_auto(Fraction(3 * 2 ** 30), "B", "byte", "binary"),
+                         (3, "gibibyte"))
+        self.assertEqual(self.converter.convert_auto(Fraction("0.00042"), "metre", "m"),
+                         (420, "mum"))
+        self.assertEqual(self.converter.convert_auto(Fraction(1), "mile", "metre"),
+                         (Fraction("1.609344"), "kilometre"))
+        self.assertEqual(self.converter.convert_auto(Fraction(0), "metre", "m"), (0, "m"))
+
+        result, name = self.converter.convert_auto(2.5e7, "foot", "m", exact=False)
+        self.assertAlmostEqual(result, 7.62)
+        self.assertEqual(name, "Mm")
+
+        # The target must be a unit that supports the prefixes
+        with self.assertRaises(ConverterError):
+            self.converter.convert_auto(Fraction(1), "metre", "foot")
+
+        with self.assertRaises(ConverterError):
+            self.converter.convert_auto(Fraction(1), "metre", "metre", "binary")
+
+        with self.assertRaises(TypeError):
+            self.converter.convert_auto(Fraction(1), "metre", "metre", "invalid")
+
+    @unittest.skipUnless(numpy, "requires numpy")
+    def test_convert_auto_array(self) -> None:
+        values = [1500, 2e6, 0, -3e-5]
+
+        result, name = self.converter.convert_auto_array(values, "m", "m")
+        self.assertEqual(name, "Mm")
+        self.assertEqual(result.tolist(), [0.0015, 2, 0, -3e-11])
+
+        result, names = self.converter.convert_auto_array(values, "m", "m", shared=False)
+        self.assertEqual(names, ["km", "Mm", "m", "mum"])
+        self.assertEqual(result.tolist(), [1.5, 2, 0, -30])
+
+        result, names = self.converter.convert_auto_array([512, 2048], "B", "B", "binary", False)
+        self.assertEqual(names, ["B", "KiB"])
+        self.assertEqual(result.tolist(), [512, 2])
+
+    def test_to_base(self) -> None:
+        result, dimension = self.converter.to_base(Fraction(1), "kW*h")
+        self.assertEqual(result, 3600000)
+        self.assertIs(dimension, Dimension({"length": 2, "mass": 1, "time": -2}))
+
+        self.assertEqual(self.converter.to_base(Fraction(100), "celsius")[0], Fraction("373.15"))
+        self.assertEqual(self.converter.to_base(Fraction(1), "byte")[0], 8)
+        self.assertEqual(self.converter.to_base(2, "foot", exact=False)[0], 0.6096)
+
+        # from_base is the inverse of to_base
+        for name in ("fahrenheit", "mile/hour", "kilogram", "MiB"):
+            result, _ = self.converter.to_base(Fraction(7, 3), name)
+            self.assertEqual(self.converter.from_base(result, name), Fraction(7, 3))
+
+        conversion = self.converter.get_base_conversion("mi/h")
+        self.assertEqual(str(conversion), "mile/hour -> metre/second")
+        self.assertIs(self.converter.get_base_conversion("mi/h"), conversion)
+
+        # Dimensionless units convert to 1
+        conversion = self.converter.get_base_conversion("degree")
+        self.assertEqual(str(conversion), "degree -> 1")
+        self.assertEqual(get_base_name(Dimension({})), "1")
+
+        with self.assertRaises(InvalidUnitError):
+            self.converter.to_base(Fraction(1), "invalid")
+
+    @unittest.skipUnless(numpy, "requires numpy")
+    def test_to_base_array(self) -> None:
+        result, dimension = self.converter.to_base_array([0, 100], "celsius")
+        self.assertEqual(result.tolist(), [273.15, 373.15])
+        self.assertIs(dimension, Dimension("temperature"))
+
+        result = self.converter.from_base_array(numpy.array([1000, 2500]), "kilometre")
+        self.assertEqual(result.tolist(), [1, 2.5])
+
 
 # Conversion tests
 
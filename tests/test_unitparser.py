@@ -65,15 +65,48 @@ class TestUnitParser(unittest.TestCase):
         unit2 = self.parser.parse_unit("second^-1")
         self.assertEqual(unit1, unit2)
 
-    def test_simplify_unit(self) -> None:
-        simplify_unit = self.parser._simplify_unit
+    def test_parse_parentheses(self) -> None:
+        unit1 = self.parser.parse_unit("m/(s*s)")
+        unit2 = self.parser.parse_unit("m/s^2")
+        self.assertEqual(unit1, unit2)
+
+        unit = self.parser.parse_unit("(m/s)^2")
+        self.assertEqual(unit.name, "metre^2/second^2")
+        self.assertEqual(unit.dimension, Dimension({"length": 2, "time": -2}))
+
+        # Unbalanced parentheses should raise an InvalidUnitError
+        for name in ("(m/s", "m/s)", "()"):
+            with self.assertRaises(InvalidUnitError):
+                self.parser.parse_unit(name)
+
+    def test_parse_fractional_exponent(self) -> None:
+        unit = self.parser.parse_unit("m^(1/2)")
+        self.assertEqual(unit.name, "metre^(1/2)")
+        self.assertEqual(unit.factor, 1)
+        self.assertEqual(unit.dimension, Dimension({"length": Fraction(1, 2)}))
 
-        self.assertEqual(simplify_unit("metre¹"), "metre1")
-        self.assertEqual(simplify_unit("metre⁻¹"), "metre-1")
+        unit1 = self.parser.parse_unit("(m^2)^0.5")
+        unit2 = self.parser.parse_unit("m")
+        self.assertEqual(unit1.name, unit2.name)
+        self.assertEqual(unit1.dimension, unit2.dimension)
 
-    def test_split_exponent(self) -> None:
-        split_exponent = self.parser._split_exponent
+        # Irrational factors should raise an InvalidUnitError
+        with self.assertRaises(InvalidUnitError):
+            self.parser.parse_unit("km^(1/2)")
+
+        # Zero exponents and zero divisors should raise an InvalidUnitError
+        for name in ("m^0", "m^(0/2)", "m^0.0", "m^(1/0)"):
+            with self.assertRaises(InvalidUnitError):
+                self.parser.parse_unit(name)
+
+    def test_tokenize(self) -> None:
+        tokenize = self.parser._tokenize
 
-        self.assertEqual(split_exponent("metre"), ("metre", 1))
-        self.assertEqual(split_exponent("metre¹"), ("metre", 1))
-        self.assertEqual(split_exponent("metre⁻¹"), ("metre", -1))
+        self.assertEqual(tokenize("metre¹"), [("name", "metre", 0), ("number", "1", 5)])
+        self.assertEqual(tokenize("metre⁻¹"), [("name", "metre", 0), ("number", "-1", 5)])
+        self.assertEqual(tokenize("meter per second"),
+                         [("name", "metre", 0), ("divide", " per ", 5), ("name", "second", 10)])
+
+        # Invalid characters should raise an InvalidUnitError
+        with self.assertRaises(InvalidUnitError):
+            tokenize("metre%")
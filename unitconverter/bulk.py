@@ -0,0 +1,200 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import csv
+import io
+import os
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from fractions import Fraction
+from pathlib import Path
+from typing import IO
+
+from unitconverter.converter import UnitConverter
+from unitconverter.exceptions import ConverterError
+from unitconverter.formatting import format_quantity
+from unitconverter.streaming import FORMATS, convert_rows, read_rows, write_rows
+
+
+# Per-process worker state (see _init_worker)
+_worker: dict = {}
+
+
+def bulk_convert(filename: Path | str,
+                 output_fp: IO[str],
+                 columns: list[tuple[str, str, str]],
+                 fmt: str = "csv",
+                 formatter: Callable[[Fraction], str] = format_quantity,
+                 workers: int | None = None,
+                 chunk_size: int = 1 << 20,
+                 max_pending: int | None = None
+                 ) -> int:
+    """ Convert columns of a large file using a pool of worker processes.
+
+    The input file is split into byte ranges on line boundaries, and each range is
+    converted by a worker process with its own unit converter. Results are written
+    in the original order. Rows must not contain quoted line breaks.
+
+    Parameters
+    ----------
+    filename : Path | str
+        The input file (csv, tsv, or jsonl)
+
+    output_fp : IO[str]
+        The output file
+
+    columns : list[tuple[str, str, str]]
+        A list of (name, source, target) column tuples
+
+    fmt : str, optional
+        The file format, by default "csv"
+
+    formatter : Callable[[Fraction], str], optional
+        Picklable function used to format the converted quantities,
+        by default format_quantity
+
+    workers : int | None, optional
+        Number of worker processes, by default None (the number of CPUs)
+
+    chunk_size : int, optional
+        Approximate size of each byte range, by default 1 MiB
+
+    max_pending : int | None, optional
+        Maximum number of ranges being converted or waiting to be written,
+        by default None (twice the number of workers)
+
+    Returns
+    -------
+    int
+        The number of rows written
+    """
+
+    if fmt not in FORMATS:
+        raise ConverterError(f"{fmt!r} is not a supported format")
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("chunk size must be a positive integer")
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+
+    fieldnames, start = _read_header(filename, fmt)
+
+    if fieldnames is not None:
+        for name, _, _ in columns:
+            if name not in fieldnames:
+                raise ConverterError(f"Column {name!r} not found in input")
+
+    # Make sure the unit pairs are valid before starting the workers
+    converter = UnitConverter()
+    for _, source, target in columns:
+        converter.get_conversion(source, target)
+
+    if fieldnames is not None:
+        output_fp.write(_format_header(fieldnames, fmt))
+
+    count = 0
+    pending: deque[Future] = deque()
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(columns, fmt, fieldnames, formatter)) as executor:
+
+        for range_start, range_end in split_file(filename, start, chunk_size):
+            # Wait for the oldest range when too many ranges are pending (backpressure)
+            if len(pending) >= max_pending:
+                count += _write_result(pending.popleft(), output_fp)
+
+            pending.append(executor.submit(_convert_range, str(filename),
+                                           range_start, range_end))
+
+        while pending:
+            count += _write_result(pending.popleft(), output_fp)
+
+    return count
+
+
+def split_file(filename: Path | str,
+               start: int = 0,
+               chunk_size: int = 1 << 20
+               ) -> Iterator[tuple[int, int]]:
+    """ Split a file into (start, end) byte ranges that end on line boundaries. """
+    with open(filename, "rb") as fp:
+        size = fp.seek(0, os.SEEK_END)
+
+        while start < size:
+            end = start + chunk_size
+            if end >= size:
+                yield start, size
+                return
+
+            # Move the end of the range to the end of the current line
+            fp.seek(end - 1)
+            fp.readline()
+            end = fp.tell()
+
+            yield start, end
+            start = end
+
+
+def _read_header(filename: Path | str, fmt: str) -> tuple[list[str] | None, int]:
+    """ Read the csv field names. Returns the field names and the offset of the first row. """
+    if fmt == "jsonl":
+        return None, 0
+
+    with open(filename, "rb") as fp:
+        line = fp.readline()
+
+    reader = csv.reader([line.decode("utf-8")], delimiter=FORMATS[fmt])
+    return next(reader, []), len(line)
+
+
+def _format_header(fieldnames: list[str], fmt: str) -> str:
+    """ Format the csv header line. """
+    output = io.StringIO()
+    csv.writer(output, delimiter=FORMATS[fmt], lineterminator="\n").writerow(fieldnames)
+    return output.getvalue()
+
+
+def _write_result(future: Future, output_fp: IO[str]) -> int:
+    """ Write the result of a converted range. Returns the number of rows. """
+    text, count = future.result()
+    output_fp.write(text)
+    return count
+
+
+def _init_worker(columns: list[tuple[str, str, str]],
+                 fmt: str,
+                 fieldnames: list[str] | None,
+                 formatter: Callable[[Fraction], str]
+                 ) -> None:
+    """ Create the unit converter used by the worker process. """
+    _worker["converter"] = UnitConverter()
+    _worker["columns"] = columns
+    _worker["format"] = fmt
+    _worker["fieldnames"] = fieldnames
+    _worker["formatter"] = formatter
+
+
+def _convert_range(filename: str, start: int, end: int) -> tuple[str, int]:
+    """ Convert the rows in a byte range of the input file. """
+    with open(filename, "rb") as fp:
+        fp.seek(start)
+        text = fp.read(end - start).decode("utf-8")
+
+    fmt = _worker["format"]
+    fieldnames = _worker["fieldnames"]
+
+    if fieldnames is None:
+        _, rows = read_rows(io.StringIO(text), fmt)
+    else:
+        rows = csv.DictReader(io.StringIO(text, newline=""), fieldnames,
+                              delimiter=FORMATS[fmt])
+
+    rows = convert_rows(rows, _worker["converter"], _worker["columns"], _worker["formatter"])
+
+    output = io.StringIO()
+    count = write_rows(rows, output, fmt, fieldnames, header=False)
+    return output.getvalue(), count
@@ -0,0 +1,313 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import logging
+import sqlite3
+import threading
+
+from collections import OrderedDict
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Hashable
+
+from unitconverter.exceptions import ConverterError
+from unitconverter.parsers.fileparser import FileParser
+
+
+class LRUCache:
+    """ A bounded least recently used cache with hit, miss, and eviction counters.
+        The cache is thread safe.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """ Create an LRU cache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of cached items, by default 256 (0 disables caching)
+        """
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = 0
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        """ Get the maximum cache size. """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        """ Set the maximum cache size. Evicts the oldest items if necessary. """
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+            raise TypeError(f"{maxsize!r} is not a valid cache size")
+
+        if maxsize < 0:
+            raise ValueError("cache size must be a positive integer or zero")
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """ Get a cached item, or None if the key isn't cached. """
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """ Add an item to the cache. Evicts the oldest item if the cache is full. """
+        if not self._maxsize:
+            return
+
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        """ Remove all cached items. The statistics are not reset. """
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> dict[str, int]:
+        """ Get a dictionary of cache statistics. """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._items),
+            "maxsize": self._maxsize
+        }
+
+    def _evict(self) -> None:
+        """ Remove the least recently used items until the cache fits. """
+        while len(self._items) > self._maxsize:
+            self._items.popitem(last=False)
+            self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class ResultCache:
+    """ A persistent least recently used cache of exact conversion results,
+        stored in an SQLite database.
+
+    Results are keyed by the (source, target) unit names exactly as they were given
+    and the exact quantity, so a cached result is found without parsing the units.
+    The database is stamped with a hash of the unit files, and every result is
+    discarded when the unit files change. Access times are kept in memory and written
+    with the new results every commit_interval changes (and by commit() and close()),
+    so cache hits don't write to the database. The size limit is enforced when the
+    changes are written. The cache is thread safe.
+    """
+
+    def __init__(self,
+                 filename: Path | str = "data/results.sqlite",
+                 maxsize: int = 100_000,
+                 digest: str | None = None,
+                 commit_interval: int = 1000
+                 ) -> None:
+        """ Open a result cache. The database is created if it doesn't exist.
+
+        Parameters
+        ----------
+        filename : Path | str, optional
+            The database filename, by default "data/results.sqlite"
+
+        maxsize : int, optional
+            Maximum number of cached results, by default 100,000
+
+        digest : str | None, optional
+            Hash of the unit files, by default None (calculated from the data directory)
+
+        commit_interval : int, optional
+            Number of changes to keep in memory before writing them, by default 1000
+        """
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+            raise TypeError(f"{maxsize!r} is not a valid cache size")
+
+        if maxsize < 1:
+            raise ValueError("cache size must be a positive integer")
+
+        if digest is None:
+            digest = FileParser().get_hash()
+
+        self.filename = Path(filename)
+        self.maxsize = maxsize
+        self.digest = digest
+        self.commit_interval = max(1, commit_interval)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._touched: dict[tuple[str, str, str], int] = {}
+        self._added: dict[tuple[str, str, str], str] = {}
+
+        try:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.filename, check_same_thread=False)
+            self._open()
+        except sqlite3.Error as e:
+            raise ConverterError(f"Failed to open result cache {self.filename}", str(e))
+
+    def _open(self) -> None:
+        """ Create the tables, and clear the results if the unit files have changed. """
+        db = self._db
+        db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        db.execute("CREATE TABLE IF NOT EXISTS results (source TEXT, target TEXT,"
+                   " quantity TEXT, result TEXT, used INTEGER,"
+                   " PRIMARY KEY (source, target, quantity)) WITHOUT ROWID")
+        db.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+
+        row = db.execute("SELECT value FROM meta WHERE key = 'digest'").fetchone()
+        if row is None or row[0] != self.digest:
+            if row is not None:
+                logging.debug("Result cache %s is out of date", self.filename)
+            db.execute("DELETE FROM results")
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('digest', ?)", (self.digest,))
+
+        db.commit()
+
+        row = db.execute("SELECT COUNT(*), MAX(used) FROM results").fetchone()
+        self._size = row[0]
+        self._tick = row[1] or 0
+
+    def get(self, source: str, target: str, quantity: Fraction) -> Fraction | None:
+        """ Get a cached result, or None if it isn't cached. """
+        key = (source, target, str(quantity))
+        with self._lock:
+            result = self._added.get(key)
+            if result is None:
+                row = self._db.execute("SELECT result FROM results WHERE source = ?"
+                                       " AND target = ? AND quantity = ?", key).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                result = row[0]
+
+            self._tick += 1
+            self._touched[key] = self._tick
+            self.hits += 1
+            self._check_interval()
+
+        # Faster than parsing the string with Fraction()
+        numerator, _, denominator = result.partition("/")
+        return Fraction(int(numerator), int(denominator) if denominator else 1)
+
+    def put(self, source: str, target: str, quantity: Fraction, result: Fraction) -> None:
+        """ Add a result to the cache. """
+        key = (source, target, str(quantity))
+        with self._lock:
+            self._tick += 1
+            self._added[key] = str(result)
+            self._touched[key] = self._tick
+            self._check_interval()
+
+    def commit(self) -> None:
+        """ Write the new results and access times, and evict the least recently used
+            results if the cache is too big.
+        """
+        with self._lock:
+            self._commit()
+
+    def clear(self) -> None:
+        """ Remove all cached results. The statistics are not reset. """
+        with self._lock:
+            self._added.clear()
+            self._touched.clear()
+            self._db.execute("DELETE FROM results")
+            self._db.commit()
+            self._size = 0
+
+    def set_digest(self, digest: str) -> None:
+        """ Stamp the cache with a new hash of the unit files. Every result is removed
+            if the hash is different.
+        """
+        with self._lock:
+            if digest == self.digest:
+                return
+
+            self._added.clear()
+            self._touched.clear()
+            try:
+                with self._db:
+                    self._db.execute("DELETE FROM results")
+                    self._db.execute("INSERT OR REPLACE INTO meta VALUES ('digest', ?)",
+                                     (digest,))
+            except sqlite3.Error as e:
+                raise ConverterError(f"Failed to update result cache {self.filename}", str(e))
+
+            self.digest = digest
+            self._size = 0
+
+    def close(self) -> None:
+        """ Write any pending changes and close the database. """
+        with self._lock:
+            self._commit()
+            self._db.close()
+
+    def stats(self) -> dict[str, int | float]:
+        """ Get a dictionary of cache statistics (size includes uncommitted results). """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "size": self._size + len(self._added),
+            "maxsize": self.maxsize
+        }
+
+    def _check_interval(self) -> None:
+        """ Commit when enough changes are pending. """
+        if len(self._touched) >= self.commit_interval:
+            self._commit()
+
+    def _commit(self) -> None:
+        """ Write the pending changes. The lock must be held. """
+        if not self._touched:
+            return
+
+        db = self._db
+        try:
+            with db:
+                db.executemany("INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?, 0)",
+                               [(*key, result) for key, result in self._added.items()])
+                db.executemany("UPDATE results SET used = ? WHERE source = ? AND target = ?"
+                               " AND quantity = ?",
+                               [(used, *key) for key, used in self._touched.items()])
+
+                self._size = db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+                excess = self._size - self.maxsize
+                if excess > 0:
+                    db.execute("DELETE FROM results WHERE (source, target, quantity) IN"
+                               " (SELECT source, target, quantity FROM results"
+                               "  ORDER BY used LIMIT ?)", (excess,))
+                    self._size -= excess
+                    self.evictions += excess
+        except sqlite3.Error as e:
+            raise ConverterError(f"Failed to update result cache {self.filename}", str(e))
+        finally:
+            self._added.clear()
+            self._touched.clear()
+
+    def __len__(self) -> int:
+        return self._size + len(self._added)
@@ -5,35 +5,111 @@
 import logging
 
 from fractions import Fraction
+from typing import Any
 
+from unitconverter import instrumentation
+from unitconverter.cache import LRUCache, ResultCache
 from unitconverter.exceptions import ConverterError, IncompatibleUnitError
+from unitconverter.formatting import format_display_name
+from unitconverter.models.conversion import Conversion
+from unitconverter.models.dimension import Dimension
+from unitconverter.models.prefix import Prefix, PrefixScale, get_scale
 from unitconverter.models.unit import Unit
 from unitconverter.parsers.fileparser import FileParser
+from unitconverter.parsers.snapshotparser import SnapshotParser
 from unitconverter.parsers.unitparser import UnitParser
 from unitconverter.registry import Registry
-from unitconverter.utils import parse_fraction
+from unitconverter.utils import import_numpy, parse_float, parse_fraction
+
+
+# Used to check for temperature units
+_temperature = Dimension("temperature")
+
+# Coherent SI base unit of each base dimension
+_base_units = {
+    "length": "metre",
+    "mass": "kilogram",
+    "time": "second",
+    "electric current": "ampere",
+    "temperature": "kelvin",
+    "amount of substance": "mole",
+    "luminous intensity": "candela",
+    "information": "bit",
+}
 
 
 class UnitConverter:
     """ The unit converter handles loading, parsing, and converting units."""
 
-    def __init__(self) -> None:
-        """ Create a unit converter. """
-        self.registry = Registry()
+    def __init__(self,
+                 snapshot: bool = True,
+                 cache_size: int = 256,
+                 lazy: bool = False,
+                 exact: bool = True,
+                 registry: Registry | None = None,
+                 result_cache: ResultCache | None = None
+                 ) -> None:
+        """ Create a unit converter.
+
+        Parameters
+        ----------
+        snapshot : bool, optional
+            Load units from the registry snapshot if it's up to date, by default True.
+            The snapshot is rebuilt from the unit files when it's missing or out of date.
+
+        cache_size : int, optional
+            Maximum number of cached conversions, by default 256 (0 disables the cache)
+
+        lazy : bool, optional
+            Only load unit files when one of their units is first used, by default False
+
+        exact : bool, optional
+            Use exact Fraction arithmetic, by default True. Set to False to convert
+            using native floats, which is much faster but only accurate to about
+            15 significant digits.
+
+        registry : Registry | None, optional
+            Use an existing unit registry (i.e a SharedRegistry), by default None.
+            The snapshot and lazy arguments are ignored when a registry is given.
+
+        result_cache : ResultCache | None, optional
+            Persistent cache of exact conversion results, by default None. Only
+            conversions between unit names are cached (not Unit instances).
+        """
+        if registry is not None and not isinstance(registry, Registry):
+            raise TypeError(f"{registry!r} is not a valid unit registry")
+
+        if result_cache is not None and not isinstance(result_cache, ResultCache):
+            raise TypeError(f"{result_cache!r} is not a valid result cache")
+
+        self.registry = Registry() if registry is None else registry
         self.parser = UnitParser(self.registry)
-        FileParser().load_units(self.registry)
+        self.cache = LRUCache(cache_size)
+        self.result_cache = result_cache
+        self.exact = exact
+        self.file_parser = FileParser()
+
+        if registry is not None:
+            return
+        elif lazy:
+            self._load_index(snapshot)
+        elif snapshot:
+            self._load_snapshot()
+        else:
+            self.file_parser.load_units(self.registry)
 
     def convert(self,
-                quantity: Fraction,
+                quantity: Fraction | float,
                 source: str | Unit,
-                target: str | Unit
-                ) -> Fraction:
+                target: str | Unit,
+                exact: bool | None = None
+                ) -> Fraction | float:
         """ Convert quantity from the source unit to the target unit.
 
         Parameters
         ----------
-        quantity : Fraction
-            A quantity or value
+        quantity : Fraction | float
+            A quantity or value (floats are only accepted when exact is False)
 
         source : str | Unit
             Source unit name or instance
@@ -41,30 +117,76 @@ class UnitConverter:
         target : str | Unit
             Target unit name or instance
 
+        exact : bool | None, optional
+            Use exact Fraction arithmetic, by default None (use the converter setting)
+
         Returns
         -------
-        Fraction
-            The converted quantity
+        Fraction | float
+            The converted quantity (a float when exact is False)
         """
 
-        quantity = parse_fraction(quantity)
-        source = self.parser.parse_unit(source)
-        target = self.parser.parse_unit(target)
+        if exact is None:
+            exact = self.exact
 
-        logging.debug(f"convert() {source} ({source.dimension})")
-        logging.debug(f"convert() {target} ({target.dimension})")
+        timed = instrumentation.enabled
+        if timed:
+            start = instrumentation.start()
 
-        # Check if the units are compatible
-        if source.dimension != target.dimension:
-            raise IncompatibleUnitError(source, target)
+        # Cached results are found before the units are parsed
+        if exact and self.result_cache is not None and isinstance(source, str) \
+                and isinstance(target, str):
+            result = self._convert_cached(parse_fraction(quantity), source, target)
+            if timed:
+                instrumentation.record("convert.cache", start)
+            return result
+
+        conversion = self.get_conversion(source, target)
+        if timed:
+            start = instrumentation.record("convert.plan", start)
+
+        if exact:
+            result = conversion.convert(parse_fraction(quantity))
+        else:
+            result = conversion.convert_float(parse_float(quantity))
 
-        # Temperature conversion
-        if source.dimension.name == "temperature":
-            return self.convert_temperature(quantity, source, target)
+        if timed:
+            instrumentation.record("convert.apply", start)
 
-        # Regular conversion
-        quantity = quantity * source.factor
-        return quantity / target.factor
+        return result
+
+    def convert_array(self,
+                      values: Any,
+                      source: str | Unit,
+                      target: str | Unit,
+                      out: Any = None
+                      ) -> Any:
+        """ Convert an array of quantities from the source unit to the target unit.
+
+        The units are only parsed once and the conversion is applied to the entire
+        array in a single vectorized pass using 64-bit floats. Requires numpy.
+
+        Parameters
+        ----------
+        values : array_like
+            A numpy array, sequence, or buffer protocol object of quantities
+
+        source : str | Unit
+            Source unit name or instance
+
+        target : str | Unit
+            Target unit name or instance
+
+        out : array_like | None, optional
+            A writable array or buffer to store the results in, by default None
+
+        Returns
+        -------
+        numpy.ndarray
+            The converted quantities (a view of out if it was specified)
+        """
+
+        return self.get_conversion(source, target).array(values, out)
 
     def convert_temperature(self,
                             quantity: Fraction,
@@ -74,29 +196,449 @@ class UnitConverter:
         """ Convert quantity from the source temperature unit to the target unit. """
 
         quantity = parse_fraction(quantity)
+        for unit in (source, target):
+            if self.parser.parse_unit(unit).dimension != _temperature:
+                raise ConverterError(f"{unit} is not a temperature unit")
+
+        return self.get_conversion(source, target).convert(quantity)
+
+    def convert_auto(self,
+                     quantity: Fraction | float,
+                     source: str | Unit,
+                     target_base: str,
+                     prefixes: str = "metric",
+                     exact: bool | None = None
+                     ) -> tuple[Fraction | float, str]:
+        """ Convert quantity to the prefixed form of a target unit that best fits its
+            magnitude (i.e 1200000 byte to 1.2 MB instead of 1200000 B).
+
+        The prefix is the largest one that isn't bigger than the converted quantity,
+        found with a binary search of the sorted prefix factors. Only prefixes the
+        target unit supports are used.
+
+        Parameters
+        ----------
+        quantity : Fraction | float
+            A quantity or value (floats are only accepted when exact is False)
+
+        source : str | Unit
+            Source unit name or instance
+
+        target_base : str
+            The unprefixed target unit name or symbol (i.e "byte" or "B"). Prefix names
+            are added to names and prefix symbols are added to symbols.
+
+        prefixes : str, optional
+            Use "metric" prefixes (powers of 1000) or "binary" prefixes (powers of 1024),
+            by default "metric"
+
+        exact : bool | None, optional
+            Use exact Fraction arithmetic, by default None (use the converter setting)
+
+        Returns
+        -------
+        tuple[Fraction | float, str]
+            The converted quantity and the prefixed target unit name
+        """
+        scale, kind = self._get_scale(target_base, prefixes)
+        result = self._apply(self.get_conversion(source, target_base), quantity, exact)
+
+        prefix = scale.select(result)
+        if prefix is None:
+            return result, target_base
+
+        if isinstance(result, Fraction):
+            return result / prefix.factor, _prefix_name(prefix, kind, target_base)
+
+        return _unprefix(result, prefix.factor), _prefix_name(prefix, kind, target_base)
+
+    def convert_auto_array(self,
+                           values: Any,
+                           source: str | Unit,
+                           target_base: str,
+                           prefixes: str = "metric",
+                           shared: bool = True
+                           ) -> tuple[Any, str | list[str]]:
+        """ Convert an array of quantities to the prefixed forms of a target unit that
+            best fit their magnitudes (see convert_auto). Requires numpy.
+
+        Parameters
+        ----------
+        values : array_like
+            A numpy array, sequence, or buffer protocol object of quantities
+
+        source : str | Unit
+            Source unit name or instance
+
+        target_base : str
+            The unprefixed target unit name or symbol
+
+        prefixes : str, optional
+            Use "metric" or "binary" prefixes, by default "metric"
+
+        shared : bool, optional
+            Use one prefix for the whole array (the prefix of the largest magnitude),
+            by default True. Set to False to pick a prefix for each element.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, str | list[str]]
+            The converted quantities, and the shared target unit name or a list of
+            target unit names (one per element)
+        """
+        numpy = import_numpy()
+
+        scale, kind = self._get_scale(target_base, prefixes)
+        results = self.get_conversion(source, target_base).array(values)
+        magnitudes = numpy.abs(results)
+
+        if shared:
+            finite = magnitudes[numpy.isfinite(magnitudes)]
+            prefix = scale.select(float(finite.max()) if finite.size else 0.0)
+            if prefix is None:
+                return results, target_base
+
+            return _unprefix(results, prefix.factor), _prefix_name(prefix, kind, target_base)
+
+        # Zero (and nan) magnitudes aren't prefixed
+        indexes = numpy.searchsorted(scale.float_factors, magnitudes, side="right") - 1
+        numpy.clip(indexes, 0, None, out=indexes)
+        indexes[~(magnitudes > 0)] = scale.prefixes.index(None)
+
+        # One of the two is always 1 (see _unprefix)
+        multipliers = numpy.array([float(1 / min(factor, 1)) for factor in scale.factors])
+        divisors = numpy.array([float(max(factor, 1)) for factor in scale.factors])
+        results = results * multipliers[indexes] / divisors[indexes]
+
+        names = [target_base if prefix is None else _prefix_name(prefix, kind, target_base)
+                 for prefix in scale.prefixes]
+
+        return results, [names[index] for index in indexes.tolist()]
+
+    def _get_scale(self, target_base: str, prefixes: str) -> tuple[PrefixScale, str]:
+        """ Get the prefix scale of a target unit, and whether the target is a name or symbol. """
+        if not isinstance(target_base, str):
+            raise TypeError(f"{target_base!r} is not a valid unit name")
+
+        entry = self.registry.find_prefixable(target_base)
+        if entry is None:
+            raise ConverterError(f"{target_base} is not a unit that can be prefixed")
+
+        unit, kind = entry
+        scale = get_scale(prefixes, unit.prefixes)
+        if len(scale) == 1:
+            raise ConverterError(f"{target_base} does not support {prefixes} prefixes")
+
+        return scale, kind
+
+    def to_base(self,
+                quantity: Fraction | float,
+                unit: str | Unit,
+                exact: bool | None = None
+                ) -> tuple[Fraction | float, Dimension]:
+        """ Convert quantity from a unit to the coherent SI base units of its dimension
+            (i.e feet to metres, or kilowatt hours to kg*m^2/s^2).
+
+        Parameters
+        ----------
+        quantity : Fraction | float
+            A quantity or value (floats are only accepted when exact is False)
+
+        unit : str | Unit
+            Unit name or instance
+
+        exact : bool | None, optional
+            Use exact Fraction arithmetic, by default None (use the converter setting)
+
+        Returns
+        -------
+        tuple[Fraction | float, Dimension]
+            The quantity in base units and the dimension of the unit
+        """
+        conversion = self.get_base_conversion(unit)
+        return self._apply(conversion, quantity, exact), conversion.dimension
+
+    def from_base(self,
+                  quantity: Fraction | float,
+                  unit: str | Unit,
+                  exact: bool | None = None
+                  ) -> Fraction | float:
+        """ Convert quantity from coherent SI base units to a unit. This is the inverse
+            of to_base. The dimension isn't checked, the quantity is assumed to be in
+            the base units of the unit's dimension.
+        """
+        return self._apply(self.get_base_conversion(unit, inverse=True), quantity, exact)
+
+    def to_base_array(self,
+                      values: Any,
+                      unit: str | Unit,
+                      out: Any = None
+                      ) -> tuple[Any, Dimension]:
+        """ Convert an array of quantities to coherent SI base units. The unit is only
+            parsed once (see convert_array). Requires numpy.
+
+        Parameters
+        ----------
+        values : array_like
+            A numpy array, sequence, or buffer protocol object of quantities
+
+        unit : str | Unit
+            Unit name or instance
+
+        out : array_like | None, optional
+            A writable array or buffer to store the results in, by default None
+
+        Returns
+        -------
+        tuple[numpy.ndarray, Dimension]
+            The quantities in base units and the dimension of the unit
+        """
+        conversion = self.get_base_conversion(unit)
+        return conversion.array(values, out), conversion.dimension
+
+    def from_base_array(self, values: Any, unit: str | Unit, out: Any = None) -> Any:
+        """ Convert an array of quantities from coherent SI base units to a unit.
+            Requires numpy.
+        """
+        return self.get_base_conversion(unit, inverse=True).array(values, out)
+
+    def get_base_conversion(self, unit: str | Unit, inverse: bool = False) -> Conversion:
+        """ Get the compiled conversion between a unit and the coherent SI base units
+            of its dimension. No target unit is parsed, the unit's own factor and
+            offset are used. Conversions of unit names are cached like get_conversion.
+
+        Parameters
+        ----------
+        unit : str | Unit
+            Unit name or instance
+
+        inverse : bool, optional
+            Convert from the base units to the unit instead, by default False
+
+        Returns
+        -------
+        Conversion
+            The compiled conversion
+        """
+        if not isinstance(unit, str):
+            return _create_base_conversion(self.parser.parse_unit(unit), inverse)
+
+        key = (None, unit) if inverse else (unit, None)
+        conversion = self.cache.get(key)
+        if conversion is None:
+            conversion = _create_base_conversion(self.parser.parse_unit(unit), inverse)
+            self.cache.put(key, conversion)
+
+        return conversion
+
+    def _apply(self,
+               conversion: Conversion,
+               quantity: Fraction | float,
+               exact: bool | None
+               ) -> Fraction | float:
+        """ Apply a conversion to a quantity using exact or float arithmetic. """
+        if exact is None:
+            exact = self.exact
+
+        if exact:
+            return conversion.convert(parse_fraction(quantity))
+
+        return conversion.convert_float(parse_float(quantity))
+
+    def _load_snapshot(self) -> None:
+        """ Load units from the registry snapshot. Rebuilds the snapshot if necessary. """
+        snapshot_parser = SnapshotParser()
+        if snapshot_parser.load_units(self.registry):
+            return
+
+        self.file_parser.load_units(self.registry)
+        try:
+            snapshot_parser.save_units(self.registry)
+        except ConverterError as e:
+            logging.debug("Failed to rebuild snapshot (%s)", e)
+
+    def _load_index(self, snapshot: bool) -> None:
+        """ Lazily load units using the unit name index. Rebuilds the index if necessary. """
+        file_parser = self.file_parser
+        snapshot_parser = SnapshotParser("data/index.snapshot")
+
+        index = snapshot_parser.load_index() if snapshot else None
+        if index is None:
+            index = file_parser.build_index()
+            if snapshot:
+                try:
+                    snapshot_parser.save_index(index)
+                except ConverterError as e:
+                    logging.debug("Failed to rebuild index (%s)", e)
+
+        file_parser.load_index(self.registry, index)
+
+    def compatible_units(self, unit: str | Unit) -> list[Unit]:
+        """ Get the units that a unit can be converted to (including itself).
+            Prefixed units aren't included.
+
+        Parameters
+        ----------
+        unit : str | Unit
+            A unit name or instance
+
+        Returns
+        -------
+        list[Unit]
+            The units with the same dimension
+        """
+        return self.registry.get_units(self.parser.parse_unit(unit).dimension)
+
+    def reload(self) -> list[str]:
+        """ Reload the unit files that have changed, and clear the conversion cache
+            (and the result cache) if any units changed. The first reload loads every
+            file if the units were loaded from a snapshot. See FileParser.reload.
+
+        Returns
+        -------
+        list[str]
+            The names of the files that were added, changed, or removed
+        """
+        changed = self.file_parser.reload(self.registry)
+        if changed:
+            self.cache.clear()
+            if self.result_cache is not None:
+                self.result_cache.set_digest(self.file_parser.get_hash())
+            logging.debug("Reloaded %s", ", ".join(changed))
+
+        return changed
+
+    def compile(self,
+                source: str | Unit,
+                target: str | Unit,
+                exact: bool | None = None
+                ) -> Conversion:
+        """ Compile a reusable conversion function between two units.
+
+        The units are only parsed once. The returned conversion can be called with
+        a quantity, mapped over an iterable, applied to an array, or pickled and
+        sent to another process.
+
+        Parameters
+        ----------
+        source : str | Unit
+            Source unit name or instance
+
+        target : str | Unit
+            Target unit name or instance
+
+        exact : bool | None, optional
+            Use exact Fraction arithmetic, by default None (use the converter setting)
+
+        Returns
+        -------
+        Conversion
+            The compiled conversion
+        """
+
+        if exact is None:
+            exact = self.exact
+
+        conversion = self.get_conversion(source, target)
+        if exact:
+            return conversion
+
+        return Conversion(conversion.source, conversion.target, conversion.dimension,
+                          conversion.scale, conversion.offset, exact=False)
+
+    def get_conversion(self, source: str | Unit, target: str | Unit) -> Conversion:
+        """ Get the compiled conversion between the source and target units.
+
+        Conversions between unit names are cached, so repeated unit pairs
+        skip parsing entirely.
+
+        Parameters
+        ----------
+        source : str | Unit
+            Source unit name or instance
+
+        target : str | Unit
+            Target unit name or instance
+
+        Returns
+        -------
+        Conversion
+            The compiled conversion
+        """
+
+        # Unit instances aren't hashable so they always get parsed
+        if not isinstance(source, str) or not isinstance(target, str):
+            return self._create_conversion(source, target)
+
+        key = (source, target)
+        conversion = self.cache.get(key)
+        if conversion is None:
+            conversion = self._create_conversion(source, target)
+            self.cache.put(key, conversion)
+
+        return conversion
+
+    def _convert_cached(self, quantity: Fraction, source: str, target: str) -> Fraction:
+        """ Convert a quantity using the persistent result cache. Results are keyed by
+            the unit names as given, so a hit skips parsing the units.
+        """
+        result = self.result_cache.get(source, target, quantity)
+        if result is None:
+            result = self.get_conversion(source, target).convert(quantity)
+            self.result_cache.put(source, target, quantity, result)
+
+        return result
+
+    def _create_conversion(self, source: str | Unit, target: str | Unit) -> Conversion:
+        """ Parse the source and target units and create a new conversion. """
         source = self.parser.parse_unit(source)
         target = self.parser.parse_unit(target)
 
-        # Convert from source unit to kelvin
-        if source.name.endswith("kelvin"):
-            quantity = quantity * source.factor
-        elif source.name.endswith("celsius"):
-            quantity = quantity * source.factor + Fraction("273.15")
-        elif source.name.endswith("fahrenheit"):
-            quantity = (quantity * source.factor + Fraction("459.67")) * Fraction(5, 9)
-        elif source.name.endswith("rankine"):
-            quantity = quantity * source.factor
-        else:
-            raise ConverterError(f"{source} is not a temperature unit")
-
-        # Convert from kelvin to target unit
-        if target.name.endswith("kelvin"):
-            return quantity / target.factor
-        elif target.name.endswith("celsius"):
-            return (quantity - Fraction("273.15")) / target.factor
-        elif target.name.endswith("fahrenheit"):
-            return (quantity * Fraction(9, 5) - Fraction("459.67")) / target.factor
-        elif target.name.endswith("rankine"):
-            return quantity / target.factor
-        else:
-            raise ConverterError(f"{target} is not a temperature unit")
+        logging.debug("convert() %s (%s)", source, source.dimension)
+        logging.debug("convert() %s (%s)", target, target.dimension)
+
+        # Check if the units are compatible
+        if source.dimension != target.dimension:
+            raise IncompatibleUnitError(source, target)
+
+        # Both units are affine maps to the base unit (quantity * factor + offset)
+        scale = source.factor / target.factor
+        offset = (source.offset - target.offset) / target.factor
+        return Conversion(source.name, target.name, source.dimension, scale, offset)
+
+
+def get_base_name(dimension: Dimension) -> str:
+    """ Get the name of the coherent SI base unit of a dimension (i.e "metre/second").
+        Dimensions without an SI base unit use their own name, and dimensionless
+        units (i.e degree) use "1".
+    """
+    if not dimension:
+        return "1"
+
+    return format_display_name([(_base_units.get(name, name), exponent)
+                                for name, exponent in dimension.items()])
+
+
+def _prefix_name(prefix: Prefix, kind: str, name: str) -> str:
+    """ Add a prefix name or symbol to a unit name or symbol. """
+    return (prefix.symbol if kind == "symbol" else prefix.name) + name
+
+
+def _unprefix(values: Any, factor: Fraction) -> Any:
+    """ Divide floats (or a numpy array) by a prefix factor. Small factors multiply by
+        their reciprocal instead, so exact powers of ten stay exact (i.e 3e-5 / 1e-6).
+    """
+    if factor >= 1:
+        return values / float(factor)
+
+    return values * float(1 / factor)
+
+
+def _create_base_conversion(unit: Unit, inverse: bool) -> Conversion:
+    """ Create the conversion between a unit and its base units. """
+    base = get_base_name(unit.dimension)
+    if inverse:
+        return Conversion(base, unit.name, unit.dimension,
+                          1 / unit.factor, -unit.offset / unit.factor)
+
+    return Conversion(unit.name, base, unit.dimension, unit.factor, unit.offset)
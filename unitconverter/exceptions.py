@@ -24,10 +24,18 @@ class IncompatibleUnitError(ConverterError):
 
 
 class InvalidUnitError(ConverterError):
-    """ Invalid or undefined unit errors. """
-
-    def __init__(self, name: str) -> None:
-        super().__init__(f"{name!r} is not a defined unit")
+    """ Invalid or undefined unit errors. Similar unit names are listed in suggestions. """
+
+    def __init__(self,
+                 name: str,
+                 details: str | None = None,
+                 suggestions: list[str] | None = None
+                 ) -> None:
+        self.suggestions = suggestions or []
+        if details is None and self.suggestions:
+            details = f"did you mean {", ".join(map(repr, self.suggestions))}?"
+
+        super().__init__(f"{name!r} is not a defined unit", details)
 
 
 class DuplicateUnitError(ConverterError):
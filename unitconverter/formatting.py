@@ -4,8 +4,12 @@
 
 import logging
 
+from collections.abc import Iterable
 from decimal import Decimal, DecimalException, ROUND_HALF_UP
 from fractions import Fraction
+from typing import IO, Any
+
+from unitconverter import instrumentation
 
 
 def format_quantity(quantity: Fraction,
@@ -46,28 +50,195 @@ def format_quantity(quantity: Fraction,
         The formatted quantity
     """
 
+    start = instrumentation.start() if instrumentation.enabled else 0
+
     if fraction:
-        return str(quantity)
+        result = str(quantity)
+    else:
+        value = Decimal(quantity.numerator) / Decimal(quantity.denominator)
+
+        if precision is not None:
+            try:
+                value = value.quantize(Decimal(10) ** -precision, ROUND_HALF_UP)
+            except DecimalException:
+                logging.debug("Failed to quantize %s (precision = %s)", quantity, precision)
+                pass
+
+        if normalize:
+            value = value.normalize()
+
+        if exponent:
+            result = f"{value:e}"
+        else:
+            result = f"{value:{"," if separators else ""}f}"
+
+    if start:
+        instrumentation.record("format", start)
+
+    return result
+
+
+class QuantityFormatter:
+    """ A reusable quantity formatter for bulk output.
+
+    The formatting options are checked once and turned into format templates, so
+    formatting many quantities is much cheaper than calling format_quantity for each
+    one. The output for exact quantities is identical to format_quantity.
+
+    Floats (i.e from float mode conversions or numpy arrays) are formatted the same
+    as format_quantity(Fraction(repr(value))), so 2.675 is rounded to 2.68 even though
+    its binary value is slightly less than 2.675. Fixed point output uses python's
+    float formatting when the result is the same (small values that aren't ties).
+    """
+
+    def __init__(self,
+                 precision: int | None = None,
+                 normalize: bool = False,
+                 fraction: bool = False,
+                 exponent: bool = False,
+                 separators: bool = False
+                 ) -> None:
+        """ Create a quantity formatter. The arguments are the same as format_quantity. """
+        if precision is not None and (not isinstance(precision, int) or precision < 0):
+            raise ValueError("precision must be a non-negative integer")
+
+        self.precision = precision
+        self.normalize = normalize
+        self.fraction = fraction
+        self.exponent = exponent
+        self.separators = separators
+
+        # Format templates
+        self._spec = "e" if exponent else ("," if separators else "") + "f"
+        self._quantum = None if precision is None else Decimal(10) ** -precision
+        if precision is not None:
+            self._float_spec = f"{"," if separators and not exponent else ""}.{precision}f"
+            self._tie_scale = 10.0 ** (precision + 1)
+
+        # Fixed point output (floats are rounded using the float format spec)
+        self._fixed = precision is not None and not normalize and not exponent
+
+        # str() of a decimal quantized to 6 places or less is the same as the "f" format
+        # spec (the exponent is never positive or less than -6), and it's much faster
+        self._plain = self._fixed and precision <= 6 and not separators
+
+    def __call__(self, quantity: Fraction | float | int) -> str:
+        """ Format a single quantity. """
+        if self.fraction:
+            return str(quantity)
+
+        if isinstance(quantity, float):
+            return self._format_float(quantity)
+
+        return self._format_decimal(Decimal(quantity.numerator) / Decimal(quantity.denominator))
 
-    value = Decimal(quantity.numerator) / Decimal(quantity.denominator)
+    def format_many(self, quantities: Iterable[Any]) -> list[str]:
+        """ Format a sequence, iterable, or numpy array of quantities. """
+        start = instrumentation.start() if instrumentation.enabled else 0
 
-    if precision is not None:
-        try:
-            value = value.quantize(Decimal(10) ** -precision, ROUND_HALF_UP)
-        except DecimalException:
-            logging.debug(f"Failed to quantize {quantity} (precision = {precision})")
-            pass
+        if hasattr(quantities, "tolist"):
+            quantities = quantities.tolist()  # numpy scalars to python numbers
 
-    if normalize:
-        value = value.normalize()
+        results = list(map(self, quantities))
 
-    if exponent:
-        return f"{value:e}"
+        if start:
+            instrumentation.record("format.bulk", start)
 
-    return f"{value:{"," if separators else ""}f}"
+        return results
 
+    def write(self,
+              quantities: Iterable[Any],
+              fp: IO[str],
+              separator: str = "\n",
+              chunk_size: int = 4096
+              ) -> int:
+        """ Format quantities and write them to a file, chunk_size quantities per write.
+            Every quantity is followed by the separator. Returns the number of quantities.
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("chunk size must be a positive integer")
 
-def format_name(units: list[tuple[str, int]], sort_keys: bool = False) -> str:
+        if hasattr(quantities, "tolist"):
+            quantities = quantities.tolist()
+
+        count = 0
+        chunk = []
+        for quantity in quantities:
+            chunk.append(self(quantity))
+            if len(chunk) >= chunk_size:
+                fp.write(separator.join(chunk) + separator)
+                count += len(chunk)
+                chunk.clear()
+
+        if chunk:
+            fp.write(separator.join(chunk) + separator)
+            count += len(chunk)
+
+        return count
+
+    def _format_float(self, value: float) -> str:
+        """ Format a float using its shortest representation. Fixed point output uses
+            python's float formatting, except for ties (i.e 2.675 with a precision
+            of 2) and large values where it would show the binary expansion.
+        """
+        if self._fixed:
+            # Only values close to a tie need their shortest representation checked
+            # (the scaled remainder is accurate to well within 0.01 below 1e12)
+            scaled = value * self._tie_scale
+            remainder = scaled % 10
+            if (remainder < 4.99 or remainder > 5.01) and -1e12 < scaled < 1e12:
+                return format(value + 0.0, self._float_spec)  # -0.0 is 0 like fractions
+
+        decimal = Decimal(repr(value))
+        if decimal.is_finite():
+            # Divide the exact ratio the same way as a fraction (i.e 800435.0 is 800435)
+            numerator, denominator = decimal.as_integer_ratio()
+            decimal = Decimal(numerator) / Decimal(denominator)
+        elif self._fixed:
+            return format(value, self._float_spec)  # inf and nan
+
+        return self._format_decimal(decimal)
+
+    def _format_decimal(self, value: Decimal) -> str:
+        """ Format a decimal the same way as format_quantity. """
+        if self._quantum is not None:
+            try:
+                value = value.quantize(self._quantum, ROUND_HALF_UP)
+            except DecimalException:
+                logging.debug("Failed to quantize %s (precision = %s)", value, self.precision)
+            else:
+                if self._plain:
+                    return str(value)
+
+        if self.normalize:
+            value = value.normalize()
+
+        return format(value, self._spec)
+
+    def __repr__(self) -> str:
+        return (f"QuantityFormatter(precision={self.precision}, normalize={self.normalize}, "
+                f"fraction={self.fraction}, exponent={self.exponent}, "
+                f"separators={self.separators})")
+
+
+def format_quantities(quantities: Iterable[Any], **options: Any) -> list[str]:
+    """ Format many quantities. The options are the same as format_quantity. """
+    return QuantityFormatter(**options).format_many(quantities)
+
+
+def write_quantities(quantities: Iterable[Any],
+                     fp: IO[str],
+                     separator: str = "\n",
+                     chunk_size: int = 4096,
+                     **options: Any
+                     ) -> int:
+    """ Format quantities and write them to a file in chunks. Returns the number of
+        quantities written. The options are the same as format_quantity.
+    """
+    return QuantityFormatter(**options).write(quantities, fp, separator, chunk_size)
+
+
+def format_name(units: list[tuple[str, int | Fraction]], sort_keys: bool = False) -> str:
     """ Format unit name without divisor (i.e "metre*second^-1") """
     names = []
     for unit, exponent in sorted(units) if sort_keys else units:
@@ -76,7 +247,9 @@ def format_name(units: list[tuple[str, int]], sort_keys: bool = False) -> str:
     return "*".join(names)
 
 
-def format_display_name(units: list[tuple[str, int]], sort_keys: bool = False) -> str:
+def format_display_name(units: list[tuple[str, int | Fraction]],
+                        sort_keys: bool = False
+                        ) -> str:
     """ Format unit name with divisor (i.e "metre/second") """
     numers = []
     denoms = []
@@ -96,9 +269,13 @@ def format_display_name(units: list[tuple[str, int]], sort_keys: bool = False) -
     return "*".join(numers) + "/" + "*".join(denoms)
 
 
-def format_exponent(name: str, exponent: int) -> str:
-    """ Format unit name with optional exponent. """
-    if exponent != 1:
-        return f"{name}^{exponent}"
-    else:
+def format_exponent(name: str, exponent: int | Fraction) -> str:
+    """ Format unit name with optional exponent. Fractional exponents are wrapped
+        in parentheses (i.e "hertz^(1/2)").
+    """
+    if exponent == 1:
         return name
+    elif isinstance(exponent, Fraction) and exponent.denominator != 1:
+        return f"{name}^({exponent})"
+    else:
+        return f"{name}^{exponent}"
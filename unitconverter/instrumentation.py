@@ -0,0 +1,118 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+""" Optional per-stage timing of the parsing, conversion, and formatting hot paths.
+
+Instrumentation is disabled by default. The hot paths only check the module level
+enabled flag, so the cost is a single attribute lookup when it's turned off:
+
+    >>> from unitconverter import instrumentation
+    >>> instrumentation.enable()
+    >>> converter.convert(1, "kg*m/s^2", "newton")
+    >>> instrumentation.snapshot()["parse.tokenize"]["count"]
+    1
+
+Stages:
+
+    parse.lookup    registry lookup of the whole unit name
+    parse.tokenize  splitting a composite name into tokens
+    parse.syntax    parsing the tokens into a syntax tree
+    parse.fold      building the composite unit
+    convert.plan    getting the (possibly cached) conversion for a unit pair
+    convert.apply   parsing the quantity and applying the conversion
+    convert.cache   converting with the persistent result cache (instead of plan/apply)
+    format          format_quantity()
+    format.bulk     QuantityFormatter.format_many()
+
+Hooks are called with the stage name and the elapsed time in nanoseconds.
+"""
+
+
+import threading
+import time
+
+from collections.abc import Callable
+
+
+# Checked by the hot paths before taking any timings. Use enable() and disable().
+enabled = False
+
+_hooks: list[Callable[[str, int], None]] = []
+_stats: dict[str, list[int]] = {}
+_lock = threading.Lock()
+
+
+def enable() -> None:
+    """ Enable instrumentation. """
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    """ Disable instrumentation. The collected statistics are kept. """
+    global enabled
+    enabled = False
+
+
+def reset() -> None:
+    """ Clear the collected statistics. """
+    with _lock:
+        _stats.clear()
+
+
+def add_hook(hook: Callable[[str, int], None]) -> None:
+    """ Add a function that is called with (stage, elapsed_ns) for every timed stage. """
+    if not callable(hook):
+        raise TypeError(f"{hook!r} is not a valid hook")
+
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[str, int], None]) -> None:
+    """ Remove a hook. Raises a ValueError if the hook wasn't added. """
+    _hooks.remove(hook)
+
+
+def start() -> int:
+    """ Get the start time of a stage. """
+    return time.perf_counter_ns()
+
+
+def record(stage: str, start: int) -> int:
+    """ Record the time elapsed since start for a stage.
+        Returns the current time so consecutive stages can be chained.
+    """
+    now = time.perf_counter_ns()
+    elapsed = now - start
+
+    with _lock:
+        stats = _stats.get(stage)
+        if stats is None:
+            _stats[stage] = [1, elapsed, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+
+    for hook in _hooks:
+        hook(stage, elapsed)
+
+    return now
+
+
+def snapshot() -> dict[str, dict[str, int | float]]:
+    """ Get a copy of the collected statistics.
+
+    Returns
+    -------
+    dict[str, dict[str, int | float]]
+        The count, total_ns, mean_ns, and max_ns of each stage
+    """
+    with _lock:
+        return {stage: {"count": count,
+                        "total_ns": total,
+                        "mean_ns": total / count,
+                        "max_ns": maximum}
+                for stage, (count, total, maximum) in _stats.items()}
@@ -0,0 +1,216 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import csv
+import json
+
+from collections.abc import Callable
+from fractions import Fraction
+from typing import IO, Any
+
+from unitconverter.exceptions import ConverterError
+from unitconverter.formatting import format_quantity
+from unitconverter.models.dimension import Dimension
+from unitconverter.models.unit import Unit
+from unitconverter.parsers.unitparser import UnitParser
+from unitconverter.registry import Registry
+from unitconverter.utils import import_numpy
+
+
+# Supported export formats
+FORMATS = ("csv", "json", "npy")
+
+
+class FactorMatrix:
+    """ All-pairs conversion factors for a list of units with the same dimension.
+
+    Every unit's factor (relative to the base unit) is stored once, and the matrix
+    is created with one outer division, so matrix[i][j] is the number of units[j]
+    in one units[i] (1 X = ? Y).
+    """
+
+    def __init__(self, dimension: Dimension, names: list[str], factors: list[Fraction]) -> None:
+        """ Create a factor matrix.
+
+        Parameters
+        ----------
+        dimension : Dimension
+            The dimension of every unit
+
+        names : list[str]
+            The unit names (row and column labels)
+
+        factors : list[Fraction]
+            The factor of each unit relative to the base unit
+        """
+        if len(names) != len(factors):
+            raise ValueError("names and factors must be the same length")
+
+        self.dimension = dimension
+        self.names = names
+        self.factors = factors
+
+    def to_list(self) -> list[list[Fraction]]:
+        """ Get the exact matrix as a list of rows. """
+        return [[source / target for target in self.factors] for source in self.factors]
+
+    def to_array(self, exact: bool = False) -> Any:
+        """ Get the matrix as a numpy array. Requires numpy.
+
+        Parameters
+        ----------
+        exact : bool, optional
+            Create an object array of Fractions instead of 64-bit floats, by default False
+
+        Returns
+        -------
+        numpy.ndarray
+            A square array of conversion factors
+        """
+        numpy = import_numpy()
+        if exact:
+            factors = numpy.empty(len(self.factors), dtype=object)
+            factors[:] = self.factors
+        else:
+            factors = numpy.array([float(factor) for factor in self.factors])
+
+        return numpy.divide.outer(factors, factors)
+
+    def write_csv(self,
+                  fp: IO[str],
+                  exact: bool = True,
+                  formatter: Callable[[Fraction], str] = format_quantity
+                  ) -> None:
+        """ Write the matrix as csv. The first row and column are the unit names. """
+        writer = csv.writer(fp, lineterminator="\n")
+        writer.writerow(["", *self.names])
+        for name, row in zip(self.names, self._rows(exact, formatter)):
+            writer.writerow([name, *row])
+
+    def write_json(self,
+                   fp: IO[str],
+                   exact: bool = True,
+                   formatter: Callable[[Fraction], str] = format_quantity
+                   ) -> None:
+        """ Write the matrix as json. Exact factors are formatted as strings. """
+        json.dump({"dimension": self.dimension.name,
+                   "units": self.names,
+                   "factors": self._rows(exact, formatter)}, fp, ensure_ascii=False)
+        fp.write("\n")
+
+    def save_npy(self, fp: IO[bytes] | str) -> None:
+        """ Save the float matrix as a numpy .npy file. Requires numpy. """
+        import_numpy().save(fp, self.to_array(), allow_pickle=False)
+
+    def _rows(self, exact: bool, formatter: Callable[[Fraction], str]) -> list[list]:
+        """ Get the rows as formatted strings (exact) or floats. """
+        if exact:
+            return [[formatter(factor) for factor in row] for row in self.to_list()]
+
+        floats = [float(factor) for factor in self.factors]
+        return [[source / target for target in floats] for source in floats]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"FactorMatrix({self.dimension}, {len(self.names)} units)"
+
+
+def build_matrices(registry: Registry) -> dict[Dimension, FactorMatrix]:
+    """ Build the factor matrix of every dimension in the registry.
+
+    Each unit is listed once using its name. Prefixed units and units
+    with an offset (i.e celsius) are not included.
+    """
+    if not isinstance(registry, Registry):
+        raise TypeError(f"{registry!r} is not a valid unit registry")
+
+    registry.load_all()
+
+    matrices = {}
+    for dimension, units in registry.dimensions.items():
+        units = [unit for unit in units.values() if not unit.offset]
+        if units:
+            matrices[dimension] = FactorMatrix(dimension, [unit.name for unit in units],
+                                               [unit.factor for unit in units])
+
+    return matrices
+
+
+def build_matrix(registry: Registry,
+                 dimension: Dimension | str | None = None,
+                 units: list[str | Unit] | None = None
+                 ) -> FactorMatrix:
+    """ Build the factor matrix of a single dimension.
+
+    Parameters
+    ----------
+    registry : Registry
+        The unit registry
+
+    dimension : Dimension | str | None, optional
+        The dimension, its display name (i.e "length/time"), or a unit name
+        (i.e "m/s"), by default None (the dimension of the units)
+
+    units : list[str | Unit] | None, optional
+        Unit names or instances to include, by default None (every unit of the dimension)
+
+    Returns
+    -------
+    FactorMatrix
+        The factor matrix
+    """
+    if dimension is not None and not isinstance(dimension, Dimension):
+        dimension = _find_dimension(registry, dimension)
+
+    if units is not None:
+        matrix = _build_unit_matrix(registry, units)
+        if dimension is not None and matrix.dimension != dimension:
+            raise ConverterError(f"The units do not have the {dimension} dimension")
+        return matrix
+
+    if dimension is None:
+        raise TypeError("a dimension or list of units is required")
+
+    units = [unit for unit in registry.get_units(dimension) if not unit.offset]
+    if not units:
+        raise ConverterError(f"No units found with the {dimension} dimension")
+
+    return FactorMatrix(dimension, [unit.name for unit in units],
+                        [unit.factor for unit in units])
+
+
+def _find_dimension(registry: Registry, name: str) -> Dimension:
+    """ Find a dimension by display name, or by the name of a unit. """
+    dimension = registry.find_dimension(name)
+    if dimension is None:
+        dimension = UnitParser(registry).parse_unit(name).dimension
+
+    return dimension
+
+
+def _build_unit_matrix(registry: Registry, units: list[str | Unit]) -> FactorMatrix:
+    """ Build the factor matrix of a list of units. """
+    parser = UnitParser(registry)
+    names, factors = [], []
+    dimension = None
+
+    for name in units:
+        unit = parser.parse_unit(name)
+        if dimension is None:
+            dimension = unit.dimension
+        elif unit.dimension != dimension:
+            raise ConverterError(f"{unit} does not have the same dimension ({dimension})")
+
+        if unit.offset:
+            raise ConverterError(f"{unit} has an offset and can't be used in a factor matrix")
+
+        names.append(name if isinstance(name, str) else unit.name)
+        factors.append(unit.factor)
+
+    if dimension is None:
+        raise ValueError("at least one unit is required")
+
+    return FactorMatrix(dimension, names, factors)
@@ -0,0 +1,129 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+from collections.abc import Iterable, Iterator
+from fractions import Fraction
+from typing import Any
+
+from unitconverter.models.dimension import Dimension
+from unitconverter.utils import import_numpy, parse_float, parse_fraction
+
+
+class Conversion:
+    """ A compiled conversion between two compatible units.
+
+    Every conversion is represented as an affine map (quantity * scale + offset)
+    so regular and temperature conversions can be applied the same way.
+
+    The scale and offset are also stored as floats for fast approximate conversions.
+
+    Conversions are callable and picklable, so they can be reused in tight loops
+    or sent to worker processes:
+
+        >>> conversion = converter.compile("foot", "inch")
+        >>> conversion(2)
+        Fraction(24, 1)
+
+        >>> list(conversion.map(["1", "1/2"]))
+        [Fraction(12, 1), Fraction(6, 1)]
+    """
+
+    def __init__(self,
+                 source: str,
+                 target: str,
+                 dimension: Dimension,
+                 scale: Fraction,
+                 offset: Fraction = Fraction(0),
+                 exact: bool = True
+                 ) -> None:
+        """ Create a new conversion.
+
+        Parameters
+        ----------
+        source : str
+            The source unit name
+
+        target : str
+            The target unit name
+
+        dimension : Dimension
+            The dimension of both units
+
+        scale : Fraction
+            The combined conversion factor
+
+        offset : Fraction, optional
+            The offset added after scaling, by default 0
+
+        exact : bool, optional
+            Use exact Fraction arithmetic when the conversion is called, by default True
+            (False uses native floats)
+        """
+        self.source = source
+        self.target = target
+        self.dimension = dimension
+        self.scale = scale
+        self.offset = offset
+        self.exact = exact
+        self.float_scale = float(scale)
+        self.float_offset = float(offset)
+
+    def convert(self, quantity: Fraction) -> Fraction:
+        """ Convert a quantity from the source unit to the target unit. """
+        if self.offset:
+            return quantity * self.scale + self.offset
+
+        return quantity * self.scale
+
+    def convert_float(self, quantity: float) -> float:
+        """ Convert a quantity using native floats. Faster than convert() but
+            results are rounded to about 15 significant digits.
+        """
+        return quantity * self.float_scale + self.float_offset
+
+    def map(self, quantities: Iterable[Any]) -> Iterator[Fraction | float]:
+        """ Lazily convert an iterable of quantities. """
+        return map(self, quantities)
+
+    def array(self, values: Any, out: Any = None) -> Any:
+        """ Convert an array of quantities using 64-bit floats. Requires numpy.
+
+        Parameters
+        ----------
+        values : array_like
+            A numpy array, sequence, or buffer protocol object of quantities
+
+        out : array_like | None, optional
+            A writable array or buffer to store the results in, by default None
+
+        Returns
+        -------
+        numpy.ndarray
+            The converted quantities (a view of out if it was specified)
+        """
+        numpy = import_numpy()
+
+        values = numpy.asarray(values, dtype=numpy.float64)
+        if out is not None:
+            out = numpy.asarray(out)
+
+        out = numpy.multiply(values, self.float_scale, out=out)
+        if self.offset:
+            numpy.add(out, self.float_offset, out=out)
+
+        return out
+
+    def __call__(self, quantity: Any) -> Fraction | float:
+        """ Convert a quantity (a number or numeric string). """
+        if self.exact:
+            return self.convert(parse_fraction(quantity))
+
+        return self.convert_float(parse_float(quantity))
+
+    def __repr__(self) -> str:
+        return (f"Conversion({self.source!r}, {self.target!r}, {self.dimension}, "
+                f"{self.scale}, {self.offset}, exact={self.exact})")
+
+    def __str__(self) -> str:
+        return f"{self.source} -> {self.target}"
@@ -2,18 +2,48 @@
 # https://www.github.com/emetophobe/unitconverter
 
 
+from collections.abc import ItemsView, Iterator, KeysView, Mapping, ValuesView
+from fractions import Fraction
 from typing import Self
+
 from unitconverter.formatting import format_display_name
 
 
-class Dimension(dict[str, int]):
-    """ All unit dimensions are represented using a custom exponent dictionary.
+# Base dimensions in display order. Unknown dimension names are appended as needed.
+_base_names: list[str] = [
+    "length",
+    "mass",
+    "time",
+    "electric current",
+    "temperature",
+    "amount of substance",
+    "luminous intensity",
+    "information",
+]
+
+_base_indexes: dict[str, int] = {name: index for index, name in enumerate(_base_names)}
+
+# Interned dimensions keyed by exponent vector
+_interned: dict[tuple, "Dimension"] = {}
+
+# Interned dimensions keyed by the items they were created from
+_created: dict[tuple, "Dimension"] = {}
+
+
+class Dimension(Mapping[str, int | Fraction]):
+    """ All unit dimensions are represented using an immutable vector of base
+    dimension exponents. Dimensions are interned, so equal dimensions are always
+    the same object and can be compared and hashed in constant time. The results
+    of *, / and ** are cached on the interned operands.
 
-    For convenience passing a string creates a dictionary with 1 as the exponent:
+    For convenience passing a string creates a dimension with 1 as the exponent:
 
         >>> Dimension("time") == Dimension({"time": 1})
         True
 
+        >>> Dimension("time") is Dimension({"time": 1})
+        True
+
     Dimensions can be divided to create new dimensions:
 
         >>> length = Dimension("length")
@@ -37,64 +67,202 @@ class Dimension(dict[str, int]):
         {'length': 3}
     """
 
-    def __init__(self, dimension: str | dict[str, int] | None = None) -> None:
-        """ Create a new dimension. """
-        if dimension is None:
-            super().__init__()
+    __slots__ = ("_exponents", "_items", "_name", "_products", "_quotients", "_powers")
+
+    _exponents: tuple[int | Fraction, ...]
+    _items: dict[str, int | Fraction]
+    _name: str
+    _products: dict["Dimension", "Dimension"]
+    _quotients: dict["Dimension", "Dimension"]
+    _powers: dict[int | Fraction, "Dimension"]
+
+    def __new__(cls, dimension: "str | Mapping[str, int | Fraction] | None" = None) -> Self:
+        """ Create a new dimension, or get the existing dimension with the same exponents. """
+        if type(dimension) is Dimension:
+            return dimension
+
+        if type(dimension) is dict:
+            items: tuple = tuple(dimension.items())
+        elif dimension is None:
+            items = ()
+        elif isinstance(dimension, Dimension):
+            return dimension
         elif isinstance(dimension, str) and dimension != "":
-            super().__init__({dimension: 1})
-        elif isinstance(dimension, dict):
-            super().__init__(dimension)
+            items = ((dimension, 1),)
+        elif isinstance(dimension, Mapping):
+            items = tuple(dimension.items())
         else:
             raise TypeError(f"{dimension!r} is not a valid dimension")
 
+        # Dimensions created from the same items are looked up without the exponent vector
+        try:
+            return _created[items]
+        except KeyError:
+            pass
+
+        exponents = [0] * len(_base_names)
+        for name, exponent in items:
+            index = _base_indexes.get(name)
+            if index is None:
+                index = _add_base_name(name)
+                exponents.extend([0] * (len(_base_names) - len(exponents)))
+
+            exponents[index] += exponent
+
+        return _created.setdefault(items, cls._intern(exponents))
+
+    @classmethod
+    def _intern(cls, exponents: list) -> Self:
+        """ Get the interned dimension for a list of exponents. """
+        while exponents and not exponents[-1]:
+            exponents.pop()
+
+        key = tuple(_simplify(exponent) for exponent in exponents)
+
+        try:
+            return _interned[key]
+        except KeyError:
+            pass
+
+        # The mapping interface uses a dict of the non-zero exponents in base dimension order
+        items = {_base_names[index]: exponent for index, exponent in enumerate(key) if exponent}
+
+        dimension = object.__new__(cls)
+        dimension._exponents = key
+        dimension._items = items
+        dimension._name = format_display_name(list(items.items()))
+        dimension._products = {}
+        dimension._quotients = {}
+        dimension._powers = {}
+
+        return _interned.setdefault(key, dimension)
+
     @property
-    def name(self):
+    def name(self) -> str:
         """ Get a string representation of the dimension. """
-        return format_display_name(list(self.items()))
+        return self._name
 
     def __mul__(self, other: Self) -> Self:
         """ Multiply a dimension with another dimension. Returns a new dimension. """
-        if not isinstance(other, Dimension):
-            return NotImplemented
+        try:
+            return self._products[other]
+        except (KeyError, TypeError):
+            if not isinstance(other, Dimension):
+                return NotImplemented
 
-        dimension = self.copy()
-        for name, exponent in other.items():
-            dimension[name] = dimension.get(name, 0) + exponent
-            if not dimension[name]:
-                del dimension[name]
+        exponents = _pad(self._exponents, other._exponents)
+        for index, exponent in enumerate(other._exponents):
+            exponents[index] += exponent
 
-        return self.__class__(dimension)
+        result = self._products[other] = self._intern(exponents)
+        return result
 
     def __truediv__(self, other: Self) -> Self:
         """ Divide a dimension with another dimension. Returns a new dimension. """
-        if not isinstance(other, Dimension):
-            return NotImplemented
+        try:
+            return self._quotients[other]
+        except (KeyError, TypeError):
+            if not isinstance(other, Dimension):
+                return NotImplemented
 
-        dimension = self.copy()
-        for name, exponent in other.items():
-            dimension[name] = dimension.get(name, 0) - exponent
-            if not dimension[name]:
-                del dimension[name]
+        exponents = _pad(self._exponents, other._exponents)
+        for index, exponent in enumerate(other._exponents):
+            exponents[index] -= exponent
 
-        return self.__class__(dimension)
+        result = self._quotients[other] = self._intern(exponents)
+        return result
 
-    def __pow__(self, exponent: int) -> Self:
+    def __pow__(self, exponent: int | Fraction) -> Self:
         """ Raise a dimension to a new power. Returns a new dimension. """
-        if not isinstance(exponent, int):
+        if not isinstance(exponent, (int, Fraction)):
             return NotImplemented
 
+        try:
+            return self._powers[exponent]
+        except KeyError:
+            pass
+
         if exponent == 0:
-            raise ValueError("exponent must be a non-zero integer")
+            raise ValueError("exponent must be non-zero")
 
-        dimension = self.copy()
-        for name in dimension.keys():
-            dimension[name] *= exponent
+        result = self._powers[exponent] = self._intern([value * exponent
+                                                        for value in self._exponents])
+        return result
 
-        return self.__class__(dimension)
+    def __getitem__(self, name: str) -> int | Fraction:
+        return self._items[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._items
+
+    def keys(self) -> KeysView[str]:
+        return self._items.keys()
+
+    def items(self) -> ItemsView[str, int | Fraction]:
+        return self._items.items()
+
+    def values(self) -> ValuesView[int | Fraction]:
+        return self._items.values()
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
+        if isinstance(other, Dimension):
+            return False
+
+        if isinstance(other, Mapping):
+            return self._items == dict(other.items())
+
+        return NotImplemented
+
+    # Equal dimensions are the same object
+    __hash__ = object.__hash__
+
+    def __reduce__(self) -> tuple:
+        return (Dimension, (self._items,))
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Self:
+        return self
 
     def __repr__(self) -> str:
-        return super().__repr__()
+        return f"Dimension({self._items!r})"
 
     def __str__(self) -> str:
-        return self.name
+        return self._name
+
+
+def _add_base_name(name: str) -> int:
+    """ Add a new base dimension name. Returns the index of the name. """
+    if not isinstance(name, str) or not name:
+        raise TypeError(f"{name!r} is not a valid dimension name")
+
+    _base_indexes[name] = len(_base_names)
+    _base_names.append(name)
+    return _base_indexes[name]
+
+
+def _pad(first: tuple, second: tuple) -> list:
+    """ Copy the first exponent vector, padded to the length of the second vector. """
+    exponents = list(first)
+    if len(second) > len(exponents):
+        exponents.extend([0] * (len(second) - len(exponents)))
+
+    return exponents
+
+
+def _simplify(exponent: int | Fraction) -> int | Fraction:
+    """ Convert whole fractional exponents to integers. """
+    if isinstance(exponent, Fraction) and exponent.denominator == 1:
+        return exponent.numerator
+
+    return exponent
@@ -2,7 +2,10 @@
 # https://www.github.com/emetophobe/unitconverter
 
 
+from bisect import bisect_right
 from fractions import Fraction
+from typing import Any
+
 from unitconverter.utils import parse_fraction
 
 
@@ -80,3 +83,163 @@ def get_prefixes(option: str | None) -> list[Prefix]:
         return binary_prefixes
     else:
         raise TypeError(f"{option!r} is not a valid prefix option")
+
+
+class PrefixScale:
+    """ A sorted list of prefixes used to pick the prefix that best fits a magnitude.
+
+    The unprefixed unit is part of the scale (as None), and a magnitude uses the
+    largest prefix that isn't bigger than it, so the prefixed value is at least 1
+    (i.e 1200000 uses mega, 1.2 M). Prefixes are found with a binary search.
+    """
+
+    def __init__(self, prefixes: list[Prefix]) -> None:
+        """ Create a prefix scale.
+
+        Parameters
+        ----------
+        prefixes : list[Prefix]
+            The prefixes to choose from (in any order)
+        """
+        entries = sorted([(prefix.factor, prefix) for prefix in prefixes if prefix.factor != 1]
+                         + [(Fraction(1), None)], key=lambda entry: entry[0])
+
+        self.prefixes: list[Prefix | None] = [prefix for _, prefix in entries]
+        self.factors: list[Fraction] = [factor for factor, _ in entries]
+        self.float_factors: list[float] = [float(factor) for factor in self.factors]
+
+    def select(self, magnitude: Fraction | float) -> Prefix | None:
+        """ Get the prefix of a magnitude, or None if the magnitude doesn't need one.
+            Zero is never prefixed, and magnitudes smaller than the smallest prefix
+            use the smallest prefix.
+        """
+        return self.prefixes[self.index(magnitude)]
+
+    def index(self, magnitude: Fraction | float) -> int:
+        """ Get the position of the prefix of a magnitude. """
+        magnitude = abs(magnitude)
+        if not magnitude:
+            return self.prefixes.index(None)
+
+        factors = self.factors if isinstance(magnitude, Fraction) else self.float_factors
+        return max(bisect_right(factors, magnitude) - 1, 0)
+
+    def filter(self, prefixes: list[Prefix]) -> "PrefixScale":
+        """ Create a scale with only the prefixes that are also in another list
+            (compared by name, i.e metric and binary kilo are the same prefix).
+        """
+        names = {prefix.name for prefix in prefixes}
+        return PrefixScale([prefix for prefix in self.prefixes
+                            if prefix is not None and prefix.name in names])
+
+    def __len__(self) -> int:
+        return len(self.prefixes)
+
+    def __repr__(self) -> str:
+        return f"PrefixScale({[str(prefix) for prefix in self.prefixes]})"
+
+
+def get_scale(option: str, supported: str | None = None) -> PrefixScale:
+    """ Get the prefix scale of a prefix option. The metric scale only uses powers
+        of 1000 (i.e milli, kilo, mega but not centi or hecto) and the binary scale
+        only uses powers of 1024 (kibi, mebi, gibi, etc.)
+
+    Parameters
+    ----------
+    option : str
+        The prefix option ("metric" or "binary")
+
+    supported : str | None, optional
+        Only use prefixes supported by this unit prefix option, by default None
+
+    Returns
+    -------
+    PrefixScale
+        The (cached) prefix scale
+    """
+    key = (option, supported)
+    scale = _scales.get(key)
+    if scale is None:
+        if option == "metric":
+            scale = PrefixScale([prefix for prefix in metric_prefixes
+                                 if _is_power(prefix.factor, 1000)])
+        elif option == "binary":
+            scale = PrefixScale([prefix for prefix in binary_prefixes
+                                 if _is_power(prefix.factor, 1024)])
+        else:
+            raise TypeError(f"{option!r} is not a valid prefix option")
+
+        if supported is not None:
+            scale = scale.filter(get_prefixes(supported))
+
+        _scales[key] = scale
+
+    return scale
+
+
+def _is_power(factor: Fraction, base: int) -> bool:
+    """ Check if a factor is an integer power (positive or negative) of base. """
+    value = factor if factor >= 1 else 1 / factor
+    if not value.is_integer():
+        return False
+
+    value = int(value)
+    while value % base == 0:
+        value //= base
+
+    return value == 1
+
+
+class PrefixTrie:
+    """ A tree of prefix strings used to split known prefixes off unit names.
+
+    Each node is a dictionary of characters. Nodes that end a prefix also store
+    a list of values under the None key.
+    """
+
+    def __init__(self) -> None:
+        self.root: dict = {}
+
+    def add(self, key: str, value: Any) -> None:
+        """ Add a value for a prefix string. """
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+
+        node.setdefault(None, []).append(value)
+
+    def matches(self, name: str) -> list[tuple[int, list[Any]]]:
+        """ Get the (length, values) of every prefix of name, longest prefix first. """
+        found = []
+        node = self.root
+        length = 0
+        for char in name:
+            node = node.get(char)
+            if node is None:
+                break
+
+            length += 1
+            values = node.get(None)
+            if values is not None:
+                found.append((length, values))
+
+        found.reverse()
+        return found
+
+
+def _build_trie() -> PrefixTrie:
+    """ Build the prefix trie. Values are (prefix, prefix option, "name" or "symbol"). """
+    trie = PrefixTrie()
+    for option in ("metric", "binary"):
+        for prefix in get_prefixes(option):
+            trie.add(prefix.name, (prefix, option, "name"))
+            trie.add(prefix.symbol, (prefix, option, "symbol"))
+
+    return trie
+
+
+# Trie of metric and binary prefix names and symbols
+prefix_trie = _build_trie()
+
+# Prefix scales keyed by (option, supported), see get_scale
+_scales: dict[tuple[str, str | None], PrefixScale] = {}
@@ -2,29 +2,38 @@
 # https://www.github.com/emetophobe/unitconverter
 
 
+from collections.abc import Mapping
 from fractions import Fraction
 from typing import Self
 
+from unitconverter.exceptions import ConverterError
+from unitconverter.formatting import format_display_name
 from unitconverter.models.dimension import Dimension
 from unitconverter.utils import parse_fraction
 
 
 class Unit:
-    """ A unit can represent a single unit or a composite unit. """
+    """ A unit can represent a single unit or a composite unit.
+
+    Quantities are converted to the base unit using quantity * factor + offset.
+    Only absolute scales like celsius and fahrenheit have an offset, and units
+    with an offset can't be composited.
+    """
 
     def __init__(self,
-                 name: str | Dimension,
+                 name: str | Mapping[str, int | Fraction],
                  factor: Fraction | str | int,
                  dimension: str | Dimension,
                  symbols: list[str] | None = None,
                  aliases: list[str] | None = None,
-                 prefixes: str | None = None
+                 prefixes: str | None = None,
+                 offset: Fraction | str | int = 0
                  ) -> None:
         """ Create a new unit.
 
         Parameters
         ----------
-        name : str | Dimension
+        name : str | Mapping[str, int | Fraction]
             A unit name or a dictionary of unit names and exponents.
 
         factor : Fraction | str | int
@@ -41,18 +50,23 @@ class Unit:
 
         prefixes: str | None, optional
             If the unit supports metric or binary prefixes, by default None
+
+        offset : Fraction | str | int, optional
+            The base unit offset added after the factor is applied, by default 0
         """
-        self.units = Dimension(name)
+        self.units = _parse_units(name)
         self.factor = parse_fraction(factor)
         self.dimension = Dimension(dimension)
         self.symbols = symbols or []  # TODO: handle composite symbols
         self.aliases = aliases or []  # TODO: handle composite aliases
         self.prefixes = prefixes
+        self.offset = parse_fraction(offset)
+        self._name = format_display_name(list(self.units.items()))
 
     @property
     def name(self) -> str:
         """ Get the canonical unit name. """
-        return self.units.name
+        return self._name
 
     @property
     def names(self) -> list[str]:
@@ -62,7 +76,8 @@ class Unit:
     def __mul__(self, other: Self) -> Self:
         """ Multiply a unit with another unit. Returns a new unit. """
         if isinstance(other, Unit):
-            return self.__class__(self.units * other.units,
+            _check_offset(self, other)
+            return self.__class__(_combine_units(self.units, other.units, 1),
                                   self.factor * other.factor,
                                   self.dimension * other.dimension)
         return NotImplemented
@@ -70,7 +85,8 @@ class Unit:
     def __truediv__(self, other: Self) -> Self:
         """ Divide a unit with another unit. Returns a new unit. """
         if isinstance(other, Unit):
-            return self.__class__(self.units / other.units,
+            _check_offset(self, other)
+            return self.__class__(_combine_units(self.units, other.units, -1),
                                   self.factor / other.factor,
                                   self.dimension / other.dimension)
         return NotImplemented
@@ -81,7 +97,9 @@ class Unit:
             if exponent == 0:
                 raise ValueError("exponent must be a non-zero integer")
 
-            return self.__class__(self.units ** exponent,
+            _check_offset(self)
+
+            return self.__class__({name: value * exponent for name, value in self.units.items()},
                                   self.factor ** exponent,
                                   self.dimension ** exponent)
 
@@ -92,6 +110,7 @@ class Unit:
         return (isinstance(other, Unit)
                 and self.name == other.name
                 and self.factor == other.factor
+                and self.offset == other.offset
                 and self.dimension == other.dimension
                 and self.symbols == other.symbols
                 and self.aliases == other.aliases)
@@ -101,3 +120,36 @@ class Unit:
 
     def __str__(self) -> str:
         return self.name
+
+
+def _check_offset(*units: Unit) -> None:
+    """ Raise a ConverterError if any of the units have an offset. """
+    for unit in units:
+        if unit.offset:
+            raise ConverterError(f"{unit.name} has an offset and cannot be composited")
+
+
+def _parse_units(name: str | Mapping[str, int | Fraction]) -> dict[str, int | Fraction]:
+    """ Convert a unit name or mapping of unit names into a dictionary of exponents. """
+    if name is None:
+        return {}
+    elif isinstance(name, str) and name != "":
+        return {name: 1}
+    elif isinstance(name, Mapping):
+        return dict(name)
+    else:
+        raise TypeError(f"{name!r} is not a valid unit name")
+
+
+def _combine_units(first: dict[str, int | Fraction],
+                   second: dict[str, int | Fraction],
+                   sign: int
+                   ) -> dict[str, int | Fraction]:
+    """ Combine two dictionaries of unit exponents. Zero exponents are removed. """
+    units = first.copy()
+    for name, exponent in second.items():
+        units[name] = units.get(name, 0) + sign * exponent
+        if not units[name]:
+            del units[name]
+
+    return units
@@ -2,12 +2,15 @@
 # https://www.github.com/emetophobe/unitconverter
 
 
+import hashlib
 import json
 
 from fractions import Fraction
+from functools import partial
 from pathlib import Path
 
 from unitconverter.exceptions import ConverterError
+from unitconverter.models.dimension import Dimension
 from unitconverter.models.unit import Unit
 from unitconverter.parsers.unitparser import UnitParser
 from unitconverter.registry import Registry
@@ -16,6 +19,13 @@ from unitconverter.registry import Registry
 class FileParser:
     """ Load unit definitions into a unit registry. """
 
+    def __init__(self, path: Path | str = "data") -> None:
+        """ Create a file parser for the unit files in the specified directory. """
+        self.path = Path(path)
+
+        # The (mtime, size, hash, unit names) of each file loaded by this parser
+        self.files: dict[str, tuple[int, int, str, list[str]]] = {}
+
     def load_units(self, registry: Registry) -> None:
         """ Load pre-defined units into the specified registry.
             Clears any existing registry units.
@@ -24,10 +34,223 @@ class FileParser:
         if not isinstance(registry, Registry):
             raise TypeError(f"{registry!r} is not a valid unit registry")
 
-        path = Path("data")
+        files, alias_file = self._split_files()
+
+        # Clear existing units to avoid duplicates
+        registry.clear()
+        self.files.clear()
+
+        # Load unit files
+        for filename in files:
+            self._load_file(registry, filename)
+
+        # Load composite unit aliases
+        aliases = self._parse_json(alias_file, self.files)
+        parser = UnitParser(registry)
+
+        for alias, name in aliases.items():
+            unit = parser.parse_unit(name)
+            registry.add_alias(unit, alias)
+
+    def reload(self, registry: Registry) -> list[str]:
+        """ Reload the unit files that have changed since they were loaded by this parser.
+
+        Files are checked by modification time and size, and then by hash, so touching
+        a file doesn't reload it. The units of changed files are loaded into a copy of
+        the registry (checking for duplicates), the composite aliases are parsed again,
+        and the copy is swapped into the registry. Readers see either the old or the new
+        units, and the registry is unchanged if a file fails to load. Every file is
+        loaded if the registry wasn't loaded by this parser (i.e from a snapshot).
+
+        Parameters
+        ----------
+        registry : Registry
+            The unit registry
+
+        Returns
+        -------
+        list[str]
+            The names of the files that were added, changed, or removed
+        """
+
+        if not isinstance(registry, Registry):
+            raise TypeError(f"{registry!r} is not a valid unit registry")
+
+        registry.load_all()
+        files, alias_file = self._split_files()
+
+        if not self.files:
+            return self._reload_all(registry, files, alias_file)
+
+        names = {filename.name for filename in files}
+        changed = [filename for filename in files if self._is_changed(filename)]
+        removed = [name for name in self.files if name not in names and name != alias_file.name]
+        aliases_changed = self._is_changed(alias_file)
+
+        if not changed and not removed and not aliases_changed:
+            return []
+
+        state: dict[str, tuple[int, int, str, list[str]]] = {}
+        aliases = self._parse_json(alias_file, state)
+
+        # Remove the names defined by the old versions of the files, and every
+        # composite alias (they're parsed again because they may use changed units)
+        exclude = set(aliases)
+        for name in [filename.name for filename in changed] + removed + [alias_file.name]:
+            if name in self.files:
+                exclude.update(self.files[name][3])
+
+        staging = registry.copy(exclude)
+        for filename in changed:
+            self._load_file(staging, filename, state)
+
+        # Keep the alias instances that didn't change
+        parser = UnitParser(staging)
+        for alias, name in aliases.items():
+            unit = parser.parse_unit(name)
+            previous = registry.units.get(alias)
+            staging.add_alias(previous if previous == unit else unit, alias)
+
+        registry.swap(staging)
+
+        for name in removed:
+            del self.files[name]
+        self.files.update(state)
+
+        changed = [filename.name for filename in changed] + removed
+        if aliases_changed:
+            changed.append(alias_file.name)
+
+        return sorted(changed)
+
+    def load_index(self, registry: Registry, index: dict[str, dict]) -> None:
+        """ Lazily load units into the specified registry using an index of unit names.
+            Each unit file is only loaded when one of its units is first used (or when
+            the units of its dimension are listed). Clears any existing registry units.
+
+        Parameters
+        ----------
+        registry : Registry
+            The unit registry
+
+        index : dict[str, dict]
+            A dictionary of unit file names and their unit names and dimensions
+            (see build_index)
+        """
+
+        if not isinstance(registry, Registry):
+            raise TypeError(f"{registry!r} is not a valid unit registry")
+
+        registry.clear()
+
+        aliases: dict[str, str] = {}
+        parser = UnitParser(registry)
+
+        def load_alias(alias: str) -> None:
+            if not aliases:
+                aliases.update(self._parse_json(self.path / "aliases.json", self.files))
+            registry.add_alias(parser.parse_unit(aliases[alias]), alias)
 
-        files = list(path.glob("*.json"))
-        alias_file = path / "aliases.json"
+        for filename, entry in index.items():
+            if filename == "aliases.json":
+                dimensions = entry["dimensions"]
+                for alias in entry["names"]:
+                    registry.add_loader([alias], partial(load_alias, alias),
+                                        Dimension(dimensions[alias]))
+            else:
+                registry.add_loader(entry["names"],
+                                    partial(self._load_file, registry, self.path / filename),
+                                    Dimension(entry["dimension"]))
+
+    def build_index(self) -> dict[str, dict]:
+        """ Build an index of unit file names, the unit names (including symbols and
+            aliases) defined by each file, and the dimension of each file. Prefixed names
+            aren't included because the registry resolves them from the base unit names.
+            The dimension of each composite alias is found by lazily loading the files
+            it uses.
+        """
+        files, alias_file = self._split_files()
+        index = {}
+
+        for filename in files:
+            names = []
+            dimension = None
+            for name, args in self._parse_units(filename):
+                names.extend([name, *args.get("symbols", []), *args.get("aliases", [])])
+                dimension = args["dimension"]
+
+            index[filename.name] = {"names": names, "dimension": dict(Dimension(dimension))}
+
+        # Parse the aliases using only the files they need (with a separate parser
+        # so the files aren't tracked as loaded)
+        registry = Registry()
+        FileParser(self.path).load_index(registry, {**index, alias_file.name: {"names": [],
+                                                                              "dimensions": {}}})
+        parser = UnitParser(registry)
+
+        aliases = self._parse_json(alias_file)
+        index[alias_file.name] = {
+            "names": list(aliases),
+            "dimensions": {alias: dict(parser.parse_unit(name).dimension)
+                           for alias, name in aliases.items()}
+        }
+
+        return index
+
+    def get_files(self) -> list[Path]:
+        """ Get a sorted list of unit files (including the alias file). """
+        return sorted(self.path.glob("*.json"))
+
+    def get_hash(self) -> str:
+        """ Get a sha256 hash of the unit file names and contents. """
+        digest = hashlib.sha256()
+        for filename in self.get_files():
+            digest.update(filename.name.encode("utf-8"))
+            try:
+                digest.update(filename.read_bytes())
+            except OSError as e:
+                raise ConverterError(f"Failed to load units from {filename}", e.strerror)
+
+        return digest.hexdigest()
+
+    def _reload_all(self, registry: Registry, files: list[Path], alias_file: Path) -> list[str]:
+        """ Load every file into a new registry and swap it into the registry. """
+        staging = Registry()
+        try:
+            self.load_units(staging)
+        except ConverterError:
+            self.files.clear()
+            raise
+
+        registry.swap(staging)
+        return sorted(filename.name for filename in files + [alias_file])
+
+    def _is_changed(self, filename: Path) -> bool:
+        """ Check if a file has changed since it was loaded. New files have changed. """
+        state = self.files.get(filename.name)
+        if state is None:
+            return True
+
+        try:
+            stat = filename.stat()
+        except OSError as e:
+            raise ConverterError(f"Failed to load units from {filename}", e.strerror)
+
+        if (stat.st_mtime_ns, stat.st_size) == state[:2]:
+            return False
+
+        # The file was touched or rewritten, check if the contents changed
+        digest = hashlib.sha256(self._read_file(filename)).hexdigest()
+        if digest != state[2]:
+            return True
+
+        self.files[filename.name] = (stat.st_mtime_ns, stat.st_size, digest, state[3])
+        return False
+
+    def _split_files(self) -> tuple[list[Path], Path]:
+        """ Get the list of unit files and the alias file. """
+        files = self.get_files()
+        alias_file = self.path / "aliases.json"
 
         # Remove aliases from the rest of the files
         try:
@@ -36,51 +259,92 @@ class FileParser:
             raise ConverterError(f"Missing alias file '{alias_file}'")
 
         if not files:
-            raise ConverterError(f"No unit files found in '{path.absolute()}'")
+            raise ConverterError(f"No unit files found in '{self.path.absolute()}'")
 
-        # Clear existing units to avoid duplicates
-        registry.clear()
+        return files, alias_file
 
-        # Load unit files
-        for filename in files:
-            data = self._parse_json(filename)
+    def _load_file(self,
+                   registry: Registry,
+                   filename: Path,
+                   state: dict[str, tuple[int, int, str, list[str]]] | None = None
+                   ) -> None:
+        """ Load the units from a single unit file into the registry.
+            The file state is saved in state, by default the files attribute.
+        """
+        for name, args in self._parse_units(filename, self.files if state is None else state):
+            factor = args.get("factor", None)
+            if factor is None:
+                raise ConverterError(f"{name} is missing required factor")
 
-            # Remove dimension from the top of the unit file
-            dimension = data.pop("dimension", None)
-            if dimension is None:
-                raise ConverterError(f"{filename} is missing required dimension")
+            symbols = args.get("symbols", [])
+            aliases = args.get("aliases", [])
+            prefixes = args.get("prefix", None)
+            offset = args.get("offset", 0)
 
-            # Convert json dictionary to unit instances
-            for name, args in data.items():
-                factor = args.get("factor", None)
-                if factor is None:
-                    raise ConverterError(f"{name} is missing required factor")
+            # Create and register the unit
+            unit = Unit(name, factor, args["dimension"], symbols, aliases, prefixes, offset)
+            registry.add_unit(unit)
 
-                symbols = args.get("symbols", [])
-                aliases = args.get("aliases", [])
-                prefixes = args.get("prefix", None)
+    def _parse_units(self,
+                     filename: Path,
+                     state: dict[str, tuple[int, int, str, list[str]]] | None = None
+                     ) -> list[tuple[str, dict]]:
+        """ Parse a unit file into a list of unit names and arguments.
+            The file dimension is added to the arguments of each unit.
+        """
+        data = self._parse_json(filename, state)
 
-                # Create  and registerthe unit
-                unit = Unit(name, factor, dimension, symbols, aliases, prefixes)
-                registry.add_unit(unit)
+        # Remove dimension from the top of the unit file
+        dimension = data.pop("dimension", None)
+        if dimension is None:
+            raise ConverterError(f"{filename} is missing required dimension")
 
-        # Load composite unit aliases
-        aliases = self._parse_json(alias_file)
-        parser = UnitParser(registry)
+        return [(name, {**args, "dimension": dimension}) for name, args in data.items()]
 
-        for alias, name in aliases.items():
-            unit = parser.parse_unit(name)
-            registry.add_alias(unit, alias)
+    def _parse_json(self,
+                    filename: Path,
+                    state: dict[str, tuple[int, int, str, list[str]]] | None = None
+                    ) -> dict:
+        """ Parse a json file into a dictionary. If state is given, the modification
+            time, size, hash, and the names defined by the file are saved in it.
+        """
+        try:
+            stat = filename.stat()
+        except OSError as e:
+            raise ConverterError(f"Failed to load units from {filename}", e.strerror)
+
+        contents = self._read_file(filename)
 
-    def _parse_json(self, filename: Path) -> dict:
-        """ Parse a json file into a dictionary. """
         try:
-            with open(filename, "r", encoding="utf-8") as fp:
-                return json.load(fp, parse_float=Fraction)
+            data = json.loads(contents.decode("utf-8"), parse_float=Fraction)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            details = (f"{e.msg}: line {e.lineno} column {e.colno}"
+                       if isinstance(e, json.JSONDecodeError) else str(e))
+            raise ConverterError(f"Invalid json syntax in {filename}", details)
 
+        if state is not None:
+            state[filename.name] = (stat.st_mtime_ns, stat.st_size,
+                                    hashlib.sha256(contents).hexdigest(), _get_names(data))
+
+        return data
+
+    def _read_file(self, filename: Path) -> bytes:
+        """ Read the contents of a file. """
+        try:
+            return filename.read_bytes()
         except OSError as e:
             raise ConverterError(f"Failed to load units from {filename}", e.strerror)
 
-        except json.JSONDecodeError as e:
-            raise ConverterError(f"Invalid json syntax in {filename}",
-                                 f"{e.msg}: line {e.lineno} column {e.colno}")
+
+def _get_names(data: dict) -> list[str]:
+    """ Get the unit names, symbols, and aliases defined by a unit or alias file. """
+    names = []
+    for name, args in data.items():
+        if name == "dimension":
+            continue
+
+        names.append(name)
+        if isinstance(args, dict):
+            names.extend([*args.get("symbols", []), *args.get("aliases", [])])
+
+    return names
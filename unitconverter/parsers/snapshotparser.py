@@ -0,0 +1,154 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import json
+import logging
+
+from fractions import Fraction
+from pathlib import Path
+from typing import Any
+
+from unitconverter.exceptions import ConverterError
+from unitconverter.models.dimension import Dimension
+from unitconverter.models.unit import Unit
+from unitconverter.parsers.fileparser import FileParser
+from unitconverter.registry import Registry
+from unitconverter.utils import atomic_open, decode_fraction, encode_fraction
+
+
+# Bump the version whenever the snapshot layout changes
+SNAPSHOT_VERSION = 6
+
+
+class SnapshotParser:
+    """ Save and load a fully expanded unit registry using a compact json snapshot.
+
+    The snapshot stores every registered unit (including composite aliases) as plain
+    lists, along with a hash of the json unit files it was built from. Loading a
+    fresh snapshot is a single json document, so the unit files and composite aliases
+    don't have to be parsed. The snapshot only contains data (fractions are stored as
+    numerator and denominator pairs), so loading it can't run code.
+
+    Snapshots can also store the unit name index used for lazy loading.
+    """
+
+    def __init__(self,
+                 filename: Path | str = "data/registry.snapshot",
+                 digest: str | None = None
+                 ) -> None:
+        """ Create a snapshot parser.
+
+        Parameters
+        ----------
+        filename : Path | str, optional
+            The snapshot filename, by default "data/registry.snapshot"
+
+        digest : str | None, optional
+            Hash of the unit files, by default None (calculated from the data directory)
+        """
+        self.filename = Path(filename)
+        self.digest = digest
+
+    def load_units(self, registry: Registry) -> bool:
+        """ Load units from the snapshot into the specified registry.
+            Clears any existing registry units.
+
+        Returns
+        -------
+        bool
+            True if the snapshot was loaded, or False if it's missing or out of date
+        """
+        if not isinstance(registry, Registry):
+            raise TypeError(f"{registry!r} is not a valid unit registry")
+
+        snapshot = self._read("units")
+        if snapshot is None:
+            return False
+
+        registry.clear()
+
+        for units, factor, offset, dimension, symbols, aliases, prefixes, names in snapshot:
+            unit = Unit(dict(units), Fraction(*factor), Dimension(dict(dimension)),
+                        symbols, aliases, prefixes, Fraction(*offset))
+
+            for name in names:
+                registry.add_alias(unit, name)
+
+            registry.add_prefixes(unit)
+
+        return True
+
+    def save_units(self, registry: Registry) -> None:
+        """ Save the units from the specified registry into the snapshot. """
+        if not isinstance(registry, Registry):
+            raise TypeError(f"{registry!r} is not a valid unit registry")
+
+        # Group registered names by unit so shared references are preserved
+        records: dict[int, tuple[Unit, list[str]]] = {}
+        for name, unit in registry.units.items():
+            records.setdefault(id(unit), (unit, []))[1].append(name)
+
+        self._write("units", [(list(unit.units.items()),
+                               unit.factor.as_integer_ratio(),
+                               unit.offset.as_integer_ratio(),
+                               list(unit.dimension.items()),
+                               unit.symbols,
+                               unit.aliases,
+                               unit.prefixes,
+                               names)
+                              for unit, names in records.values()])
+
+    def load_index(self) -> dict[str, dict] | None:
+        """ Load an index of unit file names, unit names, and dimensions from the snapshot.
+            Returns None if the snapshot is missing or out of date.
+        """
+        return self._read("index")
+
+    def save_index(self, index: dict[str, dict]) -> None:
+        """ Save an index of unit file names, unit names, and dimensions into the snapshot. """
+        self._write("index", index)
+
+    def _read(self, kind: str) -> Any | None:
+        """ Read the snapshot data. Returns None if the snapshot is missing or out of date. """
+        try:
+            with open(self.filename, "rb") as fp:
+                snapshot = json.loads(fp.read(), object_hook=decode_fraction)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.debug("Failed to load snapshot %s (%s)", self.filename, e)
+            return None
+
+        if (not isinstance(snapshot, dict)
+                or snapshot.get("version") != SNAPSHOT_VERSION
+                or snapshot.get("kind") != kind
+                or snapshot.get("hash") != self._get_digest()):
+            logging.debug("Snapshot %s is out of date", self.filename)
+            return None
+
+        return snapshot["data"]
+
+    def _write(self, kind: str, data: Any) -> None:
+        """ Write the snapshot data along with the unit file hash. """
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "kind": kind,
+            "hash": self._get_digest(),
+            "data": data
+        }
+
+        try:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            data = json.dumps(snapshot, ensure_ascii=False, separators=(",", ":"),
+                              default=encode_fraction)
+            with atomic_open(self.filename) as fp:
+                fp.write(data.encode("utf-8"))
+        except OSError as e:
+            raise ConverterError(f"Failed to save snapshot {self.filename}", e.strerror)
+
+    def _get_digest(self) -> str:
+        """ Get the hash of the unit files. """
+        if self.digest is None:
+            self.digest = FileParser().get_hash()
+        return self.digest
@@ -4,13 +4,29 @@
 
 import re
 
+from fractions import Fraction
+
+from unitconverter import instrumentation
 from unitconverter.exceptions import ConverterError, InvalidUnitError
+from unitconverter.models.dimension import Dimension
 from unitconverter.models.unit import Unit
 from unitconverter.registry import Registry
+from unitconverter.utils import power_fraction
 
 
 class UnitParser:
-    """ Parse a unit string into a unit instance. """
+    """ Parse a unit string into a unit instance.
+
+    Unit names are tokenized in a single pass and parsed into a small syntax tree,
+    which is then folded into one composite unit. The grammar is:
+
+        expression := product ("/" product)*
+        product    := factor ("*" factor)*
+        factor     := (name | "(" expression ")") exponent?
+        exponent   := ("^" | "**")? number | ("^" | "**") "(" number ("/" number)? ")"
+
+    Division binds looser than multiplication, so "J/kg*K" is the same as "J/(kg*K)".
+    """
 
     def __init__(self, registry: Registry) -> None:
         """ Create a unit parser. """
@@ -40,121 +56,255 @@ class UnitParser:
         if not name or not isinstance(name, str):
             raise TypeError(f"{name!r} is not a valid unit name")
 
-        simple_name = self._simplify_unit(name)
+        timed = instrumentation.enabled
+        if timed:
+            start = instrumentation.start()
 
         # Check if the unit is in the registry
-        try:
-            return self.registry.get_unit(simple_name)
-        except InvalidUnitError:
-            pass
-
-        unit = None
-
-        # Parse units separated by division
-        if "/" in simple_name:
-            names = simple_name.split("/")
+        unit = self.registry.find_unit(name)
+        if timed:
+            start = instrumentation.record("parse.lookup", start)
 
-            # Get the units before the divisor
-            unit = self._multiply_units(names.pop(0))
+        if unit is not None:
+            return unit
 
-            # Get and divide the units after the divisor
-            for units in names:
-                unit /= self._multiply_units(units)
+        tokens = self._tokenize(name)
+        if timed:
+            start = instrumentation.record("parse.tokenize", start)
 
-        # Parse units separated by multiplication
-        elif "*" in simple_name:
-            unit = self._multiply_units(simple_name)
+        tree = _ExpressionParser(name, tokens).parse()
 
-        # Parse regular unit
-        else:
-            unit = self._parse_unit_name(simple_name)
+        # Flatten the syntax tree into a list of unit names and exponents
+        factors: list[tuple[str, int | Fraction]] = []
+        self._flatten(tree, 1, factors)
+        if timed:
+            start = instrumentation.record("parse.syntax", start)
 
-        if not unit or not unit.name:
-            raise InvalidUnitError(name)
+        unit = self._fold(name, factors)
+        if timed:
+            instrumentation.record("parse.fold", start)
 
         return unit
 
-    def _parse_unit_name(self, name: str) -> Unit:
-        """ Parse a unit string with potential exponent into a unit instance. """
-        name, exponent = self._split_exponent(name)
-        unit = self.registry.get_unit(name)
+    def _tokenize(self, name: str) -> list[tuple[str, str, int]]:
+        """ Split a unit name into a list of (kind, value, position) tokens. """
+        tokens = []
+        for match in self._token_pattern.finditer(name):
+            kind = match.lastgroup
+            value = match.group()
+
+            if kind == "space":
+                continue
+
+            if kind == "invalid":
+                raise InvalidUnitError(name, f"unexpected {value!r} at position {match.start()}")
+
+            if kind == "name" and self._spelling_pattern.search(value):
+                value = self._spelling_pattern.sub(self._replace_spelling, value)
+
+            elif kind == "superscript":
+                kind, value = "number", value.translate(self._superscripts)
+
+            tokens.append((kind, value, match.start()))
+
+        return tokens
+
+    def _flatten(self,
+                 node: tuple,
+                 exponent: int | Fraction,
+                 factors: list[tuple[str, int | Fraction]]
+                 ) -> None:
+        """ Flatten a syntax tree node into a list of unit names and exponents. """
+        kind = node[0]
+        if kind == "name":
+            factors.append((node[1], exponent))
+        elif kind == "pow":
+            self._flatten(node[1], exponent * node[2], factors)
+        elif kind == "mul":
+            self._flatten(node[1], exponent, factors)
+            self._flatten(node[2], exponent, factors)
+        else:
+            self._flatten(node[1], exponent, factors)
+            self._flatten(node[2], -exponent, factors)
 
-        if exponent == 1:
-            return unit
+    def _fold(self, name: str, factors: list[tuple[str, int | Fraction]]) -> Unit:
+        """ Fold a list of unit names and exponents into a single unit. """
+
+        # Plain unit names don't need a new unit
+        if len(factors) == 1 and factors[0][1] == 1:
+            return self.registry.get_unit(factors[0][0])
 
-        return unit ** exponent
+        units: dict[str, int | Fraction] = {}
+        dimension = Dimension()
+        factor = Fraction(1)
 
-    def _multiply_units(self, name: str) -> Unit:
-        """ Parse a unit string with multiplication symbol into a composite unit. """
-        units = None
-        for name in name.split("*"):
-            unit = self._parse_unit_name(name)
+        for unit_name, exponent in factors:
+            unit = self.registry.get_unit(unit_name)
 
-            # Check for temperature units which can't be composited
-            if (unit.dimension.name == "temperature" and not unit.name.endswith("kelvin")
-                    and not unit.name == "rankine"):
-                raise ConverterError(f"{unit.name} cannot be composited with other units"
-                                     " (only kelvin and rankine are currently supported)")
+            # Units with an offset (i.e celsius) can't be composited
+            if unit.offset:
+                raise ConverterError(f"{unit.name} has an offset and cannot be composited")
 
-            if units is None:
-                units = unit
+            if isinstance(exponent, int):
+                factor *= unit.factor ** exponent
             else:
-                units *= unit
+                try:
+                    factor *= power_fraction(unit.factor, exponent)
+                except ValueError as e:
+                    raise InvalidUnitError(name, str(e)) from None
 
-        if not units:
-            raise InvalidUnitError(name)
+            for key, value in unit.units.items():
+                units[key] = units.get(key, 0) + value * exponent
 
-        return units
+            dimension *= unit.dimension ** exponent
 
-    def _split_exponent(self, name: str) -> tuple[str, int]:
-        """ Split a unit name and exponent into a 2-tuple. """
-        result = self._pattern.match(self._simplify_unit(name))
-        if not result:
+        units = _remove_zeros(units)
+        if not units:
             raise InvalidUnitError(name)
 
-        if result.group("exp"):
-            return (result.group("unit"), int(result.group("exp")))
-        else:
-            return (result.group("unit"), 1)
-
-    def _simplify_unit(self, name: str) -> str:
-        """ Simplify a unit name by replacing strings orcharacters. """
-        for key, value in self._replacements.items():
-            if key in name:
-                name = name.replace(key, value)
-
-        return name
-
-    # Unit name and exponent patterns
-    _unit_pattern = r"(?P<unit>[a-zA-Z°Ωµ-]*[a-zA-Z°Ωµ ]+){1}"
-    _exp_pattern = r"[\^]?(?P<exp>[-+]?[0-9]+)?"
-    _pattern = re.compile(_unit_pattern + _exp_pattern)
-
-    # Dictionary of replacements for internal lookup
-    _replacements = {
-        # simplify exponents
-        "**": "",
-        "^": "",
-        "⁺": "",
-        "⁻": "-",
-        "⁰": "0",
-        "¹": "1",
-        "²": "2",
-        "³": "3",
-        "⁴": "4",
-        "⁵": "5",
-        "⁶": "6",
-        "⁷": "7",
-        "⁸": "8",
-        "⁹": "9",
-
-        # simplify multiplication
-        "⋅": "*",
-
-        # simplify division (convert "metre per second" to "metre/second")
-        " per ": "/",
-
-        # regional spelling (this is easier than adding additional aliases)
+        return Unit(units, factor, dimension)
+
+    def _replace_spelling(self, match: re.Match) -> str:
+        """ Replace regional spellings. """
+        return self._spellings[match.group()]
+
+    # Characters allowed in unit names (letters and a few symbols)
+    _name_char = r"(?:[^\W\d_⁰¹²³⁴⁵⁶⁷⁸⁹]|[°′″])"
+
+    # Token patterns (order matters)
+    _token_pattern = re.compile("|".join(f"(?P<{kind}>{pattern})" for kind, pattern in (
+        ("divide", r"/|\s+per\s+"),
+        ("name", rf"{_name_char}+(?:[ -]+(?!per\b){_name_char}+)*"),
+        ("number", r"[-+]?[0-9]+(?:\.[0-9]+)?"),
+        ("superscript", r"[⁺⁻]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+"),
+        ("power", r"\*\*|\^"),
+        ("multiply", r"[*⋅]"),
+        ("lparen", r"\("),
+        ("rparen", r"\)"),
+        ("space", r"\s+"),
+        ("invalid", r"."),
+    )))
+
+    # Translate superscript exponents into regular numbers
+    _superscripts = str.maketrans("⁺⁻⁰¹²³⁴⁵⁶⁷⁸⁹", "+-0123456789")
+
+    # Regional spellings (this is easier than adding additional aliases)
+    _spellings = {
         "meter": "metre",
         "liter": "litre",
     }
+
+    _spelling_pattern = re.compile("|".join(_spellings))
+
+
+class _ExpressionParser:
+    """ Recursive descent parser for tokenized unit names.
+
+    Syntax tree nodes are tuples:
+
+        ("name", name)
+        ("pow", node, exponent)
+        ("mul", left, right)
+        ("div", left, right)
+    """
+
+    def __init__(self, name: str, tokens: list[tuple[str, str, int]]) -> None:
+        self.name = name
+        self.tokens = tokens
+        self.index = 0
+
+    def parse(self) -> tuple:
+        """ Parse the tokens into a syntax tree. """
+        node = self._expression()
+        if self.index < len(self.tokens):
+            self._error("expected end of name")
+
+        return node
+
+    def _expression(self) -> tuple:
+        node = self._product()
+        while self._accept("divide"):
+            node = ("div", node, self._product())
+
+        return node
+
+    def _product(self) -> tuple:
+        node = self._factor()
+        while self._accept("multiply"):
+            node = ("mul", node, self._factor())
+
+        return node
+
+    def _factor(self) -> tuple:
+        if self._accept("lparen"):
+            node = self._expression()
+            self._expect("rparen")
+        else:
+            node = ("name", self._expect("name"))
+
+        if self._accept("power"):
+            if self._accept("lparen"):
+                exponent = self._number()
+                if self._accept("divide"):
+                    divisor = self._number()
+                    if not divisor:
+                        raise InvalidUnitError(self.name, "exponent divided by zero")
+                    exponent = _simplify_exponent(Fraction(exponent) / divisor)
+                self._expect("rparen")
+            else:
+                exponent = self._number()
+        elif self._peek() == "number":
+            exponent = self._number()
+        else:
+            return node
+
+        if not exponent:
+            raise InvalidUnitError(self.name, "exponent must be non-zero")
+
+        return ("pow", node, exponent)
+
+    def _number(self) -> int | Fraction:
+        value = self._expect("number")
+        if "." in value:
+            return _simplify_exponent(Fraction(value))
+
+        return int(value)
+
+    def _peek(self) -> str | None:
+        if self.index < len(self.tokens):
+            return self.tokens[self.index][0]
+
+        return None
+
+    def _accept(self, kind: str) -> bool:
+        if self._peek() == kind:
+            self.index += 1
+            return True
+
+        return False
+
+    def _expect(self, kind: str) -> str:
+        if self._peek() != kind:
+            self._error(f"expected {kind}")
+
+        value = self.tokens[self.index][1]
+        self.index += 1
+        return value
+
+    def _error(self, msg: str) -> None:
+        if self.index < len(self.tokens):
+            _, value, position = self.tokens[self.index]
+            raise InvalidUnitError(self.name, f"{msg}, found {value!r} at position {position}")
+
+        raise InvalidUnitError(self.name, f"{msg} at end of name")
+
+
+def _simplify_exponent(exponent: Fraction) -> int | Fraction:
+    """ Convert whole exponents to integers. """
+    return exponent.numerator if exponent.denominator == 1 else exponent
+
+
+def _remove_zeros(exponents: dict[str, int | Fraction]) -> dict[str, int | Fraction]:
+    """ Remove zero exponents and convert whole exponents to integers. """
+    return {key: _simplify_exponent(value) if isinstance(value, Fraction) else value
+            for key, value in exponents.items() if value}
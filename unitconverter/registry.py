@@ -2,13 +2,26 @@
 # https://www.github.com/emetophobe/unitconverter
 
 
+from collections.abc import Callable, Iterable
+
 from unitconverter.exceptions import DuplicateUnitError, InvalidUnitError
-from unitconverter.models.prefix import get_prefixes
+from unitconverter.models.dimension import Dimension
+from unitconverter.models.prefix import Prefix, get_prefixes, prefix_trie
 from unitconverter.models.unit import Unit
+from unitconverter.suggestions import SuggestionIndex, score
 
 
 class Registry:
-    """ The registry is used to store and retrieve pre-defined units. """
+    """ The registry is used to store and retrieve pre-defined units.
+
+    Prefixed units (i.e kilometre or km) aren't created up front. When a name isn't
+    found, known prefixes are split off using the prefix trie and the prefixed unit
+    is created from the base unit once and cached. Registered names always take
+    precedence over prefixed names.
+
+    The lookup tables are kept in a single tables object. Lookups use one reference
+    to it, so swap can replace every table at once (see swap).
+    """
 
     def __init__(self, units: list[Unit] | tuple[Unit, ...] = ()) -> None:
         """ Create a unit registry.
@@ -18,14 +31,47 @@ class Registry:
         units : list[Unit] | tuple[Unit, ...], optional
             A list or tuple of units, by default ()
         """
-        self.units: dict[str, Unit] = {}
+        self._tables = RegistryTables()
+
+        # Trigram index of the unit names, built by the first failed lookup (see suggest)
+        self._suggestions: SuggestionIndex | None = None
 
         for unit in units:
             self.add_unit(unit)
 
+    @property
+    def units(self) -> dict[str, Unit]:
+        """ The registered units, keyed by name, symbol, and alias. """
+        return self._tables.units
+
+    @property
+    def prefixable(self) -> dict[str, tuple[Unit, str]]:
+        """ Names that can be prefixed, and whether they're a unit name or a symbol. """
+        return self._tables.prefixable
+
+    @property
+    def prefixed(self) -> dict[str, Unit]:
+        """ Prefixed units that have been created so far. """
+        return self._tables.prefixed
+
+    @property
+    def pending(self) -> dict[str, tuple[Callable[[], None], tuple[str, ...]]]:
+        """ Unit names that haven't been loaded yet (see add_loader). """
+        return self._tables.pending
+
+    @property
+    def pending_dimensions(self) -> dict[Dimension | None, list[str]]:
+        """ The first name of each pending loader, by dimension (None if it isn't known). """
+        return self._tables.pending_dimensions
+
+    @property
+    def dimensions(self) -> dict[Dimension, dict[str, Unit]]:
+        """ Units of each dimension, keyed by unit name (each unit is only listed once). """
+        return self._tables.dimensions
+
     def add_unit(self, unit: Unit) -> None:
         """ Add a unit to the registry.
-            Also adds prefixed versions of the unit if the unit has a prefix setting.
+            Prefixed versions of the unit are available if the unit has a prefix setting.
         """
         validate_unit(unit)
 
@@ -33,14 +79,21 @@ class Registry:
         for name in unit.names:
             self.add_alias(unit, name)
 
-        # Register prefixed units if the unit has a list of prefixes
-        for prefix in get_prefixes(unit.prefixes):
-            factor = prefix.factor * unit.factor
-            name = prefix.name + unit.name
-            symbols = [prefix.symbol + symbol for symbol in unit.symbols]
-            aliases = [prefix.name + alias for alias in unit.aliases]
+        self.add_prefixes(unit)
 
-            self.add_unit(Unit(name, factor, unit.dimension, symbols, aliases))
+    def add_prefixes(self, unit: Unit) -> None:
+        """ Allow prefixed versions of the unit names and symbols to be found.
+            The prefixed units are only created when they're first used.
+        """
+        if not get_prefixes(validate_unit(unit).prefixes):
+            return
+
+        prefixable = self._tables.prefixable
+        for name in [unit.name] + unit.aliases:
+            prefixable[name] = (unit, "name")
+
+        for symbol in unit.symbols:
+            prefixable[symbol] = (unit, "symbol")
 
     def add_alias(self, unit: Unit, alias: str) -> None:
         """ Add a unit alias to the registry. """
@@ -48,22 +101,335 @@ class Registry:
         validate_alias(alias)
 
         # Check for duplicate aliases
-        if alias in self.units:
-            raise DuplicateUnitError(alias, self.units[alias].name)
+        tables = self._tables
+        if alias in tables.units:
+            raise DuplicateUnitError(alias, tables.units[alias].name)
+
+        if alias in tables.pending:
+            raise DuplicateUnitError(alias, alias)
 
         # Add the unit reference
-        self.units[alias] = unit
+        tables.units[alias] = unit
+        self._index_unit(unit, tables)
+        self._suggestions = None
+
+    def add_loader(self,
+                   names: list[str],
+                   loader: Callable[[], None],
+                   dimension: Dimension | None = None
+                   ) -> None:
+        """ Add a loader that registers the named units when one of them is first used.
+            The loader is called at most once and must add all of the names. If the
+            dimension of the units is given, listing the units of other dimensions
+            doesn't call the loader.
+        """
+        if not callable(loader):
+            raise TypeError(f"{loader!r} is not a valid unit loader")
+
+        names = tuple(validate_alias(name) for name in names)
+
+        tables = self._tables
+        for name in names:
+            if name in tables.units:
+                raise DuplicateUnitError(name, tables.units[name].name)
+
+            if name in tables.pending:
+                raise DuplicateUnitError(name, name)
+
+        for name in names:
+            tables.pending[name] = (loader, names)
+
+        if names:
+            tables.pending_dimensions.setdefault(dimension, []).append(names[0])
+
+        self._suggestions = None
+
+    def get_units(self, dimension: Dimension | str) -> list[Unit]:
+        """ Get the units with a dimension, or an empty list if there aren't any.
+            Pending units with the dimension (or an unknown dimension) are loaded
+            first. Prefixed units aren't included.
+
+        Parameters
+        ----------
+        dimension : Dimension | str
+            The dimension or its display name (i.e "length/time")
+
+        Returns
+        -------
+        list[Unit]
+            The units in the order they were added
+        """
+        if not isinstance(dimension, Dimension):
+            if not isinstance(dimension, str):
+                raise TypeError(f"{dimension!r} is not a valid dimension")
+            dimension = self.find_dimension(dimension)
+
+        if dimension is None:
+            return []
+
+        tables = self._tables
+        self._load_dimension(dimension, tables)
+        return list(tables.dimensions.get(dimension, {}).values())
+
+    def find_dimension(self, name: str) -> Dimension | None:
+        """ Get a dimension of the registry units by its display name (i.e "length/time").
+            Returns None if no units have the dimension.
+        """
+        tables = self._tables
+        self._load_dimension(None, tables)
+        for dimension in [*tables.dimensions, *tables.pending_dimensions]:
+            if dimension is not None and dimension.name == name:
+                return dimension
+
+        return None
+
+    def find_unit(self, name: str) -> Unit | None:
+        """ Get a unit by name, symbol, or alias. Returns None if the unit isn't defined. """
+        tables = self._tables
+        unit = tables.units.get(name)
+        if unit is None:
+            unit = tables.prefixed.get(name)
+            if unit is None:
+                unit = self._load_unit(name, tables)
+                if unit is None:
+                    unit = self._find_prefixed(name, tables)
+
+        return unit
+
+    def find_prefixable(self, name: str) -> tuple[Unit, str] | None:
+        """ Get the unit of a name that can be prefixed, and whether the name is a "name"
+            or "symbol". Returns None if the name isn't defined or can't be prefixed.
+        """
+        return self._find_prefixable(name, self._tables)
 
     def get_unit(self, name: str) -> Unit:
         """ Get a unit by name, symbol, or alias. """
-        try:
-            return self.units[name]
-        except KeyError:
-            raise InvalidUnitError(name) from None
+        unit = self.find_unit(name)
+        if unit is None:
+            raise InvalidUnitError(name, suggestions=self.suggest(name))
+
+        return unit
+
+    def suggest(self, name: str, limit: int = 3) -> list[str]:
+        """ Get the defined unit names that are most similar to a misspelled name.
+            Prefixed names are suggested when the prefix or the unit name is misspelled
+            (i.e "mililitre" or "kilomter").
+
+        Parameters
+        ----------
+        name : str
+            The misspelled unit name
+
+        limit : int, optional
+            Maximum number of suggestions, by default 3
+
+        Returns
+        -------
+        list[str]
+            The suggested names, most similar first
+        """
+        if not isinstance(name, str) or not name:
+            return []
+
+        tables = self._tables
+        index = self._suggestions
+        if index is None:
+            index = self._suggestions = SuggestionIndex(self._get_names())
+
+        results = index.search(name, limit)
+        candidates = set()
+
+        # Misspelled unit names with a known prefix (the candidates are scored below)
+        matches = prefix_trie.matches(name)
+        if matches:
+            prefixable = self._get_prefixable()
+            for length, prefixes in matches:
+                allowed = {(option, kind) for _, option, kind in prefixes}
+                bases = [base for base, option, kind in prefixable if (option, kind) in allowed]
+                for _, base in score(name[length:], bases, limit):
+                    candidates.add(name[:length] + base)
+
+        # Misspelled prefixes of known unit names
+        for _, base in results:
+            if len(base) < len(name) and name.endswith(base):
+                entry = self._find_prefixable(base, tables)
+                if entry is None:
+                    continue
+
+                unit, kind = entry
+                prefixes = [prefix.name if kind == "name" else prefix.symbol
+                            for prefix in get_prefixes(unit.prefixes)]
+                for _, prefix in score(name[:-len(base)], prefixes, 1):
+                    candidates.add(prefix + base)
+
+        results += score(name, candidates.difference(candidate for _, candidate in results))
+        results.sort(key=lambda result: (-result[0], result[1]))
+        return [candidate for _, candidate in results[:limit]]
+
+    def load_all(self) -> None:
+        """ Load every pending unit (see add_loader). """
+        tables = self._tables
+        while tables.pending:
+            self._load_unit(next(iter(tables.pending)), tables)
+
+        tables.pending_dimensions.clear()
+
+    def copy(self, exclude: Iterable[str] = ()) -> "Registry":
+        """ Create a registry with the same units, except for the excluded names.
+            Unit instances are shared. Pending and prefixed units aren't copied.
+        """
+        exclude = set(exclude)
+        tables = self._tables
+        registry = Registry()
+        copied = registry._tables
+        copied.units = {name: unit for name, unit in tables.units.items() if name not in exclude}
+        copied.prefixable = {name: entry for name, entry in tables.prefixable.items()
+                             if name not in exclude}
+
+        for unit in copied.units.values():
+            registry._index_unit(unit, copied)
+
+        return registry
+
+    def swap(self, registry: "Registry") -> None:
+        """ Replace the units with the units of another registry. Every table is replaced
+            by a single assignment of the tables object, and each lookup only uses one
+            reference to it, so readers never see a partially swapped registry. The
+            other registry shouldn't be used afterwards.
+        """
+        if not isinstance(registry, Registry):
+            raise TypeError(f"{registry!r} is not a valid unit registry")
+
+        self._tables = registry._tables
+        self._suggestions = None
 
     def clear(self) -> None:
         """ Clear the unit registry. """
-        self.units.clear()
+        self._tables = RegistryTables()
+        self._suggestions = None
+
+    def _get_names(self) -> list[str]:
+        """ Get every registered and pending unit name. Prefixed names aren't included. """
+        tables = self._tables
+        return [*tables.units, *tables.pending]
+
+    def _get_prefixable(self) -> list[tuple[str, str, str]]:
+        """ Get the (name, prefix option, "name" or "symbol") of every loaded name
+            that can be prefixed.
+        """
+        return [(name, unit.prefixes, kind)
+                for name, (unit, kind) in self._tables.prefixable.items()]
+
+    def _index_unit(self, unit: Unit, tables: "RegistryTables") -> None:
+        """ Add a unit to the dimension index. """
+        units = tables.dimensions.get(unit.dimension)
+        if units is None:
+            tables.dimensions[unit.dimension] = {unit.name: unit}
+        elif unit.name not in units:
+            units[unit.name] = unit
+
+    def _load_dimension(self, dimension: Dimension | None, tables: "RegistryTables") -> None:
+        """ Run the pending loaders of a dimension, and the loaders without a dimension. """
+        for key in {dimension, None}:
+            names = tables.pending_dimensions.get(key)
+            while names:
+                if names[-1] in tables.pending:
+                    self._load_unit(names[-1], tables)
+                names.pop()
+
+            tables.pending_dimensions.pop(key, None)
+
+    def _load_unit(self, name: str, tables: "RegistryTables") -> Unit | None:
+        """ Run the pending loader for a unit name. Returns None if there isn't one. """
+        if name not in tables.pending:
+            return None
+
+        # The names must not be pending while the loader adds them
+        loader, names = tables.pending[name]
+        for key in names:
+            del tables.pending[key]
+
+        try:
+            loader()
+        except BaseException:
+            # Remove the units that were added and keep the names pending, so the
+            # next lookup runs the loader again (and raises the same error)
+            self._discard(names, tables)
+            for key in names:
+                tables.pending[key] = (loader, names)
+            raise
+
+        return tables.units.get(name)
+
+    def _discard(self, names: tuple[str, ...], tables: "RegistryTables") -> None:
+        """ Remove the units registered under a list of names. """
+        for key in names:
+            unit = tables.units.pop(key, None)
+            tables.prefixable.pop(key, None)
+            if unit is None:
+                continue
+
+            units = tables.dimensions.get(unit.dimension)
+            if units is not None and units.get(unit.name) is unit:
+                del units[unit.name]
+                if not units:
+                    del tables.dimensions[unit.dimension]
+
+        self._suggestions = None
+
+    def _find_prefixable(self, name: str, tables: "RegistryTables") -> tuple[Unit, str] | None:
+        """ Get the unit for a name that can be prefixed, and whether it's a name or symbol. """
+        entry = tables.prefixable.get(name)
+        if entry is None and name in tables.pending:
+            self._load_unit(name, tables)
+            entry = tables.prefixable.get(name)
+
+        return entry
+
+    def _find_prefixed(self, name: str, tables: "RegistryTables") -> Unit | None:
+        """ Split a known prefix off the name and create the prefixed unit. """
+        if not isinstance(name, str):
+            return None
+
+        for length, matches in prefix_trie.matches(name):
+            entry = self._find_prefixable(name[length:], tables)
+            if entry is None:
+                continue
+
+            unit, kind = entry
+            for prefix, option, prefix_kind in matches:
+                if option == unit.prefixes and prefix_kind == kind:
+                    return self._add_prefixed(unit, prefix, tables)
+
+        return None
+
+    def _add_prefixed(self, unit: Unit, prefix: Prefix, tables: "RegistryTables") -> Unit:
+        """ Create a prefixed unit and cache it under all of its names. """
+        factor = prefix.factor * unit.factor
+        name = prefix.name + unit.name
+        symbols = [prefix.symbol + symbol for symbol in unit.symbols]
+        aliases = [prefix.name + alias for alias in unit.aliases]
+
+        prefixed = Unit(name, factor, unit.dimension, symbols, aliases, offset=unit.offset)
+        for name in prefixed.names:
+            tables.prefixed.setdefault(name, prefixed)
+
+        return prefixed
+
+
+class RegistryTables:
+    """ The lookup tables of a registry. Registry.swap replaces all of them at once. """
+
+    __slots__ = ("units", "prefixable", "prefixed", "pending", "pending_dimensions",
+                 "dimensions")
+
+    def __init__(self) -> None:
+        self.units: dict[str, Unit] = {}
+        self.prefixable: dict[str, tuple[Unit, str]] = {}
+        self.prefixed: dict[str, Unit] = {}
+        self.pending: dict[str, tuple[Callable[[], None], tuple[str, ...]]] = {}
+        self.pending_dimensions: dict[Dimension | None, list[str]] = {}
+        self.dimensions: dict[Dimension, dict[str, Unit]] = {}
 
 
 def validate_unit(unit: Unit) -> Unit:
@@ -0,0 +1,272 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import re
+
+from collections.abc import Iterable, Iterator
+from fractions import Fraction
+from typing import IO
+
+from unitconverter.converter import UnitConverter
+from unitconverter.exceptions import ConverterError
+from unitconverter.models.dimension import Dimension
+from unitconverter.models.prefix import binary_prefixes, get_prefixes, metric_prefixes
+from unitconverter.models.unit import Unit
+from unitconverter.parsers.unitparser import UnitParser
+
+
+class QuantityMatch:
+    """ A quantity and unit found in text (i.e "3.5 kg"). """
+
+    __slots__ = ("start", "end", "text", "quantity", "unit", "target", "result")
+
+    def __init__(self,
+                 start: int,
+                 end: int,
+                 text: str,
+                 quantity: Fraction,
+                 unit: Unit,
+                 target: str | None = None,
+                 result: Fraction | None = None
+                 ) -> None:
+        self.start = start
+        self.end = end
+        self.text = text
+        self.quantity = quantity
+        self.unit = unit
+        self.target = target
+        self.result = result
+
+    @property
+    def span(self) -> tuple[int, int]:
+        """ Get the (start, end) offsets of the match. """
+        return self.start, self.end
+
+    def __repr__(self) -> str:
+        converted = f", {self.result} {self.target}" if self.target is not None else ""
+        return f"QuantityMatch({self.span}, {self.quantity}, {self.unit.name}{converted})"
+
+
+class QuantityScanner:
+    """ Find quantities with units in free text.
+
+    Every unit name, symbol, and alias in the registry (and every prefixed form) is
+    compiled into a single regular expression. The names are stored as a trie, so the
+    pattern only branches where names actually differ, and the whole text is scanned
+    in one pass. Numbers can use thousands separators and e notation. Units can have
+    superscript or ^ exponents, and can be multiplied or divided without spaces
+    (i.e "12 ft²" or "9.8 m/s^2"). Unit names are case sensitive.
+
+        >>> scanner = QuantityScanner(UnitConverter())
+        >>> [match.text for match in scanner.scan("Weighs 3.5 kg, 70 °F and 12 ft²")]
+        ['3.5 kg', '70 °F', '12 ft²']
+    """
+
+    def __init__(self, converter: UnitConverter, exclude: Iterable[str] = ()) -> None:
+        """ Create a quantity scanner.
+
+        Parameters
+        ----------
+        converter : UnitConverter
+            The unit converter
+
+        exclude : Iterable[str], optional
+            Unit names that shouldn't be matched, i.e common words like "in" or "a",
+            by default ()
+        """
+        if not isinstance(converter, UnitConverter):
+            raise TypeError(f"{converter!r} is not a valid unit converter")
+
+        self.converter = converter
+        self.exclude = set(exclude)
+        self.pattern = self._compile()
+
+        # Parsed units of the matched names
+        self._units: dict[str, Unit | None] = {}
+
+    def scan(self, text: str, targets: Iterable[str] | None = None) -> Iterator[QuantityMatch]:
+        """ Find the quantities in a string.
+
+        Parameters
+        ----------
+        text : str
+            The text to scan
+
+        targets : Iterable[str] | None, optional
+            Convert quantities to these units (one per dimension, i.e ["m", "kg", "degC"]).
+            Quantities with other dimensions aren't converted. By default None
+
+        Yields
+        ------
+        QuantityMatch
+            The matches in the order they appear
+        """
+        yield from self._scan(text, 0, len(text), 0, self._get_targets(targets))
+
+    def scan_file(self,
+                  fp: IO[str],
+                  targets: Iterable[str] | None = None,
+                  chunk_size: int = 1 << 16
+                  ) -> Iterator[QuantityMatch]:
+        """ Find the quantities in a text file, reading chunk_size characters at a time.
+            The offsets of the matches are relative to the start of the file.
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("chunk size must be a positive integer")
+
+        targets = self._get_targets(targets)
+
+        # Matches that start in the last part of a chunk might continue in the next one
+        margin = max(1024, self._longest * 4)
+        buffer = ""
+        offset = 0  # file offset of the buffer
+        position = 0
+
+        while True:
+            chunk = fp.read(chunk_size)
+            buffer += chunk
+
+            end = len(buffer) if not chunk else max(position, len(buffer) - margin)
+            for match in self._scan(buffer, position, end, offset, targets):
+                position = match.end - offset
+                yield match
+
+            if not chunk:
+                return
+
+            # Keep one character before the next position for the number lookbehind
+            position = max(position, end)
+            keep = max(position - 1, 0)
+            buffer = buffer[keep:]
+            offset += keep
+            position -= keep
+
+    def _scan(self,
+              text: str,
+              start: int,
+              end: int,
+              offset: int,
+              targets: dict[Dimension, str]
+              ) -> Iterator[QuantityMatch]:
+        """ Find the quantities that start between start and end. """
+        for match in self.pattern.finditer(text, start):
+            if match.start() >= end:
+                return
+
+            number, name = match.group("number", "unit")
+            unit = self._get_unit(name)
+            if unit is None:
+                continue
+
+            quantity = Fraction(number.replace(",", "").replace("−", "-"))
+
+            target = result = None
+            if targets:
+                target = targets.get(unit.dimension)
+                if target is not None:
+                    result = self.converter.get_conversion(name, target).convert(quantity)
+
+            yield QuantityMatch(match.start() + offset, match.end() + offset, match.group(),
+                                quantity, unit, target, result)
+
+    def _get_unit(self, name: str) -> Unit | None:
+        """ Get the unit of a matched name, or None if it isn't valid. """
+        try:
+            return self._units[name]
+        except KeyError:
+            pass
+
+        try:
+            unit = self.converter.parser.parse_unit(name)
+        except (ConverterError, TypeError):
+            unit = None
+
+        self._units[name] = unit
+        return unit
+
+    def _get_targets(self, targets: Iterable[str] | None) -> dict[Dimension, str]:
+        """ Get the target unit of each dimension. """
+        if targets is None:
+            return {}
+
+        if isinstance(targets, str):
+            targets = [targets]
+
+        parser = self.converter.parser
+        return {parser.parse_unit(target).dimension: target for target in targets}
+
+    def _compile(self) -> re.Pattern:
+        """ Compile the unit names into a single pattern. """
+        registry = self.converter.registry
+        registry.load_all()
+
+        names = set(registry.units)
+        prefixable_names = set()
+        prefixable_symbols = set()
+
+        for name, unit in registry.units.items():
+            if get_prefixes(unit.prefixes):
+                if name in unit.symbols:
+                    prefixable_symbols.add(name)
+                else:
+                    prefixable_names.add(name)
+
+        # Regional spellings are replaced by the unit parser
+        for group in (names, prefixable_names):
+            for name in list(group):
+                for spelling, replacement in UnitParser._spellings.items():
+                    if replacement in name:
+                        group.add(name.replace(replacement, spelling))
+
+        names -= self.exclude
+        prefixable_names -= self.exclude
+        prefixable_symbols -= self.exclude
+
+        prefixes = metric_prefixes + binary_prefixes
+        self._longest = max(map(len, names)) + max(len(prefix.name) for prefix in prefixes)
+
+        # Registered names first, they take precedence over prefixed names
+        units = "|".join(pattern for pattern in (
+            _trie_pattern(names),
+            _trie_pattern({prefix.name for prefix in prefixes}) + _trie_pattern(prefixable_names),
+            _trie_pattern({prefix.symbol for prefix in prefixes}) + _trie_pattern(prefixable_symbols),
+        ) if pattern)
+
+        number = r"[-+−]?(?:[0-9]{1,3}(?:,[0-9]{3})+|[0-9]+)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?"
+        exponent = r"(?:[⁺⁻]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+|\^[-+]?[0-9]+)?"
+        unit = f"(?:{units}){exponent}"
+
+        return re.compile(rf"(?<![\w.,])(?P<number>{number})[ \u00a0\u202f]?"
+                          rf"(?P<unit>{unit}(?:[/*⋅]{unit})*)(?!\w)")
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """ Create a regular expression that matches any of the words. The words are stored
+        in a trie, so the pattern only branches where words differ. Longer words are
+        tried first.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    return _node_pattern(trie) if trie else ""
+
+
+def _node_pattern(node: dict) -> str:
+    """ Create the pattern of a trie node. """
+    optional = "" in node
+    branches = [re.escape(char) + _node_pattern(child)
+                for char, child in sorted(node.items()) if char]
+
+    if not branches:
+        return ""
+
+    if len(branches) == 1 and not optional:
+        return branches[0]
+
+    pattern = f"(?:{"|".join(branches)})"
+    return pattern + "?" if optional else pattern
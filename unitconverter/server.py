@@ -0,0 +1,316 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import asyncio
+import json
+import logging
+import math
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from http import HTTPStatus
+from typing import Any
+
+from unitconverter.converter import UnitConverter
+from unitconverter.exceptions import ConverterError
+from unitconverter.formatting import format_quantity
+from unitconverter.streaming import parse_quantity
+
+
+# Optional formatting arguments accepted by the conversion endpoints
+FORMAT_ARGUMENTS = ("precision", "normalize", "fraction", "exponent", "separators")
+
+
+class HTTPError(Exception):
+    """ Raised when a request can't be handled. """
+
+    def __init__(self, status: HTTPStatus, msg: str | None = None) -> None:
+        super().__init__(msg or status.phrase)
+        self.status = status
+
+
+class ConversionServer:
+    """ A small asyncio HTTP/JSON server that answers conversion requests.
+
+    One unit converter is shared by every connection, so the registry and the
+    conversion cache stay warm. Connections are kept alive and pipelined requests
+    are answered in order. Large batches are converted in a thread executor so the
+    event loop can keep serving other connections (the threads share the converter,
+    so process executors aren't supported).
+
+    Endpoints:
+
+        GET  /health    {"status": "ok"}
+        POST /convert   {"quantity": "1", "source": "foot", "target": "inch"}
+        POST /batch     {"conversions": [{"quantity": ..., "source": ..., "target": ...}, ...]}
+
+    Conversions can also set "exact" (false for float results) and any of the
+    formatting arguments (precision, normalize, fraction, exponent, separators).
+    """
+
+    def __init__(self,
+                 converter: UnitConverter | None = None,
+                 host: str = "127.0.0.1",
+                 port: int = 8000,
+                 executor: Executor | None = None,
+                 batch_threshold: int = 64,
+                 max_body_size: int = 1 << 20,
+                 timeout: float = 15
+                 ) -> None:
+        """ Create a conversion server.
+
+        Parameters
+        ----------
+        converter : UnitConverter | None, optional
+            The shared unit converter, by default None (create a new converter)
+
+        host : str, optional
+            The host address, by default "127.0.0.1"
+
+        port : int, optional
+            The port number, by default 8000 (0 picks a free port)
+
+        executor : Executor | None, optional
+            Thread executor used to convert large batches, by default None (the loop's
+            default executor). The batches use the shared converter, so a
+            ProcessPoolExecutor raises a TypeError.
+
+        batch_threshold : int, optional
+            Batches with more conversions than this are run in the executor, by default 64
+
+        max_body_size : int, optional
+            Maximum request body size in bytes, by default 1 MiB
+
+        timeout : float, optional
+            Seconds to wait for the next request on an idle connection, by default 15
+        """
+        if executor is not None and (not isinstance(executor, Executor)
+                                     or isinstance(executor, ProcessPoolExecutor)):
+            raise TypeError(f"{executor!r} is not a valid thread executor")
+
+        self.converter = converter or UnitConverter()
+        self.host = host
+        self.port = port
+        self.executor = executor
+        self.batch_threshold = batch_threshold
+        self.max_body_size = max_body_size
+        self.timeout = timeout
+        self.server: asyncio.Server | None = None
+
+    async def start(self) -> asyncio.Server:
+        """ Start listening for connections. Sets the port if it was 0. """
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        logging.debug("Listening on %s:%s", self.host, self.port)
+        return self.server
+
+    async def serve_forever(self) -> None:
+        """ Start the server and serve connections until cancelled. """
+        server = self.server or await self.start()
+        async with server:
+            await server.serve_forever()
+
+    async def close(self) -> None:
+        """ Stop the server. """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def handle_connection(self,
+                                reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter
+                                ) -> None:
+        """ Answer requests on a connection until it's closed or times out. """
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), self.timeout)
+                except (TimeoutError, asyncio.IncompleteReadError):
+                    break
+                except HTTPError as e:
+                    self._write_response(writer, e.status, {"error": str(e)}, False)
+                    break
+
+                if request is None:
+                    break
+
+                method, path, body, keep_alive = request
+                try:
+                    status, data = HTTPStatus.OK, await self.handle_request(method, path, body)
+                except HTTPError as e:
+                    status, data = e.status, {"error": str(e)}
+
+                self._write_response(writer, status, data, keep_alive)
+                await writer.drain()
+
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def handle_request(self, method: str, path: str, body: bytes) -> Any:
+        """ Handle a request and return the json response data. """
+        path = path.partition("?")[0]
+
+        if path == "/health":
+            if method != "GET":
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            return {"status": "ok"}
+
+        if path not in ("/convert", "/batch"):
+            raise HTTPError(HTTPStatus.NOT_FOUND)
+
+        if method != "POST":
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+        try:
+            data = json.loads(body)
+        except (UnicodeDecodeError, json.JSONDecodeError, RecursionError) as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid json: {e}") from None
+
+        if path == "/convert":
+            if not isinstance(data, dict):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Expected a json object")
+
+            try:
+                return convert_request(self.converter, data)
+            except (ConverterError, TypeError, ValueError, ZeroDivisionError, RecursionError) as e:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, str(e)) from None
+
+        conversions = data.get("conversions") if isinstance(data, dict) else None
+        if not isinstance(conversions, list):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Expected a list of conversions")
+
+        # Run large batches in the executor so other connections aren't blocked
+        if len(conversions) > self.batch_threshold:
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(self.executor, convert_batch,
+                                                 self.converter, conversions)
+        else:
+            results = convert_batch(self.converter, conversions)
+
+        return {"results": results}
+
+    async def _read_request(self,
+                            reader: asyncio.StreamReader
+                            ) -> tuple[str, str, bytes, bool] | None:
+        """ Read the next request. Returns (method, path, body, keep_alive),
+            or None if the connection was closed.
+        """
+        line = await reader.readline()
+        if not line.strip():
+            return None
+
+        try:
+            method, path, version = line.decode("latin-1").split()
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid request line") from None
+
+        if version not in ("HTTP/1.0", "HTTP/1.1"):
+            raise HTTPError(HTTPStatus.HTTP_VERSION_NOT_SUPPORTED)
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if "transfer-encoding" in headers:
+            raise HTTPError(HTTPStatus.NOT_IMPLEMENTED, "Chunked requests are not supported")
+
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid content length") from None
+
+        if length < 0 or length > self.max_body_size:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+
+        body = await reader.readexactly(length) if length else b""
+
+        # HTTP/1.1 connections are persistent unless the client closes them
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            keep_alive = connection != "close"
+        else:
+            keep_alive = connection == "keep-alive"
+
+        return method.upper(), path, body, keep_alive
+
+    def _write_response(self,
+                        writer: asyncio.StreamWriter,
+                        status: HTTPStatus,
+                        data: Any,
+                        keep_alive: bool
+                        ) -> None:
+        """ Write a json response. Data that isn't valid json (i.e nan) is a bad request. """
+        try:
+            body = json.dumps(data, ensure_ascii=False, allow_nan=False).encode("utf-8")
+        except ValueError as e:
+            status = HTTPStatus.BAD_REQUEST
+            body = json.dumps({"error": f"Invalid json response: {e}"}).encode("utf-8")
+        writer.write((f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                      "Content-Type: application/json\r\n"
+                      f"Content-Length: {len(body)}\r\n"
+                      f"Connection: {"keep-alive" if keep_alive else "close"}\r\n"
+                      "\r\n").encode("latin-1") + body)
+
+
+def convert_request(converter: UnitConverter, request: dict) -> dict:
+    """ Convert a single request object and return the response object.
+
+    Exact results are formatted as strings (using the formatting arguments)
+    so they don't lose precision. Float results are returned as json numbers,
+    so results that aren't finite (nan and infinity) raise a ValueError.
+    """
+    if not isinstance(request, dict):
+        raise TypeError(f"{request!r} is not a valid conversion")
+
+    source = request.get("source")
+    target = request.get("target")
+    quantity = request.get("quantity")
+    exact = request.get("exact", converter.exact)
+    if not isinstance(exact, bool):
+        raise TypeError(f"{exact!r} is not a valid exact value (expected true or false)")
+
+    if not exact:
+        result = converter.convert(quantity, source, target, exact=False)
+        if not math.isfinite(result):
+            raise ValueError(f"{result} is not a valid json number")
+    else:
+        result = converter.convert(parse_quantity(quantity), source, target, exact=True)
+        options = {key: request[key] for key in FORMAT_ARGUMENTS if key in request}
+        result = format_quantity(result, **options)
+
+    return {"quantity": quantity, "source": source, "target": target, "result": result}
+
+
+def convert_batch(converter: UnitConverter, requests: list) -> list[dict]:
+    """ Convert a list of request objects. Failed conversions return an error object. """
+    results = []
+    for request in requests:
+        try:
+            results.append(convert_request(converter, request))
+        except (ConverterError, TypeError, ValueError, ZeroDivisionError, RecursionError) as e:
+            results.append({"error": str(e)})
+
+    return results
+
+
+def serve(host: str = "127.0.0.1", port: int = 8000, **kwargs: Any) -> None:
+    """ Run a conversion server until interrupted. """
+    server = ConversionServer(host=host, port=port, **kwargs)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
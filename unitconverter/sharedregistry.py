@@ -0,0 +1,322 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import json
+import logging
+import mmap
+import struct
+
+from collections.abc import Callable
+from fractions import Fraction
+from pathlib import Path
+
+from unitconverter.exceptions import ConverterError
+from unitconverter.models.dimension import Dimension
+from unitconverter.models.prefix import get_prefixes
+from unitconverter.models.unit import Unit
+from unitconverter.parsers.fileparser import FileParser
+from unitconverter.registry import Registry, RegistryTables
+from unitconverter.utils import atomic_open, decode_fraction, encode_fraction
+
+
+# Bump the version whenever the file layout changes
+SHARED_VERSION = 3
+
+# File layout (all integers are little endian):
+#
+#   header      magic, version, unit file hash, name count, names offset,
+#               record count, records offset
+#   names       (name offset, name length, record index) sorted by name
+#   records     (data offset, data length) for each unit
+#   data        utf-8 names followed by utf-8 json unit records
+_header = struct.Struct("<4sI64sIIII")
+_name_entry = struct.Struct("<III")
+_record_entry = struct.Struct("<II")
+
+_magic = b"UCSR"
+
+
+class SharedRegistry(Registry):
+    """ A read-only unit registry backed by a memory-mapped file.
+
+    The registry is written to a compact binary file once (see build),
+    and any number of processes can attach to it. The file is mapped read-only, so
+    the operating system shares the same pages between every process. Unit names are
+    found using a binary search of the mapped name table, and only the units that are
+    actually used are turned into unit objects (and cached by the process). Prefixed
+    names are resolved from their base units like a regular registry.
+    """
+
+    def __init__(self, filename: Path | str = "data/registry.shared") -> None:
+        """ Attach to a shared registry file.
+
+        Parameters
+        ----------
+        filename : Path | str, optional
+            The shared registry filename, by default "data/registry.shared"
+        """
+        super().__init__()
+        self.filename = Path(filename)
+
+        try:
+            with open(self.filename, "rb") as fp:
+                self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise ConverterError(f"Failed to open shared registry {self.filename}", str(e))
+
+        try:
+            (magic, version, digest, self._name_count, self._names_offset,
+             self._record_count, self._records_offset) = _header.unpack_from(self._map)
+        except struct.error:
+            magic, version = None, None
+
+        if magic != _magic or version != SHARED_VERSION:
+            self._map.close()
+            raise ConverterError(f"{self.filename} is not a valid shared registry")
+
+        self.digest = digest.decode("ascii")
+
+        # Units that have been loaded by this process, indexed by record
+        self._records: dict[int, Unit] = {}
+
+        # Names that can be prefixed, found by the first failed lookup (see suggest)
+        self._prefixable: list[tuple[str, str, str]] | None = None
+
+    @classmethod
+    def load(cls,
+             filename: Path | str = "data/registry.shared",
+             digest: str | None = None
+             ) -> "SharedRegistry":
+        """ Attach to a shared registry file. The file is rebuilt from the unit files
+            if it's missing or out of date.
+        """
+        if digest is None:
+            digest = FileParser().get_hash()
+
+        try:
+            registry = cls(filename)
+        except ConverterError as e:
+            logging.debug("Rebuilding shared registry (%s)", e)
+        else:
+            if registry.digest == digest:
+                return registry
+
+            registry.close()
+            logging.debug("Shared registry %s is out of date", filename)
+
+        source = Registry()
+        FileParser().load_units(source)
+        cls.build(source, filename, digest)
+        return cls(filename)
+
+    @staticmethod
+    def build(registry: Registry,
+              filename: Path | str = "data/registry.shared",
+              digest: str | None = None
+              ) -> None:
+        """ Write the units from a registry into a shared registry file.
+
+        Parameters
+        ----------
+        registry : Registry
+            The source registry
+
+        filename : Path | str, optional
+            The shared registry filename, by default "data/registry.shared"
+
+        digest : str | None, optional
+            Hash of the unit files, by default None (calculated from the data directory)
+        """
+        if not isinstance(registry, Registry):
+            raise TypeError(f"{registry!r} is not a valid unit registry")
+
+        if digest is None:
+            digest = FileParser().get_hash()
+
+        # Store each unit once, shared by all of its names
+        indexes: dict[int, int] = {}
+        records: list[bytes] = []
+        names: list[tuple[bytes, int]] = []
+
+        for name, unit in registry.units.items():
+            index = indexes.get(id(unit))
+            if index is None:
+                index = indexes[id(unit)] = len(records)
+                records.append(json.dumps((list(unit.units.items()),
+                                           unit.factor.as_integer_ratio(),
+                                           unit.offset.as_integer_ratio(),
+                                           list(unit.dimension.items()),
+                                           unit.symbols,
+                                           unit.aliases,
+                                           unit.prefixes),
+                                          ensure_ascii=False, separators=(",", ":"),
+                                          default=encode_fraction).encode("utf-8"))
+
+            names.append((name.encode("utf-8"), index))
+
+        names.sort()
+
+        names_offset = _header.size
+        records_offset = names_offset + len(names) * _name_entry.size
+        data_offset = records_offset + len(records) * _record_entry.size
+
+        name_table = bytearray()
+        for name, index in names:
+            name_table += _name_entry.pack(data_offset, len(name), index)
+            data_offset += len(name)
+
+        record_table = bytearray()
+        for record in records:
+            record_table += _record_entry.pack(data_offset, len(record))
+            data_offset += len(record)
+
+        header = _header.pack(_magic, SHARED_VERSION, digest.encode("ascii"),
+                              len(names), names_offset, len(records), records_offset)
+
+        filename = Path(filename)
+        try:
+            filename.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_open(filename) as fp:
+                fp.write(header)
+                fp.write(name_table)
+                fp.write(record_table)
+                for name, _ in names:
+                    fp.write(name)
+                for record in records:
+                    fp.write(record)
+        except OSError as e:
+            raise ConverterError(f"Failed to save shared registry {filename}", e.strerror)
+
+    def load_all(self) -> None:
+        """ Load every unit from the shared file into this process. """
+        for position in range(self._name_count):
+            offset, length, index = _name_entry.unpack_from(
+                self._map, self._names_offset + position * _name_entry.size)
+            name = self._map[offset:offset + length].decode("utf-8")
+            self.units.setdefault(name, self._load_record(index))
+
+    def _load_dimension(self, dimension: Dimension | None, tables: RegistryTables) -> None:
+        """ The dimensions of the shared units aren't indexed, every unit is loaded. """
+        self.load_all()
+
+    def names(self) -> list[str]:
+        """ Get a list of every unit name, symbol, and alias in the shared registry.
+            Prefixed names aren't included.
+        """
+        names = []
+        for position in range(self._name_count):
+            offset, length, _ = _name_entry.unpack_from(
+                self._map, self._names_offset + position * _name_entry.size)
+            names.append(self._map[offset:offset + length].decode("utf-8"))
+
+        return names
+
+    def add_unit(self, unit: Unit) -> None:
+        raise ConverterError("Cannot add units to a shared registry (it's read-only)")
+
+    def add_alias(self, unit: Unit, alias: str) -> None:
+        raise ConverterError("Cannot add units to a shared registry (it's read-only)")
+
+    def add_loader(self,
+                   names: list[str],
+                   loader: Callable[[], None],
+                   dimension: Dimension | None = None
+                   ) -> None:
+        raise ConverterError("Cannot add units to a shared registry (it's read-only)")
+
+    def swap(self, registry: Registry) -> None:
+        raise ConverterError("Cannot add units to a shared registry (it's read-only)")
+
+    def clear(self) -> None:
+        """ Clear the units loaded by this process. The shared file is unchanged. """
+        super().clear()
+        self._records.clear()
+
+    def close(self) -> None:
+        """ Detach from the shared registry file. """
+        self.clear()
+        self._map.close()
+
+    def _get_names(self) -> list[str]:
+        return self.names()
+
+    def _get_prefixable(self) -> list[tuple[str, str, str]]:
+        """ Get the names that can be prefixed. Every unit is loaded the first time. """
+        if self._prefixable is None:
+            prefixable = []
+            for name in self.names():
+                entry = self._find_prefixable(name, self._tables)
+                if entry is not None:
+                    prefixable.append((name, entry[0].prefixes, entry[1]))
+
+            self._prefixable = prefixable
+
+        return self._prefixable
+
+    def _load_unit(self, name: str, tables: RegistryTables) -> Unit | None:
+        """ Load a unit from the shared file. Returns None if the name isn't defined. """
+        index = self._search(name)
+        if index is None:
+            return None
+
+        unit = tables.units[name] = self._load_record(index)
+        return unit
+
+    def _find_prefixable(self, name: str, tables: RegistryTables) -> tuple[Unit, str] | None:
+        """ Get the unit for a name that can be prefixed, and whether it's a name or symbol. """
+        unit = tables.units.get(name)
+        if unit is None:
+            unit = self._load_unit(name, tables)
+
+        if unit is None or not get_prefixes(unit.prefixes):
+            return None
+
+        if name in unit.symbols:
+            return unit, "symbol"
+
+        if name == unit.name or name in unit.aliases:
+            return unit, "name"
+
+        return None
+
+    def _search(self, name: str) -> int | None:
+        """ Binary search the name table. Returns the record index or None. """
+        key = name.encode("utf-8")
+        low, high = 0, self._name_count
+
+        while low < high:
+            middle = (low + high) // 2
+            offset, length, index = _name_entry.unpack_from(
+                self._map, self._names_offset + middle * _name_entry.size)
+
+            current = self._map[offset:offset + length]
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                return index
+
+        return None
+
+    def _load_record(self, index: int) -> Unit:
+        """ Create the unit for a record. Names of the same unit share one instance. """
+        unit = self._records.get(index)
+        if unit is None:
+            offset, length = _record_entry.unpack_from(
+                self._map, self._records_offset + index * _record_entry.size)
+
+            # Records are plain json (never code), other processes can write the file
+            try:
+                units, factor, unit_offset, dimension, symbols, aliases, prefixes = \
+                    json.loads(self._map[offset:offset + length], object_hook=decode_fraction)
+            except (ValueError, TypeError) as e:
+                raise ConverterError(f"{self.filename} is not a valid shared registry", str(e))
+
+            unit = self._records[index] = Unit(dict(units), Fraction(*factor),
+                                               Dimension(dict(dimension)), symbols,
+                                               aliases, prefixes, Fraction(*unit_offset))
+            self._index_unit(unit, self._tables)
+
+        return unit
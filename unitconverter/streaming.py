@@ -0,0 +1,189 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import csv
+import json
+
+from collections.abc import Callable, Iterable, Iterator
+from fractions import Fraction
+from typing import IO, Any
+
+from unitconverter.converter import UnitConverter
+from unitconverter.exceptions import ConverterError
+from unitconverter.formatting import format_quantity
+from unitconverter.utils import parse_fraction
+
+
+# Supported file formats and their csv delimiters
+FORMATS = {
+    "csv": ",",
+    "tsv": "\t",
+    "jsonl": None,
+}
+
+
+def parse_column(column: str) -> tuple[str, str, str]:
+    """ Parse a column specification ("name:source:target") into a 3-tuple. """
+    try:
+        name, source, target = column.rsplit(":", 2)
+    except ValueError:
+        raise ConverterError(f"{column!r} is not a valid column (expected name:source:target)") \
+            from None
+
+    if not name or not source or not target:
+        raise ConverterError(f"{column!r} is not a valid column (expected name:source:target)")
+
+    return name, source, target
+
+
+def guess_format(filename: str, default: str = "csv") -> str:
+    """ Guess the file format from a file extension. """
+    extension = filename.rpartition(".")[2].lower()
+    if extension in FORMATS:
+        return extension
+    elif extension == "ndjson":
+        return "jsonl"
+
+    return default
+
+
+def read_rows(fp: IO[str], fmt: str = "csv") -> tuple[list[str] | None, Iterator[dict]]:
+    """ Read rows from a csv, tsv, or jsonl file.
+
+    Returns
+    -------
+    tuple[list[str] | None, Iterator[dict]]
+        The csv field names (None for jsonl) and an iterator of rows
+    """
+    if fmt not in FORMATS:
+        raise ConverterError(f"{fmt!r} is not a supported format")
+
+    if fmt == "jsonl":
+        return None, _read_jsonl(fp)
+
+    reader = csv.DictReader(fp, delimiter=FORMATS[fmt])
+    return list(reader.fieldnames or []), iter(reader)
+
+
+def write_rows(rows: Iterable[dict],
+               fp: IO[str],
+               fmt: str = "csv",
+               fieldnames: list[str] | None = None,
+               header: bool = True
+               ) -> int:
+    """ Write rows to a csv, tsv, or jsonl file. Returns the number of rows written.
+        The csv header is skipped if header is False.
+    """
+    if fmt not in FORMATS:
+        raise ConverterError(f"{fmt!r} is not a supported format")
+
+    count = 0
+    if fmt == "jsonl":
+        for count, row in enumerate(rows, 1):
+            fp.write(json.dumps(row, ensure_ascii=False))
+            fp.write("\n")
+        return count
+
+    writer = csv.DictWriter(fp, fieldnames or [], delimiter=FORMATS[fmt], lineterminator="\n")
+    if header:
+        writer.writeheader()
+
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+
+    return count
+
+
+def convert_rows(rows: Iterable[dict],
+                 converter: UnitConverter,
+                 columns: list[tuple[str, str, str]],
+                 formatter: Callable[[Fraction], str] = format_quantity
+                 ) -> Iterator[dict]:
+    """ Convert the specified columns of each row. Rows are converted one at a time.
+
+    Parameters
+    ----------
+    rows : Iterable[dict]
+        An iterable of rows
+
+    converter : UnitConverter
+        The unit converter
+
+    columns : list[tuple[str, str, str]]
+        A list of (name, source, target) column tuples
+
+    formatter : Callable[[Fraction], str], optional
+        Function used to format the converted quantities, by default format_quantity
+
+    Yields
+    ------
+    dict
+        The converted rows. Empty and missing values are left as is.
+    """
+
+    # Resolve each unit pair once
+    conversions = [(name, converter.get_conversion(source, target))
+                   for name, source, target in columns]
+
+    for number, row in enumerate(rows, 1):
+        for name, conversion in conversions:
+            value = row.get(name)
+            if value is None or value == "":
+                continue
+
+            try:
+                row[name] = formatter(conversion.convert(parse_quantity(value)))
+            except (TypeError, ValueError, ZeroDivisionError):
+                raise ConverterError(f"Invalid value {value!r} in column {name!r}",
+                                     f"row {number}") from None
+
+        yield row
+
+
+def stream_convert(input_fp: IO[str],
+                   output_fp: IO[str],
+                   converter: UnitConverter,
+                   columns: list[tuple[str, str, str]],
+                   fmt: str = "csv",
+                   formatter: Callable[[Fraction], str] = format_quantity
+                   ) -> int:
+    """ Convert columns from an input file and write the results to an output file.
+        Only one row is held in memory at a time. Returns the number of rows written.
+    """
+    fieldnames, rows = read_rows(input_fp, fmt)
+
+    if fieldnames is not None:
+        for name, _, _ in columns:
+            if name not in fieldnames:
+                raise ConverterError(f"Column {name!r} not found in input")
+
+    rows = convert_rows(rows, converter, columns, formatter)
+    return write_rows(rows, output_fp, fmt, fieldnames)
+
+
+def parse_quantity(value: Any) -> Fraction:
+    """ Parse a csv or json value into a Fraction. Floats are parsed from their
+        shortest string representation (i.e 98.6 becomes 493/5).
+    """
+    if isinstance(value, float):
+        value = repr(value)
+
+    return parse_fraction(value.strip() if isinstance(value, str) else value)
+
+
+def _read_jsonl(fp: IO[str]) -> Iterator[dict]:
+    """ Read rows from a jsonl file. Blank lines are skipped. """
+    for number, line in enumerate(fp, 1):
+        if not line.strip():
+            continue
+
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ConverterError("Invalid json syntax", f"{e.msg}: line {number}") from None
+
+        if not isinstance(row, dict):
+            raise ConverterError("Invalid json row (expected an object)", f"line {number}")
+
+        yield row
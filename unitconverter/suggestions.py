@@ -0,0 +1,111 @@
+# Copyright (c) 2022-2025 Mike Cunningham
+# https://www.github.com/emetophobe/unitconverter
+
+
+import heapq
+
+from collections.abc import Iterable
+from difflib import SequenceMatcher
+
+
+class SuggestionIndex:
+    """ A trigram index of unit names, used to suggest names for misspelled units.
+
+    Every name is split into lowercase trigrams (padded with spaces so the start and
+    end of a name count). A search only looks at names that share a trigram with the
+    misspelled name, and ranks them by the number of shared trigrams. The best
+    candidates are then scored with difflib, so a search never compares every name.
+    """
+
+    def __init__(self, names: Iterable[str]) -> None:
+        """ Create a suggestion index.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            The unit names, symbols, and aliases
+        """
+        self.names: list[str] = list(dict.fromkeys(names))
+        self._sizes: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+
+        for index, name in enumerate(self.names):
+            trigrams = get_trigrams(name)
+            self._sizes.append(len(trigrams))
+            for trigram in trigrams:
+                postings = self._postings.get(trigram)
+                if postings is None:
+                    self._postings[trigram] = [index]
+                else:
+                    postings.append(index)
+
+    def search(self,
+               name: str,
+               limit: int = 5,
+               cutoff: float = 0.6
+               ) -> list[tuple[float, str]]:
+        """ Find the names that are most similar to a name.
+
+        Parameters
+        ----------
+        name : str
+            The misspelled name
+
+        limit : int, optional
+            Maximum number of results, by default 5
+
+        cutoff : float, optional
+            Minimum similarity between 0 and 1, by default 0.6
+
+        Returns
+        -------
+        list[tuple[float, str]]
+            A list of (similarity, name) tuples, most similar first
+        """
+        return score(name, self.candidates(name, limit * 4), limit, cutoff)
+
+    def candidates(self, name: str, count: int) -> list[str]:
+        """ Get the names that share the most trigrams with a name (relative to
+            the length of both names), without scoring them.
+        """
+        trigrams = get_trigrams(name)
+        counts: dict[int, int] = {}
+        for trigram in trigrams:
+            for index in self._postings.get(trigram, ()):
+                counts[index] = counts.get(index, 0) + 1
+
+        # Rank the candidates by the dice coefficient of their trigrams
+        size = len(trigrams)
+        sizes = self._sizes
+        best = heapq.nlargest(count, counts.items(),
+                              key=lambda item: item[1] / (size + sizes[item[0]]))
+
+        return [self.names[index] for index, _ in best]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def score(name: str,
+          candidates: Iterable[str],
+          limit: int = 5,
+          cutoff: float = 0.6
+          ) -> list[tuple[float, str]]:
+    """ Score candidate names by their similarity to a name, most similar first. """
+    matcher = SequenceMatcher(b=name, autojunk=False)
+    results = []
+    for candidate in candidates:
+        matcher.set_seq1(candidate)
+        if matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff:
+            ratio = matcher.ratio()
+            if ratio >= cutoff:
+                results.append((ratio, candidate))
+
+    results.sort(key=lambda result: (-result[0], result[1]))
+    return results[:limit]
+
+
+def get_trigrams(name: str) -> set[str]:
+    """ Get the set of lowercase trigrams of a name. """
+    padded = f"  {name.casefold()} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
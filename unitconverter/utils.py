@@ -2,7 +2,16 @@
 # https://www.github.com/emetophobe/unitconverter
 
 
+import os
+import tempfile
+
+from collections.abc import Iterator
+from contextlib import contextmanager
 from fractions import Fraction
+from pathlib import Path
+from typing import IO, Any
+
+from unitconverter.exceptions import ConverterError
 
 
 def parse_fraction(value: Fraction | str | int) -> Fraction:
@@ -17,3 +26,102 @@ def parse_fraction(value: Fraction | str | int) -> Fraction:
         return Fraction(value)
     except (TypeError, ValueError):
         raise TypeError(f"{value!r} is not a numeric value")
+
+
+def parse_float(value: float | Fraction | str | int) -> float:
+    """ Parse value and return a float. Strings can also be fractions (i.e "1/3"). """
+    if isinstance(value, float):
+        return value
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+
+    return float(parse_fraction(value))
+
+
+def import_numpy():
+    """ Import and return numpy. Raises a ConverterError if numpy isn't installed. """
+    try:
+        import numpy
+    except ImportError:
+        raise ConverterError("numpy is required for array conversions") from None
+
+    return numpy
+
+
+@contextmanager
+def atomic_open(filename: Path | str) -> Iterator[IO[bytes]]:
+    """ Open a unique temporary file in the same directory as filename for writing,
+        and replace filename with it once the block succeeds. The temporary file is
+        removed if the block fails, so concurrent writers never see a partial file.
+    """
+    filename = Path(filename)
+    fd, temp = tempfile.mkstemp(prefix=f"{filename.name}.", suffix=".tmp", dir=filename.parent)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            yield fp
+
+        os.chmod(temp, 0o644)
+        os.replace(temp, filename)
+    except BaseException:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
+
+
+def encode_fraction(value: Any) -> dict:
+    """ Encode fractions (i.e fractional exponents) as json objects (use as json default). """
+    if isinstance(value, Fraction):
+        return {"fraction": value.as_integer_ratio()}
+
+    raise TypeError(f"{value!r} is not json serializable")
+
+
+def decode_fraction(obj: dict) -> Any:
+    """ Decode fractions stored by encode_fraction (use as json object_hook). """
+    if len(obj) == 1 and isinstance(obj.get("fraction"), list):
+        return Fraction(*obj["fraction"])
+
+    return obj
+
+
+def power_fraction(value: Fraction, exponent: Fraction | int) -> Fraction:
+    """ Raise value to an integer or fractional exponent.
+        Raises a ValueError if the result can't be represented as a fraction.
+    """
+    exponent = Fraction(exponent)
+    value = value ** exponent.numerator
+
+    if exponent.denominator == 1:
+        return value
+
+    if value < 0 and exponent.denominator % 2 == 0:
+        raise ValueError(f"{value} has no real root {exponent.denominator}")
+
+    numerator = _integer_root(abs(value.numerator), exponent.denominator)
+    denominator = _integer_root(value.denominator, exponent.denominator)
+
+    if numerator is None or denominator is None:
+        raise ValueError(f"{value} ** (1/{exponent.denominator}) is not a rational number")
+
+    return Fraction(numerator if value >= 0 else -numerator, denominator)
+
+
+def _integer_root(value: int, n: int) -> int | None:
+    """ Get the exact integer nth root of value, or None if there isn't one. """
+    if value < 2:
+        return value
+
+    # Newton's method using integers only
+    root = 1 << -(-value.bit_length() // n)
+    while True:
+        estimate = ((n - 1) * root + value // root ** (n - 1)) // n
+        if estimate >= root:
+            break
+        root = estimate
+
+    return root if root ** n == value else None